@@ -1,22 +1,22 @@
+from _decimal import Decimal
 from dataclasses import dataclass, field
 from uuid import UUID
 
-from _decimal import Decimal
-
 from business_contexts.domain.aggregates.bank_transaction import Transaction
+from business_contexts.domain.business_rules.bank_transaction import (
+    get_local_time,
+)
+from business_contexts.domain.entities.bank_transaction import (
+    CreateBankTransaction,
+)
+from business_contexts.domain.events import AccountCreated
 from business_contexts.domain.exceptions import (
     InsufficientBalanceForTransaction,
 )
 from business_contexts.domain.value_objects.bank_transaction import (
     TransactionType,
 )
-from business_contexts.domain.entities.bank_transaction import (
-    CreateBankTransaction,
-)
-from business_contexts.domain.business_rules.bank_transaction import (
-    get_local_time,
-)
-from business_contexts.utils.base_types import AccountNumber, CPF
+from business_contexts.utils.base_types import CPF, AccountNumber
 from libs.ddd.domain.aggregate import Aggregate
 
 
@@ -29,15 +29,38 @@ class Account(Aggregate):
     client_cpf: CPF | str
     id: UUID | None = None
     transactions: list[Transaction] = field(default_factory=list)
+    balance_slots: int = 0
+    version: int = 0
 
     @classmethod
     def return_aggregate_for_creation(
-        cls, account_number: AccountNumber, balance: Decimal, client_cpf: CPF
+        cls,
+        account_number: AccountNumber,
+        balance: Decimal,
+        client_cpf: CPF,
+        balance_slots: int = 0,
     ) -> "Account":
         """Retorna uma instância do agregado Account preparada para cadastro."""
-        return Account(
-            account_number=account_number, balance=balance, client_cpf=client_cpf
+        account = Account(
+            account_number=account_number,
+            balance=balance,
+            client_cpf=client_cpf,
+            balance_slots=balance_slots,
         )
+        account.record_event(
+            AccountCreated(
+                account_number=account_number,
+                client_cpf=client_cpf,
+                balance=balance,
+                balance_slots=balance_slots,
+            )
+        )
+        return account
+
+    @property
+    def is_striped(self) -> bool:
+        """Indica se o saldo da conta é particionado em parcelas (slots)."""
+        return self.balance_slots > 0
 
     @staticmethod
     def _validate_operation_amount(amount: Decimal) -> None:
@@ -103,14 +126,26 @@ class Account(Aggregate):
             date=get_local_time(),
         )
 
+    def receive_transfer(self, amount: Decimal) -> None:
+        """Credita na conta o valor de uma transferência recebida."""
+        self._validate_operation_amount(amount)
+        self.balance += amount
+
     def create(self) -> None:
         """Executa a lógica de criação da conta."""
         ...
 
-    def update(self, account_number: AccountNumber, client_cpf: CPF) -> None:
+    def update(
+        self,
+        account_number: AccountNumber,
+        client_cpf: CPF,
+        balance_slots: int | None = None,
+    ) -> None:
         """Atualiza os dados da conta bancária."""
         self.account_number = account_number
         self.client_cpf = client_cpf
+        if balance_slots is not None:
+            self.balance_slots = balance_slots
 
     def remove(self) -> None:
         """Executa a lógica de remoção da conta."""
@@ -3,6 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
+from business_contexts.domain.events import TransactionPosted
 from business_contexts.domain.value_objects.bank_transaction import (
     TransactionType,
 )
@@ -20,6 +21,8 @@ class Transaction(Aggregate):
     account_number: AccountNumber
     destination_account_number: AccountNumber | None = None
     id: UUID | None = None
+    balance_after: Decimal | None = None
+    destination_balance_after: Decimal | None = None
 
     @classmethod
     def return_aggregate_for_creation(
@@ -31,13 +34,23 @@ class Transaction(Aggregate):
         destination_account_number: AccountNumber | None = None,
     ) -> "Transaction":
         """Retorna uma instância do agregado Transaction preparada para cadastro."""
-        return Transaction(
+        transaction = Transaction(
             type=type,
             amount=amount,
             date=date,
             account_number=account_number,
             destination_account_number=destination_account_number,
         )
+        transaction.record_event(
+            TransactionPosted(
+                type=type,
+                amount=amount,
+                date=date,
+                account_number=account_number,
+                destination_account_number=destination_account_number,
+            )
+        )
+        return transaction
 
     def create(self) -> None:
         """Executa a lógica de criação da transação."""
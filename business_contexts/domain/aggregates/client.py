@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from business_contexts.domain.events import ClientUpdated
 from business_contexts.utils.base_types import CPF
 from libs.ddd.domain.aggregate import Aggregate
 
@@ -26,6 +27,7 @@ class Client(Aggregate):
         """Atualiza os dados do cliente."""
         self.name = name
         self.cpf = cpf
+        self.record_event(ClientUpdated(name=name, cpf=cpf))
 
     def remove(self) -> None:
         """Executa a lógica de remoção do cliente."""
@@ -1,8 +1,68 @@
-from datetime import datetime
+from collections.abc import Iterable, Sequence
+from datetime import date, datetime
+from decimal import Decimal
 
 import pytz
 
+from business_contexts.domain.value_objects.bank_account import DailyRollup
+from business_contexts.domain.value_objects.bank_transaction import TransactionType
+
 
 def get_local_time() -> datetime:
     """Retorna a data e hora atual no fuso horário de São Paulo (America/Sao_Paulo)."""
     return datetime.now(pytz.timezone("America/Sao_Paulo"))
+
+
+def build_daily_rollups(
+    transactions: Iterable[tuple[str, str | None, str, Decimal, date]],
+) -> list[DailyRollup]:
+    """
+    Agrega as transações (conta de origem, conta de destino, tipo, valor e dia) nos
+    totais diários de cada conta por tipo: depósitos são créditos da conta de origem,
+    saques e transferências são débitos dela, e transferências também são créditos
+    da conta de destino. Os totais são retornados em ordem de conta, dia e tipo.
+    """
+    rollups: dict[tuple[str, date, str], DailyRollup] = {}
+
+    def add_leg(
+        account_number: str, day: date, type: str, credit: Decimal, debit: Decimal
+    ) -> None:
+        rollup = rollups.setdefault(
+            (account_number, day, type), DailyRollup(account_number, day, type)
+        )
+        rollup.count += 1
+        rollup.credits += credit
+        rollup.debits += debit
+
+    for account_number, destination_account_number, type, amount, day in transactions:
+        if type == TransactionType.DEPOSIT.value:
+            add_leg(account_number, day, type, amount, Decimal(0))
+        else:
+            add_leg(account_number, day, type, Decimal(0), amount)
+        if type == TransactionType.TRANSFER.value and destination_account_number:
+            add_leg(destination_account_number, day, type, amount, Decimal(0))
+
+    return [rollups[key] for key in sorted(rollups)]
+
+
+def take_contiguous_transactions[T: Sequence](
+    transactions: Sequence[T], after_sequence: int, skip_leading_gap: bool = False
+) -> list[T]:
+    """
+    Retorna o prefixo das transações, em ordem de lançamento (o primeiro item de cada
+    uma), sem lacunas a partir de after_sequence. Uma lacuna pode ser uma transação
+    ainda não confirmada, que ficaria de fora se a projeção avançasse sobre ela; com
+    skip_leading_gap, a lacuna logo após after_sequence é tratada como transação
+    desfeita e ignorada.
+    """
+    contiguous: list[T] = []
+    expected_sequence = after_sequence + 1
+    for transaction in transactions:
+        if transaction[0] != expected_sequence and not (
+            skip_leading_gap and not contiguous
+        ):
+            break
+        contiguous.append(transaction)
+        expected_sequence = transaction[0] + 1
+
+    return contiguous
@@ -1,12 +1,18 @@
 from dataclasses import dataclass
+from datetime import date, datetime
 from decimal import Decimal
 
-from pydantic import BaseModel, UUID4, field_validator
+from fastapi import HTTPException
+from pydantic import UUID4, BaseModel, Field, field_validator
 
-from business_contexts.domain.aggregates.bank_transaction import Transaction
+from business_contexts.domain.aggregates.bank_account import Account
 from business_contexts.domain.entities.bank_transaction import (
     ReadBankTransaction,
+    TransactionEntity,
 )
+from business_contexts.domain.value_objects.bank_transaction import TransactionType
+from business_contexts.utils.base_types import SummaryPeriod
+from business_contexts.utils.constants import MAX_BALANCE_SLOTS
 
 
 class CreateBankAccount(BaseModel):
@@ -15,6 +21,7 @@ class CreateBankAccount(BaseModel):
     account_number: str
     balance: Decimal
     client_cpf: str
+    balance_slots: int = Field(default=0, ge=0, le=MAX_BALANCE_SLOTS)
 
     @field_validator("balance", mode="before")
     def format_balance(cls, v: Decimal | str | float) -> Decimal:
@@ -27,6 +34,7 @@ class UpdateBankAccount(BaseModel):
 
     account_number: str
     client_cpf: str
+    balance_slots: int | None = Field(default=None, ge=0, le=MAX_BALANCE_SLOTS)
 
     _old_account_number: UUID4 | None = None
 
@@ -38,6 +46,7 @@ class ReadBankAccount(BaseModel):
     account_number: str
     balance: Decimal
     client_cpf: str
+    balance_slots: int = 0
     transactions: list[ReadBankTransaction]
 
     @field_validator("balance", mode="before")
@@ -53,9 +62,111 @@ class ReadBankAccount(BaseModel):
             account_number=account.account_number,
             balance=account.balance,
             client_cpf=account.client_cpf,
+            balance_slots=account.balance_slots,
         )
 
 
+class ReadBankAccountBatchItem(BaseModel):
+    """Modelo de saída com o resultado de um item de um lote de contas bancárias."""
+
+    index: int
+    status_code: int
+    account: ReadBankAccount | None = None
+    error_code: str | None = None
+    detail: str | None = None
+
+    @staticmethod
+    def from_result(
+        index: int, result: Account | HTTPException
+    ) -> "ReadBankAccountBatchItem":
+        """Cria o resultado do item a partir da conta criada ou do erro obtido."""
+        if isinstance(result, HTTPException):
+            return ReadBankAccountBatchItem(
+                index=index,
+                status_code=result.status_code,
+                error_code=type(result).__name__,
+                detail=result.detail,
+            )
+
+        return ReadBankAccountBatchItem(
+            index=index,
+            status_code=200,
+            account=ReadBankAccount(
+                id=result.id,
+                account_number=result.account_number,
+                balance=result.balance,
+                client_cpf=result.client_cpf,
+                balance_slots=result.balance_slots,
+                transactions=[],
+            ),
+        )
+
+
+class ReadStatementEntry(BaseModel):
+    """
+    Modelo de saída de um lançamento do extrato: o valor é negativo para débitos
+    (saques e transferências enviadas) e o saldo é o da conta logo após o lançamento.
+    """
+
+    id: UUID4
+    type: TransactionType
+    amount: Decimal
+    date: datetime
+    account_number: str
+    destination_account_number: str | None = None
+    balance: Decimal
+
+    @field_validator("amount", "balance", mode="before")
+    def format_amount(cls, v: Decimal | str | float) -> Decimal:
+        """Formata o valor e o saldo com duas casas decimais."""
+        return Decimal(v).quantize(Decimal("0.00"))
+
+
+class ReadAccountStatement(BaseModel):
+    """Modelo de saída do extrato de uma conta bancária em um período."""
+
+    account_number: str
+    start_date: datetime | None = None
+    end_date: datetime | None = None
+    opening_balance: Decimal
+    closing_balance: Decimal
+    entries: list[ReadStatementEntry]
+
+    @field_validator("opening_balance", "closing_balance", mode="before")
+    def format_balance(cls, v: Decimal | str | float) -> Decimal:
+        """Formata os saldos com duas casas decimais."""
+        return Decimal(v).quantize(Decimal("0.00"))
+
+
+class ReadSummaryEntry(BaseModel):
+    """
+    Modelo de saída dos totais de um tipo de transação em um dia ou mês do resumo:
+    a quantidade de lançamentos, os créditos, os débitos e o saldo líquido.
+    """
+
+    period_start: date
+    type: TransactionType
+    count: int
+    credits: Decimal
+    debits: Decimal
+    net: Decimal
+
+    @field_validator("credits", "debits", "net", mode="before")
+    def format_amount(cls, v: Decimal | str | float) -> Decimal:
+        """Formata os totais com duas casas decimais."""
+        return Decimal(v).quantize(Decimal("0.00"))
+
+
+class ReadAccountSummary(BaseModel):
+    """Modelo de saída do resumo diário ou mensal da movimentação de uma conta."""
+
+    account_number: str
+    period: SummaryPeriod
+    start_date: date | None = None
+    end_date: date | None = None
+    entries: list[ReadSummaryEntry]
+
+
 @dataclass(frozen=True)
 class AccountEntity:
     """Entidade imutável que representa uma conta bancária consultada do banco de dados."""
@@ -64,4 +175,74 @@ class AccountEntity:
     account_number: str
     balance: Decimal
     client_cpf: str
-    transactions: list[Transaction] | None = None
+    transactions: list[TransactionEntity] | None = None
+    balance_slots: int = 0
+    version: int = 0
+    last_sequence: int = 0
+
+
+@dataclass(frozen=True)
+class AccountVersionEntity:
+    """
+    Entidade imutável com o estado de versão de uma conta: a versão da linha e a ordem
+    de lançamento da sua última transação, que mudam a cada alteração da conta.
+    """
+
+    id: UUID4
+    account_number: str
+    version: int
+    last_sequence: int
+
+
+@dataclass(frozen=True)
+class StatementEntryEntity:
+    """Entidade imutável que representa um lançamento do extrato de uma conta."""
+
+    id: UUID4
+    type: TransactionType
+    amount: Decimal
+    date: datetime
+    account_number: str
+    balance: Decimal
+    destination_account_number: str | None = None
+
+
+@dataclass(frozen=True)
+class AccountStatementEntity:
+    """
+    Entidade imutável que representa o extrato de uma conta no período
+    [start_date, end_date): os saldos de abertura e de fechamento e os lançamentos.
+    """
+
+    account_number: str
+    opening_balance: Decimal
+    closing_balance: Decimal
+    entries: list[StatementEntryEntity]
+    start_date: datetime | None = None
+    end_date: datetime | None = None
+
+
+@dataclass(frozen=True)
+class SummaryEntryEntity:
+    """Entidade imutável que representa os totais de um tipo de transação em um período."""
+
+    period_start: date
+    type: TransactionType
+    count: int
+    credits: Decimal
+    debits: Decimal
+    net: Decimal
+
+
+@dataclass(frozen=True)
+class AccountSummaryEntity:
+    """
+    Entidade imutável que representa o resumo da movimentação de uma conta no
+    período [start_date, end_date), com os totais por dia ou mês e tipo de transação.
+    """
+
+    account_number: str
+    period: SummaryPeriod
+    entries: list[SummaryEntryEntity]
+    start_date: date | None = None
+    end_date: date | None = None
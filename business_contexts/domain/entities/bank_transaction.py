@@ -3,7 +3,8 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, UUID4, field_validator
+from fastapi import HTTPException
+from pydantic import UUID4, BaseModel, field_validator
 
 from business_contexts.domain.aggregates.bank_transaction import Transaction
 from business_contexts.domain.value_objects.bank_transaction import (
@@ -54,6 +55,35 @@ class ReadBankTransaction(BaseModel):
         )
 
 
+class ReadBankTransactionBatchItem(BaseModel):
+    """Modelo de saída com o resultado de um item de um lote de transações."""
+
+    index: int
+    status_code: int
+    transaction: ReadBankTransaction | None = None
+    error_code: str | None = None
+    detail: str | None = None
+
+    @staticmethod
+    def from_result(
+        index: int, result: Transaction | HTTPException
+    ) -> "ReadBankTransactionBatchItem":
+        """Cria o resultado do item a partir da transação criada ou do erro obtido."""
+        if isinstance(result, HTTPException):
+            return ReadBankTransactionBatchItem(
+                index=index,
+                status_code=result.status_code,
+                error_code=type(result).__name__,
+                detail=result.detail,
+            )
+
+        return ReadBankTransactionBatchItem(
+            index=index,
+            status_code=200,
+            transaction=ReadBankTransaction.from_transaction(result),
+        )
+
+
 @dataclass(frozen=True)
 class TransactionEntity:
     """Entidade imutável que representa uma transação consultada do banco de dados."""
@@ -64,3 +94,5 @@ class TransactionEntity:
     account_number: AccountNumber
     id: UUID | None = None
     destination_account_number: AccountNumber | None = None
+    balance_after: Decimal | None = None
+    destination_balance_after: Decimal | None = None
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 
-from pydantic import BaseModel, UUID4
+from fastapi import HTTPException
+from pydantic import UUID4, BaseModel
+
+from business_contexts.domain.aggregates.client import Client
 
 
 class CreateClient(BaseModel):
@@ -26,6 +29,35 @@ class ReadClient(BaseModel):
     cpf: str
 
 
+class ReadClientBatchItem(BaseModel):
+    """Modelo de saída com o resultado de um item de um lote de clientes."""
+
+    index: int
+    status_code: int
+    client: ReadClient | None = None
+    error_code: str | None = None
+    detail: str | None = None
+
+    @staticmethod
+    def from_result(
+        index: int, result: Client | HTTPException
+    ) -> "ReadClientBatchItem":
+        """Cria o resultado do item a partir do cliente criado ou do erro obtido."""
+        if isinstance(result, HTTPException):
+            return ReadClientBatchItem(
+                index=index,
+                status_code=result.status_code,
+                error_code=type(result).__name__,
+                detail=result.detail,
+            )
+
+        return ReadClientBatchItem(
+            index=index,
+            status_code=200,
+            client=ReadClient(id=result.id, name=result.name, cpf=result.cpf),
+        )
+
+
 @dataclass(frozen=True)
 class ClientEntity:
     """Entidade imutável que representa um cliente consultado do banco de dados."""
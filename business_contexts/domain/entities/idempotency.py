@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class IdempotencyRecordEntity:
+    """Entidade imutável que representa um registro de idempotência consultado do banco de dados."""
+
+    user_id: UUID
+    key: str
+    request_hash: str
+    response: str
+    created_at: datetime
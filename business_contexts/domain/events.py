@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+from business_contexts.domain.value_objects.bank_transaction import TransactionType
+from libs.ddd.domain.event import DomainEvent
+
+# --- Client Events ---
+
+
+@dataclass(frozen=True)
+class ClientUpdated(DomainEvent):
+    """Evento registrado quando os dados de um cliente são atualizados."""
+
+    name: str
+    cpf: str
+
+
+# --- Bank Account Events ---
+
+
+@dataclass(frozen=True)
+class AccountCreated(DomainEvent):
+    """Evento registrado quando uma conta bancária é cadastrada."""
+
+    account_number: str
+    client_cpf: str
+    balance: Decimal
+    balance_slots: int
+
+
+# --- Bank Transaction Events ---
+
+
+@dataclass(frozen=True)
+class TransactionPosted(DomainEvent):
+    """Evento registrado quando uma transação bancária é lançada."""
+
+    type: TransactionType
+    amount: Decimal
+    date: datetime
+    account_number: str
+    destination_account_number: str | None
@@ -1,7 +1,6 @@
 from dataclasses import dataclass
 
-from fastapi import status, HTTPException
-
+from fastapi import HTTPException, status
 
 # --- Client Exceptions ---
 
@@ -22,6 +21,22 @@ class ClientAlreadyRegistered(HTTPException):
     status_code: int = status.HTTP_409_CONFLICT
 
 
+@dataclass
+class InvalidClientCPF(HTTPException):
+    """Exceção lançada quando o CPF do cliente é inválido."""
+
+    detail: str = "CPF inválido"
+    status_code: int = status.HTTP_400_BAD_REQUEST
+
+
+@dataclass
+class ClientBatchTooLarge(HTTPException):
+    """Exceção lançada quando o lote de clientes excede o tamanho máximo permitido."""
+
+    detail: str = "Lote de clientes excede o tamanho máximo permitido."
+    status_code: int = status.HTTP_400_BAD_REQUEST
+
+
 @dataclass
 class ErrorRegisteringClient(HTTPException):
     """Exceção lançada quando ocorre erro ao cadastrar cliente."""
@@ -65,6 +80,38 @@ class BankAccountAlreadyRegistered(HTTPException):
     status_code: int = status.HTTP_409_CONFLICT
 
 
+@dataclass
+class NegativeBankAccountBalance(HTTPException):
+    """Exceção lançada quando o saldo inicial da conta é negativo."""
+
+    detail: str = "O saldo da conta não pode ser negativo."
+    status_code: int = status.HTTP_400_BAD_REQUEST
+
+
+@dataclass
+class BankAccountBatchTooLarge(HTTPException):
+    """Exceção lançada quando o lote de contas excede o tamanho máximo permitido."""
+
+    detail: str = "Lote de contas bancárias excede o tamanho máximo permitido."
+    status_code: int = status.HTTP_400_BAD_REQUEST
+
+
+@dataclass
+class InvalidStatementPeriod(HTTPException):
+    """Exceção lançada quando o fim do período do extrato não é posterior ao início."""
+
+    detail: str = "O fim do período do extrato deve ser posterior ao início."
+    status_code: int = status.HTTP_400_BAD_REQUEST
+
+
+@dataclass
+class InvalidSummaryPeriod(HTTPException):
+    """Exceção lançada quando o fim do período do resumo não é posterior ao início."""
+
+    detail: str = "O fim do período do resumo deve ser posterior ao início."
+    status_code: int = status.HTTP_400_BAD_REQUEST
+
+
 @dataclass
 class ErrorRegisteringBankAccount(HTTPException):
     """Exceção lançada quando ocorre erro ao cadastrar conta bancária."""
@@ -167,6 +214,22 @@ class BankTransactionAlreadyRegistered(HTTPException):
     status_code: int = status.HTTP_409_CONFLICT
 
 
+@dataclass
+class IdempotencyKeyReused(HTTPException):
+    """Exceção lançada quando uma chave de idempotência é reutilizada com outra requisição."""
+
+    detail: str = "Chave de idempotência já utilizada com uma requisição diferente."
+    status_code: int = status.HTTP_409_CONFLICT
+
+
+@dataclass
+class IdempotentRequestAlreadyProcessed(HTTPException):
+    """Exceção lançada quando outra requisição com a mesma chave de idempotência já foi confirmada."""
+
+    detail: str = "Requisição com esta chave de idempotência já processada."
+    status_code: int = status.HTTP_409_CONFLICT
+
+
 @dataclass
 class ErrorRegisteringBankTransaction(HTTPException):
     """Exceção lançada quando ocorre erro ao cadastrar transação bancária."""
@@ -199,6 +262,14 @@ class NegativeTransactionAmount(HTTPException):
     status_code: int = status.HTTP_400_BAD_REQUEST
 
 
+@dataclass
+class TransactionBatchTooLarge(HTTPException):
+    """Exceção lançada quando o lote de transações excede o tamanho máximo permitido."""
+
+    detail: str = "Lote de transações excede o tamanho máximo permitido."
+    status_code: int = status.HTTP_400_BAD_REQUEST
+
+
 # --- Security Exceptions ---
 
 
@@ -232,3 +303,14 @@ class ExpiredLogin(HTTPException):
 
     status_code: int = status.HTTP_401_UNAUTHORIZED
     detail: str = "Login expirado. Logue novamente"
+
+
+# --- Pagination Exceptions ---
+
+
+@dataclass
+class InvalidPaginationCursor(HTTPException):
+    """Exceção lançada quando o cursor de paginação é inválido."""
+
+    detail: str = "Cursor de paginação inválido."
+    status_code: int = status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+
+
+@dataclass
+class BalanceSlot:
+    """Objeto de valor que representa uma parcela (slot) do saldo de uma conta particionada."""
+
+    account_number: str
+    slot: int
+    balance: Decimal
+
+
+@dataclass
+class BalanceSnapshot:
+    """
+    Objeto de valor que representa um ponto de verificação do saldo de uma conta no
+    modo razão (ledger): a soma das movimentações lançadas no razão até a sequência
+    informada, inclusive.
+    """
+
+    account_number: str
+    sequence: int
+    ledger_balance: Decimal
+    taken_at: datetime | None = None
+
+
+@dataclass
+class DailyRollup:
+    """
+    Objeto de valor com os totais diários dos lançamentos de uma conta por tipo de
+    transação: a quantidade de lançamentos e a soma dos créditos e dos débitos.
+    """
+
+    account_number: str
+    day: date
+    type: str
+    count: int = 0
+    credits: Decimal = Decimal(0)
+    debits: Decimal = Decimal(0)
+
+    @property
+    def net(self) -> Decimal:
+        """Saldo líquido do dia: créditos menos débitos."""
+        return self.credits - self.debits
+
+
+@dataclass
+class RollupWatermark:
+    """
+    Objeto de valor com o progresso da projeção dos totais diários: a ordem de
+    lançamento (sequence) até a qual as transações já foram agregadas e o momento em
+    que a projeção encontrou, logo após ela, uma lacuna ainda não preenchida.
+    """
+
+    name: str
+    sequence: int = 0
+    gap_detected_at: datetime | None = None
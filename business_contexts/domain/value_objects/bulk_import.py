@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+
+class ImportKind(Enum):
+    """Tipos de registros aceitos pela importação em massa."""
+
+    CLIENTS = "clients"
+    ACCOUNTS = "accounts"
+    TRANSACTIONS = "transactions"
+
+
+@dataclass
+class ImportCheckpoint:
+    """
+    Objeto de valor que registra o progresso de uma importação em massa: a última
+    linha do arquivo de origem já processada e os totais importados e rejeitados.
+    """
+
+    source: str
+    kind: str
+    line: int
+    imported: int = 0
+    rejected: int = 0
+    updated_at: datetime | None = None
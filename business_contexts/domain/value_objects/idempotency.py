@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass
+class IdempotencyRecord:
+    """
+    Objeto de valor que registra a resposta de uma requisição identificada por uma chave
+    de idempotência; as chaves são individuais de cada usuário.
+    """
+
+    user_id: UUID
+    key: str
+    request_hash: str
+    response: str
+    created_at: datetime
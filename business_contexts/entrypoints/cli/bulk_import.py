@@ -0,0 +1,61 @@
+import argparse
+import asyncio
+from pathlib import Path
+
+from business_contexts.domain.value_objects.bulk_import import ImportKind
+from business_contexts.services.executors.bulk_import import import_file
+from business_contexts.utils.constants import IMPORT_BATCH_SIZE
+from infra import start_mappers
+from infra.database import get_async_engine, mapper_registry
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Interpreta os argumentos da linha de comando da importação em massa."""
+    parser = argparse.ArgumentParser(
+        prog="python -m business_contexts.entrypoints.cli.bulk_import",
+        description=(
+            "Importa clientes, contas ou transações históricas de um arquivo CSV ou "
+            "JSONL, retomando a partir do último lote confirmado."
+        ),
+    )
+    parser.add_argument("kind", choices=[kind.value for kind in ImportKind])
+    parser.add_argument("path", type=Path, help="Arquivo .csv ou .jsonl")
+    parser.add_argument(
+        "--source",
+        help="Identificador da importação para retomada (padrão: tipo e caminho do arquivo)",
+    )
+    parser.add_argument(
+        "--rejects",
+        type=Path,
+        help="Arquivo JSONL das linhas rejeitadas (padrão: <arquivo>.rejected.jsonl)",
+    )
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    return parser.parse_args(argv)
+
+
+async def main(argv: list[str] | None = None) -> None:
+    """Executa a importação em massa e exibe o resumo."""
+    args = parse_args(argv)
+
+    start_mappers()
+    async with get_async_engine().begin() as conn:
+        await conn.run_sync(mapper_registry.metadata.create_all)
+
+    report = await import_file(
+        ImportKind(args.kind),
+        args.path,
+        source=args.source,
+        rejects_path=args.rejects,
+        batch_size=args.batch_size,
+    )
+    await get_async_engine().dispose()
+
+    print(
+        f"{report.source}: {report.imported} importadas, {report.rejected} rejeitadas, "
+        f"{report.skipped} já importadas anteriormente "
+        f"({report.elapsed_seconds:.1f}s, {report.rows_per_second:.0f} linhas/s)"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,193 @@
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from business_contexts.domain.entities.bank_account import CreateBankAccount
+from business_contexts.domain.entities.bank_transaction import CreateBankTransaction
+from business_contexts.domain.entities.client import CreateClient
+from business_contexts.domain.value_objects.bank_transaction import TransactionType
+from business_contexts.repository.query_repo.bank_account import (
+    BankAccountQueryRepo,
+)
+from business_contexts.services.executors.bank_account import create_accounts_batch
+from business_contexts.services.executors.bank_transaction import (
+    create_bank_transaction,
+)
+from business_contexts.services.executors.client import create_clients_batch
+from business_contexts.utils.base_types import CPF, AccountNumber, IsolationLevel
+from infra import start_mappers
+from infra.database import get_async_engine, mapper_registry
+from libs.ddd.adapters.repository import DomainRepository, QueryRepository
+from libs.ddd.adapters.viewers import Filters
+from libs.metrics import METRICS
+
+
+@dataclass(frozen=True)
+class IsolationScenario:
+    """Combinação de níveis de isolamento comparada no benchmark."""
+
+    name: str
+    query_isolation_level: IsolationLevel
+    query_read_only: bool
+    locking_isolation_level: IsolationLevel
+
+
+SCENARIOS: tuple[IsolationScenario, ...] = (
+    IsolationScenario(
+        name="global",
+        query_isolation_level=IsolationLevel.REPEATABLE_READ,
+        query_read_only=False,
+        locking_isolation_level=IsolationLevel.REPEATABLE_READ,
+    ),
+    IsolationScenario(
+        name="por operação",
+        query_isolation_level=IsolationLevel.READ_COMMITTED,
+        query_read_only=True,
+        locking_isolation_level=IsolationLevel.READ_COMMITTED,
+    ),
+)
+
+
+@dataclass
+class ScenarioResult:
+    """Medições de um cenário: latências (ms) de leituras e escritas e falhas."""
+
+    scenario: IsolationScenario
+    read_latencies: list[float] = field(default_factory=list)
+    write_latencies: list[float] = field(default_factory=list)
+    write_failures: int = 0
+    serialization_retries: int = 0
+    elapsed_seconds: float = 0.0
+
+    @staticmethod
+    def percentile(latencies: list[float], percent: int) -> float:
+        """Retorna o percentil informado das latências, ou zero sem medições."""
+        if len(latencies) < 2:
+            return latencies[0] if latencies else 0.0
+        return statistics.quantiles(latencies, n=100)[percent - 1]
+
+    def summary(self) -> str:
+        """Resume o cenário em uma linha: vazão, p99 e falhas."""
+        return (
+            f"{self.scenario.name:>14}: "
+            f"{len(self.read_latencies) / self.elapsed_seconds:8.0f} leituras/s "
+            f"(p99 {self.percentile(self.read_latencies, 99):6.1f} ms), "
+            f"{len(self.write_latencies) / self.elapsed_seconds:8.0f} escritas/s "
+            f"(p99 {self.percentile(self.write_latencies, 99):6.1f} ms), "
+            f"{self.serialization_retries} reexecuções, "
+            f"{self.write_failures} falhas"
+        )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Interpreta os argumentos da linha de comando do benchmark de isolamento."""
+    parser = argparse.ArgumentParser(
+        prog="python -m business_contexts.entrypoints.cli.isolation_benchmark",
+        description=(
+            "Compara o REPEATABLE READ global com o isolamento por operação, sob "
+            "leituras e transferências concorrentes entre poucas contas."
+        ),
+    )
+    parser.add_argument("--accounts", type=int, default=10)
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--writers", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="Segundos")
+    return parser.parse_args(argv)
+
+
+async def create_accounts(quantity: int) -> list[str]:
+    """Cadastra um cliente e as contas usadas no benchmark, com saldo suficiente."""
+    cpf = CPF.generate()
+    await create_clients_batch([CreateClient(name="Benchmark", cpf=cpf)])
+    items = await create_accounts_batch(
+        [
+            CreateBankAccount(
+                account_number=AccountNumber.generate_account_number(),
+                balance=Decimal(1000000000),
+                client_cpf=cpf,
+            )
+            for _ in range(quantity)
+        ]
+    )
+    return [item.account.account_number for item in items if item.account]
+
+
+async def run_scenario(
+    scenario: IsolationScenario, account_numbers: list[str], args: argparse.Namespace
+) -> ScenarioResult:
+    """Executa leitores e escritores concorrentes durante o tempo configurado."""
+    QueryRepository.isolation_level = scenario.query_isolation_level
+    QueryRepository.read_only = scenario.query_read_only
+    DomainRepository.locking_isolation_level = scenario.locking_isolation_level
+    METRICS.reset()
+
+    result = ScenarioResult(scenario=scenario)
+    started_at = time.monotonic()
+    deadline = started_at + args.duration
+
+    async def read() -> None:
+        while time.monotonic() < deadline:
+            operation_started_at = time.perf_counter()
+            await BankAccountQueryRepo().query_one_by_filters(
+                Filters(
+                    {
+                        "account_number": random.choice(account_numbers),
+                        "list_transactions": False,
+                    }
+                )
+            )
+            result.read_latencies.append(
+                (time.perf_counter() - operation_started_at) * 1000
+            )
+
+    async def write() -> None:
+        while time.monotonic() < deadline:
+            origin, destination = random.sample(account_numbers, 2)
+            operation_started_at = time.perf_counter()
+            try:
+                await create_bank_transaction(
+                    CreateBankTransaction(
+                        type=TransactionType.TRANSFER,
+                        amount=Decimal(1),
+                        account_number=origin,
+                        destination_account_number=destination,
+                    )
+                )
+            except Exception:  # noqa: BLE001
+                result.write_failures += 1
+            else:
+                result.write_latencies.append(
+                    (time.perf_counter() - operation_started_at) * 1000
+                )
+
+    await asyncio.gather(
+        *(read() for _ in range(args.readers)),
+        *(write() for _ in range(args.writers)),
+    )
+    result.elapsed_seconds = time.monotonic() - started_at
+    result.serialization_retries = METRICS.get_counter("serialization_retries")
+    return result
+
+
+async def main(argv: list[str] | None = None) -> None:
+    """Executa os cenários do benchmark e exibe a comparação."""
+    args = parse_args(argv)
+
+    start_mappers()
+    async with get_async_engine().begin() as conn:
+        await conn.run_sync(mapper_registry.metadata.create_all)
+
+    account_numbers = await create_accounts(args.accounts)
+    for scenario in SCENARIOS:
+        result = await run_scenario(scenario, account_numbers, args)
+        print(result.summary())
+
+    await get_async_engine().dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,164 @@
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from sqlalchemy import select
+
+from business_contexts.domain.aggregates.bank_transaction import Transaction
+from business_contexts.domain.entities.bank_account import CreateBankAccount
+from business_contexts.domain.entities.bank_transaction import (
+    CreateBankTransaction,
+    TransactionEntity,
+)
+from business_contexts.domain.entities.client import CreateClient
+from business_contexts.domain.value_objects.bank_transaction import TransactionType
+from business_contexts.repository.query_repo.bank_transaction import (
+    BankTransactionQueryRepo,
+)
+from business_contexts.services.executors.bank_account import create_accounts_batch
+from business_contexts.services.executors.bank_transaction import (
+    create_bank_transactions_batch,
+)
+from business_contexts.services.executors.client import create_clients_batch
+from business_contexts.utils.base_types import CPF, AccountNumber
+from business_contexts.utils.constants import TRANSACTION_BATCH_MAX_SIZE
+from infra import start_mappers
+from infra.database import get_async_engine, mapper_registry
+from libs.ddd.adapters.repository import QueryRepository
+from libs.ddd.adapters.viewers import Filters
+
+
+class HydratingTransactionQueryRepo(QueryRepository):
+    """
+    Consulta de referência (antes da projeção): carrega as transações como agregados
+    mapeados, com o mapa de identidade da sessão, e copia os campos para as entidades.
+    """
+
+    async def query_by_filters(self, filters: Filters) -> Sequence[TransactionEntity]:
+        """Consulta transações bancárias aplicando os filtros fornecidos."""
+        async with self:
+            transactions = (
+                (await self.session.execute(select(Transaction).filter_by(**filters)))
+                .scalars()
+                .all()
+            )
+
+            return [
+                TransactionEntity(
+                    id=transaction.id,
+                    type=TransactionType(transaction.type),
+                    amount=transaction.amount,
+                    date=transaction.date,
+                    account_number=transaction.account_number,
+                    destination_account_number=transaction.destination_account_number,
+                    balance_after=transaction.balance_after,
+                    destination_balance_after=transaction.destination_balance_after,
+                )
+                for transaction in transactions
+            ]
+
+
+@dataclass
+class StrategyResult:
+    """Medições de uma estratégia de consulta: duração (ms) de cada execução."""
+
+    name: str
+    rows: int = 0
+    durations: list[float] = field(default_factory=list)
+
+    def summary(self) -> str:
+        """Resume a estratégia em uma linha: mediana, melhor execução e vazão."""
+        median = statistics.median(self.durations)
+        return (
+            f"{self.name:>16}: "
+            f"{median:8.1f} ms (mediana), "
+            f"{min(self.durations):8.1f} ms (melhor), "
+            f"{self.rows / median * 1000:10.0f} linhas/s"
+        )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Interpreta os argumentos da linha de comando do benchmark de projeção."""
+    parser = argparse.ArgumentParser(
+        prog="python -m business_contexts.entrypoints.cli.projection_benchmark",
+        description=(
+            "Compara a consulta de transações com hidratação dos agregados mapeados "
+            "(antes) com a projeção das colunas da entidade (depois)."
+        ),
+    )
+    parser.add_argument("--transactions", type=int, default=50000)
+    parser.add_argument("--repeats", type=int, default=5)
+    return parser.parse_args(argv)
+
+
+async def create_transactions(quantity: int) -> str:
+    """Cadastra um cliente, uma conta e os depósitos consultados no benchmark."""
+    cpf = CPF.generate()
+    await create_clients_batch([CreateClient(name="Benchmark", cpf=cpf)])
+    account_number = AccountNumber.generate_account_number()
+    await create_accounts_batch(
+        [
+            CreateBankAccount(
+                account_number=account_number, balance=Decimal(0), client_cpf=cpf
+            )
+        ]
+    )
+
+    for start in range(0, quantity, TRANSACTION_BATCH_MAX_SIZE):
+        await create_bank_transactions_batch(
+            [
+                CreateBankTransaction(
+                    type=TransactionType.DEPOSIT,
+                    amount=Decimal(1),
+                    account_number=account_number,
+                )
+                for _ in range(min(TRANSACTION_BATCH_MAX_SIZE, quantity - start))
+            ]
+        )
+    return account_number
+
+
+async def run_strategy(
+    name: str,
+    repository: type[HydratingTransactionQueryRepo | BankTransactionQueryRepo],
+    account_number: str,
+    repeats: int,
+) -> StrategyResult:
+    """Executa a consulta das transações da conta a quantidade configurada de vezes."""
+    result = StrategyResult(name=name)
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        transactions = await repository().query_by_filters(
+            Filters({"account_number": account_number})
+        )
+        result.durations.append((time.perf_counter() - started_at) * 1000)
+        result.rows = len(transactions)
+    return result
+
+
+async def main(argv: list[str] | None = None) -> None:
+    """Executa as estratégias do benchmark e exibe a comparação."""
+    args = parse_args(argv)
+
+    start_mappers()
+    async with get_async_engine().begin() as conn:
+        await conn.run_sync(mapper_registry.metadata.create_all)
+
+    account_number = await create_transactions(args.transactions)
+    strategies = (
+        ("hidratação ORM", HydratingTransactionQueryRepo),
+        ("projeção", BankTransactionQueryRepo),
+    )
+    for name, repository in strategies:
+        result = await run_strategy(name, repository, account_number, args.repeats)
+        print(result.summary())
+
+    await get_async_engine().dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,22 +1,43 @@
-from fastapi import Depends, APIRouter
+from datetime import date, datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, Query, Response
 from pydantic import UUID4
 
-from business_contexts.domain.exceptions import BankAccountNotFound
-from business_contexts.repository.query_repo.bank_account import (
-    BankAccountQueryRepo,
-)
 from business_contexts.domain.entities.bank_account import (
+    AccountStatementEntity,
+    AccountSummaryEntity,
     CreateBankAccount,
-    UpdateBankAccount,
+    ReadAccountStatement,
+    ReadAccountSummary,
     ReadBankAccount,
+    ReadBankAccountBatchItem,
+    UpdateBankAccount,
+)
+from business_contexts.domain.exceptions import (
+    BankAccountNotFound,
+    InvalidStatementPeriod,
+    InvalidSummaryPeriod,
+)
+from business_contexts.repository.query_repo.bank_account import (
+    BankAccountQueryRepo,
 )
 from business_contexts.services.executors.bank_account import (
     create_account,
-    update_account,
+    create_accounts_batch,
     delete_account,
+    update_account,
 )
 from business_contexts.services.executors.security import get_current_user
-from libs.ddd.adapters.viewers import Filters
+from business_contexts.services.viewers.conditional import account_etag, not_modified
+from business_contexts.utils.base_types import SummaryPeriod
+from business_contexts.utils.constants import (
+    ETAG_HEADER,
+    NEXT_CURSOR_HEADER,
+    PAGE_DEFAULT_SIZE,
+    PAGE_MAX_SIZE,
+)
+from libs.ddd.adapters.viewers import Filters, Pagination, etag_matches
 
 router: APIRouter = APIRouter(
     prefix="/api",
@@ -30,11 +51,20 @@ router: APIRouter = APIRouter(
     response_model=list[ReadBankAccount],
 )
 async def list_accounts(
+    response: Response,
     id: UUID4 | None = None,
     account_number: str | None = None,
     list_transactions: bool = False,
-) -> list:
-    """Lista contas bancárias com filtros opcionais por ID, número da conta e transações."""
+    limit: Annotated[int, Query(ge=1, le=PAGE_MAX_SIZE)] = PAGE_DEFAULT_SIZE,
+    after: str | None = None,
+    if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
+) -> list | Response:
+    """
+    Lista contas bancárias com filtros opcionais por ID, número da conta e transações,
+    paginadas por cursor: o cabeçalho X-Next-Cursor traz o valor de after da próxima página.
+    A resposta traz a ETag da página; com If-None-Match igual à ETag atual, retorna 304
+    após consultar apenas a versão das contas, sem montar a página.
+    """
     filters = Filters(
         {
             "id": id,
@@ -42,15 +72,106 @@ async def list_accounts(
             "list_transactions": list_transactions,
         }
     )
-
-    bank_accounts = await BankAccountQueryRepo().query_by_filters(filters=filters)
+    pagination = Pagination(limit=limit, after=after)
+
+    if if_none_match:
+        versions = await BankAccountQueryRepo().query_version_page(
+            filters=filters, pagination=pagination
+        )
+        etag = account_etag(versions, list_transactions)
+        if versions.items and etag_matches(if_none_match, etag):
+            return not_modified(etag, versions.next_cursor)
+
+    page = await BankAccountQueryRepo().query_page_by_filters(
+        filters=filters, pagination=pagination
+    )
+    bank_accounts = page.items
 
     if not bank_accounts:
         raise BankAccountNotFound
 
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    response.headers[ETAG_HEADER] = account_etag(page, list_transactions)
+
     return bank_accounts
 
 
+@router.get("/conta_bancaria/extrato", response_model=ReadAccountStatement)
+async def statement(
+    account_number: str,
+    start_date: Annotated[datetime | None, Query(alias="from")] = None,
+    end_date: Annotated[datetime | None, Query(alias="to")] = None,
+) -> AccountStatementEntity:
+    """
+    Retorna o extrato da conta no período [from, to): os lançamentos enviados e
+    recebidos em ordem de data, com o saldo após cada um, e os saldos de abertura
+    e de fechamento do período.
+    """
+    if start_date is not None and end_date is not None and end_date <= start_date:
+        raise InvalidStatementPeriod
+
+    account_statement = await BankAccountQueryRepo().query_statement(
+        account_number=account_number, start_date=start_date, end_date=end_date
+    )
+
+    if not account_statement:
+        raise BankAccountNotFound
+
+    return account_statement
+
+
+@router.get("/conta_bancaria/resumo_diario", response_model=ReadAccountSummary)
+async def daily_summary(
+    account_number: str,
+    start_date: Annotated[date | None, Query(alias="from")] = None,
+    end_date: Annotated[date | None, Query(alias="to")] = None,
+) -> AccountSummaryEntity:
+    """
+    Retorna o resumo diário da movimentação da conta nos dias [from, to): por dia e
+    tipo de transação, a quantidade de lançamentos, os créditos, os débitos e o
+    saldo líquido.
+    """
+    return await _summary(account_number, SummaryPeriod.DAY, start_date, end_date)
+
+
+@router.get("/conta_bancaria/resumo_mensal", response_model=ReadAccountSummary)
+async def monthly_summary(
+    account_number: str,
+    start_date: Annotated[date | None, Query(alias="from")] = None,
+    end_date: Annotated[date | None, Query(alias="to")] = None,
+) -> AccountSummaryEntity:
+    """
+    Retorna o resumo mensal da movimentação da conta nos dias [from, to): por mês e
+    tipo de transação, a quantidade de lançamentos, os créditos, os débitos e o
+    saldo líquido.
+    """
+    return await _summary(account_number, SummaryPeriod.MONTH, start_date, end_date)
+
+
+async def _summary(
+    account_number: str,
+    period: SummaryPeriod,
+    start_date: date | None,
+    end_date: date | None,
+) -> AccountSummaryEntity:
+    """Consulta o resumo da conta no período, validando o período e a conta."""
+    if start_date is not None and end_date is not None and end_date <= start_date:
+        raise InvalidSummaryPeriod
+
+    account_summary = await BankAccountQueryRepo().query_summaries(
+        account_number=account_number,
+        period=period,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    if not account_summary:
+        raise BankAccountNotFound
+
+    return account_summary
+
+
 @router.post("/conta_bancaria", response_model=ReadBankAccount)
 async def register(
     new_bank_account: CreateBankAccount,
@@ -60,6 +181,15 @@ async def register(
     return bank_account
 
 
+@router.post("/conta_bancarias/lote", response_model=list[ReadBankAccountBatchItem])
+async def register_batch(
+    new_bank_accounts: list[CreateBankAccount],
+) -> list[ReadBankAccountBatchItem]:
+    """Cadastra um lote de contas bancárias, retornando o resultado de cada item."""
+    results = await create_accounts_batch(bank_accounts=new_bank_accounts)
+    return results
+
+
 @router.put("/conta_bancaria", response_model=ReadBankAccount)
 async def update(
     updated_bank_account: UpdateBankAccount,
@@ -1,19 +1,42 @@
-from fastapi import Depends, APIRouter
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import UUID4
 
-from business_contexts.services.executors.bank_transaction import (
-    create_bank_transaction,
+from business_contexts.domain.entities.bank_transaction import (
+    CreateBankTransaction,
+    ReadBankTransaction,
+    ReadBankTransactionBatchItem,
 )
+from business_contexts.domain.entities.user import UserEntity
 from business_contexts.domain.exceptions import BankTransactionNotFound
 from business_contexts.repository.query_repo.bank_transaction import (
     BankTransactionQueryRepo,
 )
-from business_contexts.domain.entities.bank_transaction import (
-    CreateBankTransaction,
-    ReadBankTransaction,
+from business_contexts.services.executors.bank_transaction import (
+    create_bank_transaction,
+    create_bank_transactions_batch,
 )
 from business_contexts.services.executors.security import get_current_user
-from libs.ddd.adapters.viewers import Filters
+from business_contexts.services.viewers.bank_transaction import (
+    EXPORT_MEDIA_TYPES,
+    encode_transactions,
+    stream_until_disconnected,
+)
+from business_contexts.services.viewers.conditional import (
+    not_modified,
+    transaction_etag,
+)
+from business_contexts.utils.base_types import ExportFormat
+from business_contexts.utils.constants import (
+    ETAG_HEADER,
+    NEXT_CURSOR_HEADER,
+    PAGE_DEFAULT_SIZE,
+    PAGE_MAX_SIZE,
+)
+from libs.ddd.adapters.viewers import Filters, Pagination, etag_matches
 
 router: APIRouter = APIRouter(
     prefix="/api",
@@ -24,29 +47,109 @@ router: APIRouter = APIRouter(
 
 @router.get("/transacao_bancarias", response_model=list[ReadBankTransaction])
 async def list_transactions(
+    response: Response,
     id: UUID4 | None = None,
-) -> list:
-    """Lista transações bancárias com filtro opcional por ID."""
+    limit: Annotated[int, Query(ge=1, le=PAGE_MAX_SIZE)] = PAGE_DEFAULT_SIZE,
+    after: str | None = None,
+    if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
+) -> list | Response:
+    """
+    Lista transações bancárias com filtro opcional por ID, em ordem de data, paginadas
+    por cursor: o cabeçalho X-Next-Cursor traz o valor de after da próxima página.
+    A resposta traz a ETag da página; com If-None-Match igual à ETag atual, retorna 304
+    após consultar apenas as chaves das transações, sem montar a página.
+    """
     filters = Filters(
         {
             "id": id,
         }
     )
+    pagination = Pagination(limit=limit, after=after)
 
-    transactions = await BankTransactionQueryRepo().query_by_filters(filters=filters)
+    if if_none_match:
+        keys = await BankTransactionQueryRepo().query_key_page(
+            filters=filters, pagination=pagination
+        )
+        etag = transaction_etag(keys.items, keys.next_cursor)
+        if keys.items and etag_matches(if_none_match, etag):
+            return not_modified(etag, keys.next_cursor)
+
+    page = await BankTransactionQueryRepo().query_page_by_filters(
+        filters=filters, pagination=pagination
+    )
+    transactions = page.items
 
     if not transactions:
         raise BankTransactionNotFound
 
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    response.headers[ETAG_HEADER] = transaction_etag(
+        [(transaction.date, transaction.id) for transaction in transactions],
+        page.next_cursor,
+    )
+
     return transactions
 
 
+@router.get("/transacao_bancarias/exportacao", response_class=StreamingResponse)
+async def export_transactions(
+    request: Request,
+    format: ExportFormat = ExportFormat.NDJSON,
+    account_number: str | None = None,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+) -> StreamingResponse:
+    """
+    Exporta o histórico de transações bancárias em NDJSON ou CSV, em ordem de data,
+    com filtros opcionais por conta (origem ou destino) e período [start_date, end_date).
+    As linhas são lidas do banco por um cursor e enviadas à medida que são codificadas,
+    com memória constante; a exportação é interrompida se o cliente desconectar.
+    """
+    transactions = BankTransactionQueryRepo().stream_by_filters(
+        account_number=account_number, start_date=start_date, end_date=end_date
+    )
+
+    return StreamingResponse(
+        encode_transactions(
+            stream_until_disconnected(request, transactions), export_format=format
+        ),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="transacoes.{format.value}"'
+        },
+    )
+
+
 @router.post("/transacao_bancaria", response_model=ReadBankTransaction)
 async def register(
     new_bank_transaction: CreateBankTransaction,
+    current_user: Annotated[UserEntity, Depends(get_current_user)],
+    idempotency_key: Annotated[
+        str | None, Header(alias="Idempotency-Key", max_length=255)
+    ] = None,
 ) -> ReadBankTransaction:
-    """Cadastra uma nova transação bancária (depósito, saque ou transferência)."""
+    """
+    Cadastra uma nova transação bancária (depósito, saque ou transferência).
+    Com o cabeçalho Idempotency-Key, repetições da requisição não geram novos lançamentos;
+    a chave é individual do usuário autenticado.
+    """
     bank_transaction = await create_bank_transaction(
-        bank_transaction=new_bank_transaction
+        bank_transaction=new_bank_transaction,
+        idempotency_key=idempotency_key,
+        user_id=current_user.id,
     )
     return bank_transaction
+
+
+@router.post(
+    "/transacao_bancarias/lote", response_model=list[ReadBankTransactionBatchItem]
+)
+async def register_batch(
+    new_bank_transactions: list[CreateBankTransaction],
+) -> list[ReadBankTransactionBatchItem]:
+    """Cadastra um lote de transações bancárias, retornando o resultado de cada item."""
+    results = await create_bank_transactions_batch(
+        bank_transactions=new_bank_transactions
+    )
+    return results
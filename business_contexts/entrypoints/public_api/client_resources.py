@@ -1,22 +1,31 @@
-from fastapi import Depends, APIRouter
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Response
 from pydantic import UUID4
 
-from business_contexts.domain.exceptions import (
-    ClientNotFound,
-)
-from business_contexts.repository.query_repo.client import ClientQueryRepo
 from business_contexts.domain.entities.client import (
     CreateClient,
     ReadClient,
+    ReadClientBatchItem,
     UpdateClient,
 )
+from business_contexts.domain.exceptions import (
+    ClientNotFound,
+)
+from business_contexts.repository.query_repo.client import ClientQueryRepo
 from business_contexts.services.executors.client import (
     create_client,
-    update_client,
+    create_clients_batch,
     delete_client,
+    update_client,
 )
 from business_contexts.services.executors.security import get_current_user
-from libs.ddd.adapters.viewers import Filters
+from business_contexts.utils.constants import (
+    NEXT_CURSOR_HEADER,
+    PAGE_DEFAULT_SIZE,
+    PAGE_MAX_SIZE,
+)
+from libs.ddd.adapters.viewers import Filters, Pagination
 
 router: APIRouter = APIRouter(
     prefix="/api",
@@ -27,10 +36,16 @@ router: APIRouter = APIRouter(
 
 @router.get("/clientes", response_model=list[ReadClient])
 async def list_clients(
+    response: Response,
     id: UUID4 | None = None,
     cpf: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=PAGE_MAX_SIZE)] = PAGE_DEFAULT_SIZE,
+    after: str | None = None,
 ) -> list:
-    """Lista clientes com filtros opcionais por ID e CPF."""
+    """
+    Lista clientes com filtros opcionais por ID e CPF, paginados por cursor: o
+    cabeçalho X-Next-Cursor traz o valor de after da próxima página.
+    """
     filters = Filters(
         {
             "id": id,
@@ -38,11 +53,17 @@ async def list_clients(
         }
     )
 
-    clients = await ClientQueryRepo().query_by_filters(filters=filters)
+    page = await ClientQueryRepo().query_page_by_filters(
+        filters=filters, pagination=Pagination(limit=limit, after=after)
+    )
+    clients = page.items
 
     if not clients:
         raise ClientNotFound
 
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+
     return clients
 
 
@@ -55,6 +76,15 @@ async def register(
     return client
 
 
+@router.post("/clientes/lote", response_model=list[ReadClientBatchItem])
+async def register_batch(
+    new_clients: list[CreateClient],
+) -> list[ReadClientBatchItem]:
+    """Cadastra um lote de clientes, retornando o resultado de cada item."""
+    results = await create_clients_batch(clients=new_clients)
+    return results
+
+
 @router.put("/cliente", response_model=ReadClient)
 async def update(
     updated_client: UpdateClient,
@@ -1,20 +1,27 @@
-from fastapi import Depends, APIRouter
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Response
 from pydantic import UUID4
 
-from business_contexts.domain.exceptions import UserNotFound
-from business_contexts.repository.query_repo.user import UserQueryRepo
 from business_contexts.domain.entities.user import (
     CreateUser,
     ReadUser,
     UpdateUser,
 )
+from business_contexts.domain.exceptions import UserNotFound
+from business_contexts.repository.query_repo.user import UserQueryRepo
 from business_contexts.services.executors.security import get_current_admin_user
 from business_contexts.services.executors.user import (
-    delete_user,
     create_user,
+    delete_user,
     update_user,
 )
-from libs.ddd.adapters.viewers import Filters
+from business_contexts.utils.constants import (
+    NEXT_CURSOR_HEADER,
+    PAGE_DEFAULT_SIZE,
+    PAGE_MAX_SIZE,
+)
+from libs.ddd.adapters.viewers import Filters, Pagination
 
 router: APIRouter = APIRouter(
     prefix="/api",
@@ -25,10 +32,16 @@ router: APIRouter = APIRouter(
 
 @router.get("/usuarios", response_model=list[ReadUser])
 async def list_users(
+    response: Response,
     id: UUID4 | None = None,
     email: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=PAGE_MAX_SIZE)] = PAGE_DEFAULT_SIZE,
+    after: str | None = None,
 ) -> list:
-    """Lista usuários com filtros opcionais por ID e email."""
+    """
+    Lista usuários com filtros opcionais por ID e email, paginados por cursor: o
+    cabeçalho X-Next-Cursor traz o valor de after da próxima página.
+    """
     filters = Filters(
         {
             "id": id,
@@ -36,11 +49,17 @@ async def list_users(
         }
     )
 
-    users = await UserQueryRepo().query_by_filters(filters=filters)
+    page = await UserQueryRepo().query_page_by_filters(
+        filters=filters, pagination=Pagination(limit=limit, after=after)
+    )
+    users = page.items
 
     if not users:
         raise UserNotFound
 
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+
     return users
 
 
@@ -1,21 +1,12 @@
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any
 
 import sentry_sdk
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
+from sqlalchemy.exc import DBAPIError
 from starlette.middleware.cors import CORSMiddleware
 
-from business_contexts.utils.constants import SENTRY_DSN
-from infra import start_mappers
-from infra.database import (
-    create_first_user,
-    get_async_engine,
-    mapper_registry,
-)
-
-from business_contexts.entrypoints.public_api.security_resources import (
-    router as security_router,
-)
 from business_contexts.entrypoints.public_api.bank_account_resources import (
     router as bank_account_router,
 )
@@ -25,9 +16,48 @@ from business_contexts.entrypoints.public_api.bank_transaction_resources import
 from business_contexts.entrypoints.public_api.client_resources import (
     router as client_router,
 )
+from business_contexts.entrypoints.public_api.security_resources import (
+    router as security_router,
+)
 from business_contexts.entrypoints.public_api.user_resources import (
     router as user_router,
 )
+from business_contexts.repository.cache import CACHE_STORE
+from business_contexts.services.tasks.group_commit import stop_group_commit_writer
+from business_contexts.services.tasks.idempotency_expiration import (
+    IDEMPOTENCY_RECORD_EXPIRER,
+)
+from business_contexts.services.tasks.ledger_snapshot import LEDGER_SNAPSHOTTER
+from business_contexts.services.tasks.outbox_dispatcher import OUTBOX_DISPATCHER
+from business_contexts.services.tasks.transaction_rollup import (
+    TRANSACTION_ROLLUP_PROJECTOR,
+)
+from business_contexts.utils.base_types import PostingStrategy
+from business_contexts.utils.constants import (
+    CONSISTENCY_TOKEN_HEADER,
+    ETAG_HEADER,
+    NEXT_CURSOR_HEADER,
+    OUTBOX_DISPATCHER_ENABLED,
+    OUTBOX_ENABLED,
+    SENTRY_DSN,
+    TRANSACTION_POSTING_STRATEGY,
+    TRANSACTION_ROLLUP_ENABLED,
+)
+from infra import start_mappers
+from infra.database import (
+    create_first_user,
+    get_async_engine,
+    get_primary_wal_lsn,
+    get_replica_database_uri,
+    mapper_registry,
+)
+from libs.ddd.adapters.replica import (
+    READ_CONSISTENCY,
+    ReadConsistency,
+    format_lsn,
+    parse_lsn,
+)
+from libs.metrics import CURRENT_ENDPOINT, METRICS
 
 sentry_sdk.init(
     dsn=SENTRY_DSN,
@@ -43,7 +73,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     async with get_async_engine().begin() as conn:
         await conn.run_sync(mapper_registry.metadata.create_all)
     await create_first_user()
+    IDEMPOTENCY_RECORD_EXPIRER.start()
+    if PostingStrategy(TRANSACTION_POSTING_STRATEGY) == PostingStrategy.LEDGER:
+        LEDGER_SNAPSHOTTER.start()
+    if OUTBOX_ENABLED and OUTBOX_DISPATCHER_ENABLED:
+        OUTBOX_DISPATCHER.start()
+    if TRANSACTION_ROLLUP_ENABLED:
+        TRANSACTION_ROLLUP_PROJECTOR.start()
     yield
+    await TRANSACTION_ROLLUP_PROJECTOR.stop()
+    await OUTBOX_DISPATCHER.stop()
+    await LEDGER_SNAPSHOTTER.stop()
+    await IDEMPOTENCY_RECORD_EXPIRER.stop()
+    await stop_group_commit_writer()
+    await CACHE_STORE.close()
 
 
 app: FastAPI = FastAPI(
@@ -76,6 +119,69 @@ async def trigger_error() -> float:
     return 1 / 0
 
 
+@app.get("/metrics")
+async def metrics() -> dict[str, Any]:
+    """Rota que expõe as métricas internas da aplicação."""
+    return METRICS.snapshot()
+
+
+@app.middleware("http")
+async def track_current_endpoint(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Registra o endpoint da requisição atual, usado como rótulo das métricas."""
+    token = CURRENT_ENDPOINT.set(f"{request.method} {request.url.path}")
+    try:
+        return await call_next(request)
+    finally:
+        CURRENT_ENDPOINT.reset(token)
+
+
+# Métodos das requisições que apenas leem, atendidas pela réplica de leitura
+READ_ONLY_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@app.middleware("http")
+async def route_reads(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """
+    Com a réplica de leitura configurada, define a consistência das leituras da
+    requisição: requisições de escrita leem do primário, e as demais leem da réplica,
+    exceto enquanto ela não tiver reproduzido o token de consistência (LSN) recebido
+    no cabeçalho X-Consistency-Token (tokens inválidos levam ao primário). As
+    respostas das escritas bem-sucedidas trazem, nesse cabeçalho, o token que
+    garante a leitura das próprias escritas nas requisições seguintes; as que
+    falharam não consultam o primário.
+    """
+    if not get_replica_database_uri():
+        return await call_next(request)
+
+    primary_only = request.method not in READ_ONLY_METHODS
+    consistency_token = request.headers.get(CONSISTENCY_TOKEN_HEADER)
+    try:
+        min_lsn = parse_lsn(consistency_token) if consistency_token else None
+    except ValueError:
+        min_lsn, primary_only = None, True
+
+    token = READ_CONSISTENCY.set(
+        ReadConsistency(primary_only=primary_only, min_lsn=min_lsn)
+    )
+    try:
+        response = await call_next(request)
+    finally:
+        READ_CONSISTENCY.reset(token)
+
+    # Apenas escritas bem-sucedidas (2xx) confirmaram alterações a serem lidas
+    if request.method not in READ_ONLY_METHODS and 200 <= response.status_code < 300:
+        try:
+            lsn = max(await get_primary_wal_lsn(), min_lsn or 0)
+            response.headers[CONSISTENCY_TOKEN_HEADER] = format_lsn(lsn)
+        except (OSError, DBAPIError):
+            pass
+    return response
+
+
 # CORS
 origins: list[str] = [
     "http://localhost",
@@ -87,7 +193,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["Content-Disposition"],
+    expose_headers=[
+        "Content-Disposition",
+        NEXT_CURSOR_HEADER,
+        CONSISTENCY_TOKEN_HEADER,
+        ETAG_HEADER,
+    ],
 )
 
 # include routes from api
@@ -0,0 +1,171 @@
+from collections.abc import Awaitable, Callable
+from uuid import UUID
+
+from business_contexts.domain.entities.bank_account import AccountEntity
+from business_contexts.domain.entities.client import ClientEntity
+from business_contexts.domain.entities.user import UserEntity
+from business_contexts.utils.base_types import CacheBackendType
+from business_contexts.utils.constants import (
+    ACCOUNT_CACHE_TTL_SECONDS,
+    CACHE_BACKEND,
+    CACHE_ENABLED,
+    CACHE_KEY_PREFIX,
+    CACHE_MAX_SIZE,
+    CACHE_REDIS_POOL_SIZE,
+    CACHE_REDIS_TIMEOUT_MS,
+    CACHE_REDIS_URL,
+    CLIENT_CACHE_TTL_SECONDS,
+    USER_CACHE_TTL_SECONDS,
+)
+from libs.ddd.adapters.cache import (
+    CacheBackend,
+    InMemoryCacheBackend,
+    LRUCache,
+    ReadThroughCache,
+)
+from libs.ddd.adapters.redis_cache import RedisCacheBackend
+from libs.ddd.adapters.viewers import Filters
+
+
+class EntityCache[E]:
+    """
+    Cache das entidades consultadas por ID ou por uma chave natural única (como o
+    número da conta), armazenadas pela chave natural. As consultas por ID obtêm a
+    chave natural de um cache de chaves por ID, local ao processo e verificado a cada
+    leitura (a chave só muda com a alteração ou remoção da entidade), de modo que as
+    escritas, que conhecem a chave natural, invalidam a entidade em todos os processos.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        entity_type: type[E],
+        key_field: str,
+        backend: CacheBackend,
+        ttl_seconds: float,
+        enabled: bool = CACHE_ENABLED,
+    ) -> None:
+        """
+        Inicializa o cache com o nome, o tipo das entidades, o campo da chave natural,
+        o armazenamento e o TTL.
+        """
+        self.key_field = key_field
+        self.entities: ReadThroughCache[str, E] = ReadThroughCache(
+            name=name,
+            backend=backend,
+            value_type=entity_type,
+            ttl_seconds=ttl_seconds,
+            enabled=enabled,
+            prefix=CACHE_KEY_PREFIX,
+        )
+        self.keys_by_id: LRUCache[UUID, str] = LRUCache(
+            max_size=CACHE_MAX_SIZE, ttl_seconds=ttl_seconds
+        )
+
+    def accepts(self, filters: Filters, ignored: tuple[str, ...] = ()) -> bool:
+        """
+        Indica se o cache está habilitado e a consulta é de uma única entidade por ID
+        e/ou chave natural, desconsiderando os filtros ignorados.
+        """
+        keys = filters.keys() - set(ignored)
+        return self.entities.enabled and bool(keys) and keys <= {"id", self.key_field}
+
+    async def get(
+        self,
+        filters: Filters,
+        load: Callable[[str], Awaitable[E | None]],
+        load_key: Callable[[UUID], Awaitable[str | None]],
+    ) -> E | None:
+        """
+        Retorna a entidade que atende aos filtros (ID e/ou chave natural), carregando-a
+        pela chave natural (load) se ausente. Na consulta só por ID, a chave natural
+        vem do cache de chaves por ID ou, se ausente ou desatualizada, de load_key.
+        """
+        id = filters.get("id")
+        key = filters.get(self.key_field)
+        if key is None:
+            key = self.keys_by_id.get(id)
+            if key is not None:
+                entity = await self.entities.get(key, lambda: load(key))
+                if entity is not None and entity.id == id:
+                    return entity
+                self.keys_by_id.delete(id)
+
+            key = await load_key(id)
+            if key is None:
+                return None
+
+        entity = await self.entities.get(key, lambda: load(key))
+        if entity is None or (id is not None and entity.id != id):
+            return None
+
+        self.keys_by_id.set(entity.id, getattr(entity, self.key_field))
+        return entity
+
+    async def invalidate(self, *keys: str | None, ids: tuple[UUID, ...] = ()) -> None:
+        """
+        Invalida as entidades informadas por chave natural e por ID. Deve ser chamada
+        após o commit das escritas que as alteram.
+        """
+        for id in ids:
+            key = self.keys_by_id.get(id)
+            self.keys_by_id.delete(id)
+            if key:
+                keys += (key,)
+        await self.entities.invalidate(*{key for key in keys if key})
+
+    async def clear(self) -> None:
+        """Remove todas as entidades do cache."""
+        self.keys_by_id.clear()
+        await self.entities.clear()
+
+
+def create_cache_backend() -> CacheBackend:
+    """Cria o armazenamento do cache configurado em CACHE_BACKEND."""
+    match CacheBackendType(CACHE_BACKEND):
+        case CacheBackendType.REDIS:
+            return RedisCacheBackend(
+                url=CACHE_REDIS_URL,
+                pool_size=CACHE_REDIS_POOL_SIZE,
+                timeout_ms=CACHE_REDIS_TIMEOUT_MS,
+            )
+        case CacheBackendType.MEMORY:
+            return InMemoryCacheBackend(max_size=CACHE_MAX_SIZE)
+
+
+CACHE_STORE: CacheBackend = create_cache_backend()
+
+# Contas consultadas sem transações. As escritas invalidam as contas alteradas após
+# o commit; com o armazenamento em memória, o TTL limita a defasagem das escritas
+# feitas por outros processos (como outros workers e a importação em massa)
+ACCOUNT_CACHE: EntityCache[AccountEntity] = EntityCache(
+    name="account_cache",
+    entity_type=AccountEntity,
+    key_field="account_number",
+    backend=CACHE_STORE,
+    ttl_seconds=ACCOUNT_CACHE_TTL_SECONDS,
+)
+
+CLIENT_CACHE: EntityCache[ClientEntity] = EntityCache(
+    name="client_cache",
+    entity_type=ClientEntity,
+    key_field="cpf",
+    backend=CACHE_STORE,
+    ttl_seconds=CLIENT_CACHE_TTL_SECONDS,
+)
+
+# Usuários consultados por ID ou email, como na autenticação de cada requisição.
+# São armazenados sem o hash da senha, que é lido do banco apenas no login
+USER_CACHE: EntityCache[UserEntity] = EntityCache(
+    name="user_cache",
+    entity_type=UserEntity,
+    key_field="email",
+    backend=CACHE_STORE,
+    ttl_seconds=USER_CACHE_TTL_SECONDS,
+)
+
+
+async def clear_caches() -> None:
+    """Remove todas as entidades dos caches."""
+    for cache in (ACCOUNT_CACHE, CLIENT_CACHE, USER_CACHE):
+        await cache.clear()
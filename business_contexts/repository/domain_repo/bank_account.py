@@ -1,63 +1,118 @@
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select, insert, delete, update, Uuid
-from sqlalchemy.orm import joinedload
+from fastapi import HTTPException
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    Uuid,
+    cast,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import joinedload, raiseload, undefer
 
 from business_contexts.domain.aggregates.bank_account import Account
 from business_contexts.domain.aggregates.bank_transaction import Transaction
-from business_contexts.utils.base_types import OperationType
-from libs.ddd.adapters.repository import DomainRepository
+from business_contexts.domain.aggregates.client import Client
+from business_contexts.domain.business_rules.bank_transaction import (
+    build_daily_rollups,
+    take_contiguous_transactions,
+)
+from business_contexts.domain.exceptions import (
+    BankAccountAlreadyRegistered,
+    ClientNotFound,
+)
+from business_contexts.domain.value_objects.bank_account import (
+    BalanceSlot,
+    BalanceSnapshot,
+    DailyRollup,
+    RollupWatermark,
+)
+from business_contexts.repository.cache import ACCOUNT_CACHE
+from business_contexts.utils.base_types import (
+    IsolationLevel,
+    OperationType,
+    PostingStrategy,
+)
+from business_contexts.utils.constants import (
+    DAILY_ROLLUP_WATERMARK,
+    LEDGER_POSTING_LOCK_NAMESPACE,
+    ROLLUP_TIMEZONE,
+    TRANSACTION_POSTING_STRATEGY,
+    TRANSACTION_ROLLUP_GAP_TIMEOUT_MS,
+)
+from infra.database import DEFAULT_SQL_SESSION_FACTORY
+from libs.ddd.adapters.repository import (
+    DomainRepository,
+    retry_on_serialization_failure,
+)
 
 
 class BankAccountDomainRepo(DomainRepository):
     """Repositório de domínio para operações de escrita de contas bancárias."""
 
-    async def query_by_id(self, id: Uuid) -> Account | None:
-        """Consulta uma conta bancária pelo ID, incluindo transações."""
-        async with self:
-            bank_account = (
-                (
-                    await self.session.execute(
-                        select(Account)
-                        .options(joinedload(Account.transactions))
-                        .filter_by(id=id)
-                    )
-                )
-                .unique()
-                .scalar_one_or_none()
-            )
+    def __init__(
+        self,
+        session_factory: Any = DEFAULT_SQL_SESSION_FACTORY,
+        posting_strategy: PostingStrategy | str = TRANSACTION_POSTING_STRATEGY,
+    ) -> None:
+        """Inicializa o repositório com a factory de sessão e a estratégia de lançamento."""
+        super().__init__(session_factory=session_factory)
+        self.posting_strategy = PostingStrategy(posting_strategy)
 
-            if not bank_account:
-                return None
+    async def query_by_id(
+        self, id: Uuid, with_transactions: bool = True
+    ) -> Account | None:
+        """
+        Consulta uma conta bancária pelo ID, incluindo transações.
+        Com with_transactions=False, carrega apenas os dados e o saldo da conta.
+        """
+        return await self.__query_one(
+            Account.id == id, with_transactions=with_transactions
+        )
 
-            aggregate = Account(
-                id=bank_account.id,
-                account_number=bank_account.account_number,
-                balance=bank_account.balance,
-                client_cpf=bank_account.client_cpf,
-                transactions=[
-                    Transaction(
-                        id=transaction.id,
-                        type=transaction.type,
-                        amount=transaction.amount,
-                        date=transaction.date,
-                        account_number=transaction.account_number,
-                        destination_account_number=transaction.destination_account_number,
-                    )
-                    for transaction in bank_account.transactions
-                ],
-            )
-        return aggregate
+    async def query_by_account_number(
+        self, account_number: str, with_transactions: bool = True
+    ) -> Account | None:
+        """
+        Consulta uma conta bancária pelo número da conta, incluindo transações.
+        Com with_transactions=False, carrega apenas os dados e o saldo da conta.
+        """
+        return await self.__query_one(
+            Account.account_number == account_number,
+            with_transactions=with_transactions,
+        )
 
-    async def query_by_account_number(self, account_number: str) -> Account | None:
-        """Consulta uma conta bancária pelo número da conta, incluindo transações."""
+    async def __query_one(
+        self, criteria: ColumnElement[bool], with_transactions: bool
+    ) -> Account | None:
+        """
+        Consulta uma conta bancária e monta o agregado. Sem as transações, o histórico
+        não é lido do banco e o agregado é criado com a lista de transações vazia,
+        mantendo o custo da consulta constante independentemente do histórico da conta.
+        O saldo lançado no razão só é calculado no modo razão.
+        """
+        is_ledger = self.posting_strategy == PostingStrategy.LEDGER
+        options = [
+            joinedload(Account.transactions)
+            if with_transactions
+            else raiseload(Account.transactions)
+        ]
+        if is_ledger:
+            options.append(undefer(Account.ledger_balance))
         async with self:
             bank_account = (
                 (
                     await self.session.execute(
-                        select(Account)
-                        .options(joinedload(Account.transactions))
-                        .filter_by(account_number=account_number)
+                        select(Account).options(*options).where(criteria)
                     )
                 )
                 .unique()
@@ -70,8 +125,12 @@ class BankAccountDomainRepo(DomainRepository):
             aggregate = Account(
                 id=bank_account.id,
                 account_number=bank_account.account_number,
-                balance=bank_account.balance,
+                balance=bank_account.balance
+                + bank_account.slots_balance
+                + (bank_account.ledger_balance if is_ledger else 0),
                 client_cpf=bank_account.client_cpf,
+                balance_slots=bank_account.balance_slots,
+                version=bank_account.version,
                 transactions=[
                     Transaction(
                         id=transaction.id,
@@ -80,56 +139,411 @@ class BankAccountDomainRepo(DomainRepository):
                         date=transaction.date,
                         account_number=transaction.account_number,
                         destination_account_number=transaction.destination_account_number,
+                        balance_after=transaction.balance_after,
+                        destination_balance_after=transaction.destination_balance_after,
                     )
                     for transaction in bank_account.transactions
-                ],
+                ]
+                if with_transactions
+                else [],
             )
         return aggregate
 
+    @retry_on_serialization_failure
     async def add(
         self,
         account: Account,
         operation_type: OperationType,
     ) -> UUID:
-        """Adiciona ou atualiza uma conta bancária no banco de dados."""
+        """
+        Adiciona ou atualiza uma conta bancária no banco de dados e, após o commit,
+        invalida a conta (inclusive o número anterior, se renumerada) no cache de contas.
+        """
+        previous_account_number: str | None = None
         async with self:
             try:
                 data: dict = {
                     "account_number": account.account_number,
-                    "balance": account.balance,
                     "client_cpf": account.client_cpf,
+                    "balance_slots": account.balance_slots,
                 }
 
                 match operation_type:
                     case OperationType.INSERT:
-                        operation = insert(Account).values(data).returning(Account.id)
-                        result = await self.session.execute(operation)
+                        operation = (
+                            insert(Account)
+                            .values(data | {"balance": account.balance})
+                            .returning(Account.id)
+                        )
+                        account.id = (
+                            await self.session.execute(operation)
+                        ).scalar_one()
+                        await self.__create_balance_slots(account)
 
                     case OperationType.UPDATE:
+                        # O número anterior é invalidado no cache, caso a conta
+                        # tenha sido renumerada
+                        previous_account_number = (
+                            await self.session.execute(
+                                select(Account.account_number)
+                                .where(Account.id == account.id)
+                                .with_for_update()
+                            )
+                        ).scalar_one_or_none()
                         operation = (
-                            update(Account).where(Account.id == account.id).values(data)
+                            update(Account)
+                            .where(Account.id == account.id)
+                            .values(data | {"version": Account.version + 1})
                         )
                         await self.session.execute(operation)
+                        await self.__redistribute_balance_slots(account)
 
+                await self._publish_events(account)
                 await self.commit()
-            except Exception as error:
+            except Exception:
                 await self.rollback()
-                raise error
+                raise
+
+        await ACCOUNT_CACHE.invalidate(
+            account.account_number, previous_account_number, ids=(account.id,)
+        )
+        return account.id
+
+    @retry_on_serialization_failure
+    async def add_batch(
+        self, accounts: Sequence[Account]
+    ) -> list[Account | HTTPException]:
+        """
+        Cadastra um lote de contas bancárias em uma única transação de banco de dados.
+        Os números já cadastrados e os clientes inexistentes são verificados com uma
+        consulta cada (os clientes encontrados são bloqueados contra remoção até o
+        commit), e as contas válidas são inseridas com um único INSERT ... RETURNING.
+        Retorna, na ordem do lote, a conta criada ou o erro de cada item.
+        """
+        async with self:
+            try:
+                await self._set_isolation_level(self.locking_isolation_level)
+                account_numbers = [account.account_number for account in accounts]
+                registered_account_numbers = set(
+                    (
+                        await self.session.execute(
+                            select(Account.account_number).where(
+                                Account.account_number.in_(account_numbers)
+                            )
+                        )
+                    ).scalars()
+                )
+                client_cpfs = {account.client_cpf for account in accounts}
+                registered_client_cpfs = set(
+                    (
+                        await self.session.execute(
+                            select(Client.cpf)
+                            .where(Client.cpf.in_(client_cpfs))
+                            .with_for_update(read=True, key_share=True)
+                        )
+                    ).scalars()
+                )
+
+                new_accounts = [
+                    account
+                    for account in accounts
+                    if account.account_number not in registered_account_numbers
+                    and account.client_cpf in registered_client_cpfs
+                ]
+                if new_accounts:
+                    operation = (
+                        pg_insert(Account)
+                        .on_conflict_do_nothing(index_elements=["account_number"])
+                        .returning(Account.id, Account.account_number)
+                    )
+                    result = (
+                        await self.session.execute(
+                            operation,
+                            [
+                                {
+                                    "account_number": account.account_number,
+                                    "balance": account.balance,
+                                    "client_cpf": account.client_cpf,
+                                    "balance_slots": account.balance_slots,
+                                }
+                                for account in new_accounts
+                            ],
+                        )
+                    ).all()
+                    result_ids = {account_number: id for id, account_number in result}
+                    for account in new_accounts:
+                        account.id = result_ids.get(account.account_number)
+                    new_accounts = [account for account in new_accounts if account.id]
+                    await self.__create_balance_slots(*new_accounts)
+                    await self._publish_events(*new_accounts)
+
+                await self.commit()
+            except Exception:
+                await self.rollback()
+                raise
+
+        results: list[Account | HTTPException] = []
+        for account in accounts:
+            if account.id:
+                results.append(account)
+            elif account.client_cpf not in registered_client_cpfs:
+                results.append(ClientNotFound())
+            else:
+                results.append(BankAccountAlreadyRegistered())
+
+        return results
+
+    async def __create_balance_slots(self, *accounts: Account) -> None:
+        """Cria as parcelas (slots) de saldo zeradas das contas particionadas."""
+        slots = [
+            {"account_number": account.account_number, "slot": slot, "balance": 0}
+            for account in accounts
+            for slot in range(account.balance_slots)
+        ]
+        if not slots:
+            return
+
+        await self.session.execute(insert(BalanceSlot), slots)
+
+    async def __redistribute_balance_slots(self, account: Account) -> None:
+        """
+        Consolida as parcelas existentes no saldo principal da conta e recria a
+        quantidade de parcelas configurada. A linha da conta já está bloqueada pela
+        atualização anterior, e as parcelas são bloqueadas antes de serem somadas.
+        """
+        slot_balances = (
+            (
+                await self.session.execute(
+                    select(BalanceSlot.balance)
+                    .where(BalanceSlot.account_number == account.account_number)
+                    .with_for_update()
+                )
+            )
+            .scalars()
+            .all()
+        )
 
-            result_id: UUID | None = account.id
-            if not result_id:
-                result_id = result.scalar_one_or_none()
+        if slot_balances:
+            await self.session.execute(
+                delete(BalanceSlot).where(
+                    BalanceSlot.account_number == account.account_number
+                )
+            )
+            await self.session.execute(
+                update(Account)
+                .where(Account.id == account.id)
+                .values(
+                    balance=Account.balance + sum(slot_balances),
+                    version=Account.version + 1,
+                )
+            )
 
-        return result_id
+        await self.__create_balance_slots(account)
 
+    @retry_on_serialization_failure
     async def remove(self, account: Account) -> None:
-        """Remove uma conta bancária do banco de dados."""
+        """Remove uma conta bancária do banco de dados e a invalida no cache de contas."""
         async with self:
             try:
                 operation = delete(Account).where(Account.id == account.id)
 
                 await self.session.execute(operation)
                 await self.commit()
-            except Exception as error:
+            except Exception:
                 await self.rollback()
-                raise error
+                raise
+
+        await ACCOUNT_CACHE.invalidate(account.account_number, ids=(account.id,))
+
+    async def query_account_numbers_pending_snapshot(
+        self, min_entries: int
+    ) -> list[str]:
+        """Consulta as contas com ao menos min_entries movimentações no razão desde o último ponto de verificação."""
+        async with self:
+            account_numbers = (
+                (
+                    await self.session.execute(
+                        select(Account.account_number).where(
+                            Account.ledger_pending_entries >= min_entries
+                        )
+                    )
+                )
+                .scalars()
+                .all()
+            )
+
+        return list(account_numbers)
+
+    @retry_on_serialization_failure
+    async def add_balance_snapshot(self, account_number: str) -> bool:
+        """
+        Grava um ponto de verificação do saldo lançado no razão da conta, retornando se
+        ele foi criado. O bloqueio consultivo exclusivo da conta aguarda os lançamentos
+        em andamento e impede novos até o commit, de modo que nenhuma movimentação com
+        sequência menor que a do ponto de verificação fique de fora dele.
+        """
+        async with self:
+            try:
+                await self._set_isolation_level(IsolationLevel.READ_COMMITTED)
+                await self.session.execute(
+                    select(
+                        func.pg_advisory_xact_lock(
+                            LEDGER_POSTING_LOCK_NAMESPACE, func.hashtext(account_number)
+                        )
+                    )
+                )
+
+                last_sequence = (
+                    select(func.max(Transaction.sequence))
+                    .where(
+                        Transaction.ledger,
+                        or_(
+                            Transaction.account_number == account_number,
+                            Transaction.destination_account_number == account_number,
+                        ),
+                    )
+                    .scalar_subquery()
+                )
+                operation = (
+                    pg_insert(BalanceSnapshot)
+                    .from_select(
+                        ["account_number", "sequence", "ledger_balance"],
+                        select(
+                            Account.account_number,
+                            last_sequence,
+                            Account.ledger_balance,
+                        ).where(
+                            Account.account_number == account_number,
+                            last_sequence.is_not(None),
+                        ),
+                    )
+                    .on_conflict_do_nothing()
+                    .returning(BalanceSnapshot.sequence)
+                )
+                created = (
+                    await self.session.execute(operation)
+                ).scalar_one_or_none() is not None
+
+                await self.commit()
+            except Exception:
+                await self.rollback()
+                raise
+
+        return created
+
+    @retry_on_serialization_failure
+    async def project_daily_rollups(self, batch_size: int) -> int:
+        """
+        Agrega nos totais diários das contas até batch_size transações posteriores à
+        marca d'água da projeção, em ordem de lançamento, retornando quantas foram
+        agregadas. A marca d'água é bloqueada e avançada na mesma transação de banco
+        de dados em que os totais são somados, de modo que cada transação é contada
+        exatamente uma vez sem que as transações sejam reescritas; uma execução
+        concorrente encontra a marca d'água bloqueada e não agrega nada (SKIP LOCKED).
+        Como a ordem de lançamento é atribuída antes do commit, a projeção avança
+        apenas sobre ordens contíguas: uma lacuna logo após a marca d'água é aguardada
+        por até TRANSACTION_ROLLUP_GAP_TIMEOUT_MS e, então, tratada como transação
+        desfeita. O dia é o da data da transação no fuso horário ROLLUP_TIMEZONE.
+        """
+        async with self:
+            try:
+                await self._set_isolation_level(self.locking_isolation_level)
+                watermark = await self.__lock_rollup_watermark()
+                if not watermark:
+                    return 0
+
+                pending = (
+                    await self.session.execute(
+                        select(
+                            Transaction.sequence,
+                            Transaction.account_number,
+                            Transaction.destination_account_number,
+                            Transaction.type,
+                            Transaction.amount,
+                            cast(
+                                func.timezone(ROLLUP_TIMEZONE, Transaction.date), Date
+                            ),
+                        )
+                        .where(Transaction.sequence > watermark.sequence)
+                        .order_by(Transaction.sequence)
+                        .limit(batch_size)
+                    )
+                ).all()
+                now = datetime.now(UTC)
+                gap_timed_out = watermark.gap_detected_at is not None and (
+                    now - watermark.gap_detected_at
+                    >= timedelta(milliseconds=TRANSACTION_ROLLUP_GAP_TIMEOUT_MS)
+                )
+                transactions = take_contiguous_transactions(
+                    pending, watermark.sequence, skip_leading_gap=gap_timed_out
+                )
+                if transactions:
+                    watermark.sequence = transactions[-1][0]
+                    watermark.gap_detected_at = None
+                elif pending and not watermark.gap_detected_at:
+                    watermark.gap_detected_at = now
+
+                # Os totais são somados em ordem de conta, dia e tipo
+                rollups = build_daily_rollups(
+                    transaction[1:] for transaction in transactions
+                )
+                if rollups:
+                    operation = pg_insert(DailyRollup).values(
+                        [
+                            {
+                                "account_number": rollup.account_number,
+                                "day": rollup.day,
+                                "type": rollup.type,
+                                "count": rollup.count,
+                                "credits": rollup.credits,
+                                "debits": rollup.debits,
+                            }
+                            for rollup in rollups
+                        ]
+                    )
+                    await self.session.execute(
+                        operation.on_conflict_do_update(
+                            index_elements=["account_number", "day", "type"],
+                            set_={
+                                "count": DailyRollup.count
+                                + operation.excluded["count"],
+                                "credits": DailyRollup.credits
+                                + operation.excluded["credits"],
+                                "debits": DailyRollup.debits
+                                + operation.excluded["debits"],
+                            },
+                        )
+                    )
+
+                await self.commit()
+            except Exception:
+                await self.rollback()
+                raise
+
+        return len(transactions)
+
+    async def __lock_rollup_watermark(self) -> RollupWatermark | None:
+        """
+        Bloqueia a marca d'água da projeção dos totais diários, criando-a na primeira
+        execução. Retorna None se ela estiver bloqueada por outra execução.
+        """
+        lock_watermark = (
+            select(RollupWatermark)
+            .where(RollupWatermark.name == DAILY_ROLLUP_WATERMARK)
+            .with_for_update(skip_locked=True)
+        )
+        watermark = (await self.session.execute(lock_watermark)).scalar_one_or_none()
+        if watermark:
+            return watermark
+
+        created = (
+            await self.session.execute(
+                pg_insert(RollupWatermark)
+                .values(name=DAILY_ROLLUP_WATERMARK, sequence=0)
+                .on_conflict_do_nothing(index_elements=["name"])
+                .returning(RollupWatermark.name)
+            )
+        ).scalar_one_or_none()
+        if not created:
+            return None
+        return (await self.session.execute(lock_watermark)).scalar_one()
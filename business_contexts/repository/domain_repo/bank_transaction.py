@@ -1,90 +1,823 @@
-from uuid import UUID
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from decimal import Decimal
+from typing import Any
+from uuid import UUID, uuid4
 
-from sqlalchemy import update, insert, select
+from fastapi import HTTPException
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    Integer,
+    Numeric,
+    Select,
+    String,
+    Uuid,
+    cast,
+    exists,
+    func,
+    insert,
+    literal,
+    null,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 
 from business_contexts.domain.aggregates.bank_account import Account
 from business_contexts.domain.aggregates.bank_transaction import Transaction
+from business_contexts.domain.entities.bank_transaction import (
+    CreateBankTransaction,
+)
+from business_contexts.domain.exceptions import (
+    BankAccountNotFound,
+    IdempotentRequestAlreadyProcessed,
+    InsufficientBalanceForTransaction,
+    NegativeTransactionAmount,
+)
+from business_contexts.domain.value_objects.bank_account import BalanceSlot
 from business_contexts.domain.value_objects.bank_transaction import (
     TransactionType,
 )
-from libs.ddd.adapters.repository import DomainRepository
+from business_contexts.domain.value_objects.idempotency import IdempotencyRecord
+from business_contexts.repository.cache import ACCOUNT_CACHE
+from business_contexts.utils.base_types import IsolationLevel, PostingStrategy
+from business_contexts.utils.constants import (
+    BALANCE_CHECK_CONSTRAINT,
+    LEDGER_DEBIT_LOCK_NAMESPACE,
+    LEDGER_POSTING_LOCK_NAMESPACE,
+    OPTIMISTIC_POSTING_MAX_ATTEMPTS,
+    TRANSACTION_POSTING_STRATEGY,
+)
+from infra.database import DEFAULT_SQL_SESSION_FACTORY
+from libs.ddd.adapters.repository import (
+    DomainRepository,
+    retry_on_serialization_failure,
+)
+from libs.metrics import METRICS
 
 
 class BankTransactionDomainRepo(DomainRepository):
     """Repositório de domínio para operações de escrita de transações bancárias."""
 
+    def __init__(
+        self,
+        session_factory: Any = DEFAULT_SQL_SESSION_FACTORY,
+        posting_strategy: PostingStrategy | str = TRANSACTION_POSTING_STRATEGY,
+    ) -> None:
+        """Inicializa o repositório com a factory de sessão e a estratégia de lançamento."""
+        super().__init__(session_factory=session_factory)
+        self.posting_strategy = PostingStrategy(posting_strategy)
+
+    @retry_on_serialization_failure
     async def add(
         self,
         transaction: Transaction,
+        idempotency_record: IdempotencyRecord | None = None,
     ) -> UUID:
-        """Adiciona uma transação bancária e atualiza os saldos das contas envolvidas."""
+        """
+        Adiciona uma transação bancária e atualiza os saldos das contas envolvidas.
+        Se informado, o registro de idempotência é gravado na mesma transação de banco
+        de dados, e o lançamento é desfeito caso a chave já tenha sido confirmada.
+        Após o commit, as contas envolvidas são invalidadas no cache de contas.
+        """
         async with self:
             try:
-                await self.__lock_accounts_for_concurrency(
-                    transaction.account_number, transaction.destination_account_number
-                )
+                await self._set_isolation_level(self.__posting_isolation_level)
+                match self.posting_strategy:
+                    case PostingStrategy.ATOMIC:
+                        result_id = await self.__post_in_single_statement(transaction)
+                    case PostingStrategy.PESSIMISTIC:
+                        result_id = await self.__post_with_row_locks(transaction)
+                    case PostingStrategy.OPTIMISTIC:
+                        result_id = await self.__post_with_version_check(transaction)
+                    case PostingStrategy.LEDGER:
+                        result_id = await self.__post_to_ledger(transaction)
 
-                data: dict = {
-                    "type": transaction.type.value,
-                    "amount": transaction.amount,
-                    "date": transaction.date,
-                    "account_number": transaction.account_number,
-                    "destination_account_number": transaction.destination_account_number,
-                }
-                operation = insert(Transaction).values(data).returning(Transaction.id)
-                result = await self.session.execute(operation)
+                transaction.id = result_id
+                await self._publish_events(transaction)
+                if idempotency_record:
+                    await self.__store_idempotency_record(idempotency_record)
 
-                moved_amount = transaction.amount
-                if transaction.type in [
-                    TransactionType.WITHDRAWAL,
-                    TransactionType.TRANSFER,
-                ]:
-                    moved_amount *= -1
+                await self.commit()
+            except IntegrityError as error:
+                await self.rollback()
+                if BALANCE_CHECK_CONSTRAINT in str(error.orig):
+                    raise InsufficientBalanceForTransaction from error
+                raise
+            except Exception:
+                await self.rollback()
+                raise
 
-                update_origin_account_balance = (
-                    update(Account)
-                    .where(Account.account_number == transaction.account_number)
-                    .values(balance=Account.balance + moved_amount)
-                )
-                await self.session.execute(update_origin_account_balance)
+        await ACCOUNT_CACHE.invalidate(
+            transaction.account_number, transaction.destination_account_number
+        )
+        return result_id
 
-                if transaction.destination_account_number:
-                    update_destination_account_balance = (
-                        update(Account)
-                        .where(
-                            Account.account_number
-                            == transaction.destination_account_number
-                        )
-                        .values(balance=Account.balance + transaction.amount)
+    @retry_on_serialization_failure
+    async def add_batch(
+        self,
+        bank_transactions: Sequence[CreateBankTransaction],
+    ) -> list[Transaction | HTTPException]:
+        """
+        Aplica um lote de transações em uma única transação de banco de dados.
+        Todas as contas envolvidas são bloqueadas de uma vez (em ordem), as parcelas
+        das contas particionadas são consolidadas no saldo principal, cada operação
+        é validada pelo agregado Account sobre os saldos já atualizados pelas anteriores,
+        as transações válidas são inseridas com um único INSERT ... RETURNING e cada
+        conta alterada recebe uma única atualização de saldo. No modo razão, as contas
+        não são bloqueadas nem atualizadas, e as transações são apenas inseridas.
+        Após o commit, as contas envolvidas são invalidadas no cache de contas.
+        Retorna, na ordem do lote, a transação criada ou o erro de cada item.
+        """
+        is_ledger = self.posting_strategy == PostingStrategy.LEDGER
+        account_numbers = [
+            account_number
+            for bank_transaction in bank_transactions
+            for account_number in (
+                bank_transaction.account_number,
+                bank_transaction.destination_account_number or None,
+            )
+        ]
+        async with self:
+            try:
+                await self._set_isolation_level(self.__posting_isolation_level)
+                if is_ledger:
+                    accounts = await self.__lock_ledger_accounts(
+                        *account_numbers,
+                        debited=[
+                            bank_transaction.account_number
+                            for bank_transaction in bank_transactions
+                            if bank_transaction.type != TransactionType.DEPOSIT
+                        ],
+                    )
+                else:
+                    accounts = await self.__lock_accounts_for_concurrency(
+                        *account_numbers
+                    )
+                initial_balances = {
+                    account_number: account.balance
+                    for account_number, account in accounts.items()
+                }
+                striped_account_numbers = [
+                    account_number
+                    for account_number, account in accounts.items()
+                    if account.is_striped and not is_ledger
+                ]
+                if striped_account_numbers:
+                    consolidated_amounts = await self.__consolidate_balance_slots(
+                        *striped_account_numbers
                     )
-                    await self.session.execute(update_destination_account_balance)
+                    for account_number, amount in consolidated_amounts.items():
+                        accounts[account_number].balance += amount
+
+                results: list[Transaction | HTTPException] = []
+                for bank_transaction in bank_transactions:
+                    result = self.__apply_to_accounts(bank_transaction, accounts)
+                    if isinstance(result, Transaction) and not is_ledger:
+                        result.balance_after = accounts[result.account_number].balance
+                        if result.destination_account_number:
+                            result.destination_balance_after = accounts[
+                                result.destination_account_number
+                            ].balance
+                    results.append(result)
+
+                new_transactions = [
+                    result for result in results if isinstance(result, Transaction)
+                ]
+                if new_transactions:
+                    operation = insert(Transaction).returning(
+                        Transaction.id, sort_by_parameter_order=True
+                    )
+                    result_ids = (
+                        await self.session.execute(
+                            operation,
+                            [
+                                {
+                                    "type": transaction.type.value,
+                                    "amount": transaction.amount,
+                                    "date": transaction.date,
+                                    "account_number": transaction.account_number,
+                                    "destination_account_number": (
+                                        transaction.destination_account_number
+                                    ),
+                                    "ledger": is_ledger,
+                                    "balance_after": transaction.balance_after,
+                                    "destination_balance_after": (
+                                        transaction.destination_balance_after
+                                    ),
+                                }
+                                for transaction in new_transactions
+                            ],
+                        )
+                    ).scalars()
+                    for transaction, result_id in zip(new_transactions, result_ids):
+                        transaction.id = result_id
+                    await self._publish_events(*new_transactions)
+
+                changed_balances = [
+                    {
+                        "id": account.id,
+                        "balance": account.balance,
+                        "version": account.version + 1,
+                    }
+                    for account_number, account in accounts.items()
+                    if account.balance != initial_balances[account_number]
+                    and not is_ledger
+                ]
+                if changed_balances:
+                    await self.session.execute(update(Account), changed_balances)
 
                 await self.commit()
-            except Exception as error:
+            except Exception:
                 await self.rollback()
-                raise error
+                raise
+
+        await ACCOUNT_CACHE.invalidate(*account_numbers)
+        return results
+
+    @property
+    def __posting_isolation_level(self) -> IsolationLevel:
+        """
+        Nível de isolamento dos lançamentos. Todas as estratégias protegem os saldos
+        com bloqueios (de linha ou consultivos), então dispensam o snapshot do REPEATABLE
+        READ e suas falhas de serialização: o UPDATE condicional e o SELECT ... FOR UPDATE
+        reavaliam a linha na versão confirmada mais recente. O razão e o lançamento
+        otimista exigem READ COMMITTED, para que cada comando enxergue os lançamentos
+        e as versões das contas já confirmados.
+        """
+        if self.posting_strategy in [
+            PostingStrategy.LEDGER,
+            PostingStrategy.OPTIMISTIC,
+        ]:
+            return IsolationLevel.READ_COMMITTED
+        return self.locking_isolation_level
+
+    async def __store_idempotency_record(self, record: IdempotencyRecord) -> None:
+        """
+        Grava o registro de idempotência. Uma requisição concorrente do mesmo usuário com
+        a mesma chave aguarda a confirmação da primeira no índice único e, então, não insere nada.
+        """
+        operation = (
+            pg_insert(IdempotencyRecord)
+            .values(
+                user_id=record.user_id,
+                key=record.key,
+                request_hash=record.request_hash,
+                response=record.response,
+                created_at=record.created_at,
+            )
+            .on_conflict_do_nothing(index_elements=["user_id", "key"])
+            .returning(IdempotencyRecord.key)
+        )
+        if not (await self.session.execute(operation)).scalar_one_or_none():
+            raise IdempotentRequestAlreadyProcessed
+
+    @staticmethod
+    def __apply_to_accounts(
+        bank_transaction: CreateBankTransaction, accounts: dict[str, Account]
+    ) -> Transaction | HTTPException:
+        """Aplica uma operação do lote sobre as contas bloqueadas, retornando a transação ou o erro."""
+        origin_account = accounts.get(bank_transaction.account_number)
+        destination_account_number = bank_transaction.destination_account_number
+        if not origin_account or (
+            destination_account_number and destination_account_number not in accounts
+        ):
+            return BankAccountNotFound()
+
+        try:
+            transaction = origin_account.new_transaction(bank_transaction)
+        except HTTPException as error:
+            return error
+        except ValueError:
+            return NegativeTransactionAmount()
+
+        if transaction.type == TransactionType.TRANSFER:
+            accounts[destination_account_number].receive_transfer(transaction.amount)
+
+        return transaction
+
+    async def __post_in_single_statement(self, transaction: Transaction) -> UUID:
+        """
+        Lança a transação em um único comando (CTE), sem bloqueios explícitos.
+        O débito é condicional (balance >= amount): se nenhuma linha for atualizada,
+        nenhuma transação é inserida e o motivo da falha é apurado em seguida.
+        Débitos de contas particionadas não são tratados aqui, pois exigem a
+        consolidação das parcelas, e seguem pelo lançamento com bloqueio.
+        """
+        amount = transaction.amount
+        origin_account_number = transaction.account_number
+        destination_account_number = transaction.destination_account_number
+        is_self_transfer = destination_account_number == origin_account_number
+
+        if transaction.type in [TransactionType.WITHDRAWAL, TransactionType.TRANSFER]:
+            debited_amount = 0 if is_self_transfer else amount
+            origin_account = (
+                update(Account)
+                .where(
+                    Account.account_number == origin_account_number,
+                    Account.balance >= amount,
+                    Account.balance_slots == 0,
+                )
+                .values(
+                    balance=Account.balance - debited_amount,
+                    version=Account.version + 1,
+                )
+                .returning(Account.account_number, Account.balance)
+                .cte("origin_account")
+            )
+            origin_applied = exists(select(origin_account.c.account_number))
+            origin_balance_after = select(origin_account.c.balance).scalar_subquery()
+        else:
+            origin_applied, origin_balance_after = self.__credit_applied(
+                origin_account_number, amount, "origin_account"
+            )
+
+        destination_applied = None
+        destination_balance_after = null()
+        if destination_account_number and is_self_transfer:
+            destination_balance_after = origin_balance_after
+        elif destination_account_number:
+            destination_applied, destination_balance_after = self.__credit_applied(
+                destination_account_number,
+                amount,
+                "destination_account",
+                origin_applied,
+            )
+
+        posted_transaction = select(
+            literal(transaction.id or uuid4(), Uuid),
+            literal(transaction.type.value, String),
+            literal(amount, Numeric),
+            literal(transaction.date, DateTime(timezone=True)),
+            literal(origin_account_number, String),
+            literal(destination_account_number, String),
+            origin_balance_after,
+            destination_balance_after,
+        ).where(origin_applied)
+
+        if destination_applied is not None:
+            posted_transaction = posted_transaction.where(destination_applied)
+
+        operation = (
+            insert(Transaction)
+            .from_select(
+                [
+                    "id",
+                    "type",
+                    "amount",
+                    "date",
+                    "account_number",
+                    "destination_account_number",
+                    "balance_after",
+                    "destination_balance_after",
+                ],
+                posted_transaction,
+            )
+            .returning(Transaction.id)
+        )
+        result_id = (await self.session.execute(operation)).scalar_one_or_none()
 
-            result_id: UUID | None = transaction.id
-            if not result_id:
-                result_id = result.scalar_one_or_none()
+        if not result_id:
+            result_id = await self.__resolve_posting_miss(transaction)
 
         return result_id
 
-    async def __lock_accounts_for_concurrency(
-        self, origin_account_number: str, destination_account_number: str | None = None
-    ) -> None:
-        """Bloqueia as contas envolvidas para evitar problemas de concorrência."""
-        lock_origin_account = (
-            select(Account)
-            .where(Account.account_number == origin_account_number)
-            .with_for_update()
+    @staticmethod
+    def __credit_applied(
+        account_number: str, amount: Decimal, name: str, *guards: Any
+    ) -> tuple[ColumnElement[bool], ColumnElement]:
+        """
+        Monta o crédito de uma conta como CTEs e retorna a condição que indica se ele
+        foi aplicado e o saldo da conta após o crédito. Em contas particionadas o valor
+        cai em uma parcela sorteada, sem tocar a linha da conta, e o saldo após o crédito
+        fica nulo, pois os créditos concorrentes nas demais parcelas não são ordenados;
+        nas demais contas, o valor cai no saldo principal.
+        """
+        drawn_slot = (
+            select(cast(func.floor(func.random() * Account.balance_slots), Integer))
+            .where(Account.account_number == account_number, Account.balance_slots > 0)
+            .scalar_subquery()
         )
-        await self.session.execute(lock_origin_account)
+        credited_slot = (
+            update(BalanceSlot)
+            .where(
+                BalanceSlot.account_number == account_number,
+                BalanceSlot.slot == drawn_slot,
+                *guards,
+            )
+            .values(balance=BalanceSlot.balance + amount)
+            .returning(BalanceSlot.account_number)
+            .cte(f"{name}_slot")
+        )
+        credited_account = (
+            update(Account)
+            .where(
+                Account.account_number == account_number,
+                Account.balance_slots == 0,
+                *guards,
+            )
+            .values(balance=Account.balance + amount, version=Account.version + 1)
+            .returning(Account.account_number, Account.balance)
+            .cte(name)
+        )
+
+        return (
+            or_(
+                exists(select(credited_account.c.account_number)),
+                exists(select(credited_slot.c.account_number)),
+            ),
+            select(credited_account.c.balance).scalar_subquery(),
+        )
+
+    async def __resolve_posting_miss(self, transaction: Transaction) -> UUID:
+        """
+        Identifica por que o lançamento atômico não afetou nenhuma linha. Débitos de
+        contas particionadas são refeitos pelo lançamento com bloqueio.
+        """
+        account_numbers = {
+            transaction.account_number,
+            transaction.destination_account_number,
+        } - {None}
+        balance_slots_by_account = dict(
+            (
+                await self.session.execute(
+                    select(Account.account_number, Account.balance_slots).where(
+                        Account.account_number.in_(account_numbers)
+                    )
+                )
+            ).all()
+        )
+
+        if len(balance_slots_by_account) != len(account_numbers):
+            raise BankAccountNotFound
+        if balance_slots_by_account[transaction.account_number] > 0:
+            return await self.__post_with_row_locks(transaction)
+        raise InsufficientBalanceForTransaction
+
+    async def __post_with_row_locks(self, transaction: Transaction) -> UUID:
+        """
+        Lança a transação bloqueando as contas envolvidas com SELECT FOR UPDATE.
+        Contas particionadas que apenas recebem crédito não são bloqueadas. A existência
+        das contas e o saldo da conta debitada são verificados no próprio lançamento.
+        """
+        origin_account_number = transaction.account_number
+        destination_account_number = transaction.destination_account_number
+        is_debit = transaction.type in [
+            TransactionType.WITHDRAWAL,
+            TransactionType.TRANSFER,
+        ]
+
+        credited_account_numbers = [destination_account_number]
+        if not is_debit:
+            credited_account_numbers.append(origin_account_number)
+        elif destination_account_number == origin_account_number:
+            credited_account_numbers = []
 
+        accounts = await self.__lock_accounts_for_concurrency(
+            origin_account_number,
+            destination_account_number,
+            skip_striped=credited_account_numbers,
+        )
+
+        if is_debit:
+            origin_account = accounts.get(origin_account_number)
+            if not origin_account:
+                raise BankAccountNotFound
+            consolidated_amount = Decimal(0)
+            if origin_account.is_striped:
+                consolidated_amount = (
+                    await self.__consolidate_balance_slots(origin_account_number)
+                ).get(origin_account_number, Decimal(0))
+            if origin_account.balance + consolidated_amount < transaction.amount:
+                raise InsufficientBalanceForTransaction
+
+            update_origin_account_balance = (
+                update(Account)
+                .where(Account.account_number == origin_account_number)
+                .values(
+                    balance=Account.balance + consolidated_amount - transaction.amount,
+                    version=Account.version + 1,
+                )
+                .returning(Account.balance)
+            )
+            balance_after = (
+                await self.session.execute(update_origin_account_balance)
+            ).scalar_one_or_none()
+        else:
+            balance_after = await self.__credit(
+                origin_account_number, transaction.amount
+            )
+
+        destination_balance_after = None
         if destination_account_number:
-            lock_destination_account = (
-                select(Account)
-                .where(Account.account_number == destination_account_number)
+            destination_balance_after = await self.__credit(
+                destination_account_number, transaction.amount
+            )
+            if destination_account_number == origin_account_number:
+                balance_after = destination_balance_after
+
+        return await self.__insert_posted_transaction(
+            transaction, balance_after, destination_balance_after
+        )
+
+    async def __insert_posted_transaction(
+        self,
+        transaction: Transaction,
+        balance_after: Decimal | None,
+        destination_balance_after: Decimal | None,
+    ) -> UUID:
+        """Insere a transação lançada, com os saldos das contas após o lançamento."""
+        data: dict = {
+            "type": transaction.type.value,
+            "amount": transaction.amount,
+            "date": transaction.date,
+            "account_number": transaction.account_number,
+            "destination_account_number": transaction.destination_account_number,
+            "balance_after": balance_after,
+            "destination_balance_after": destination_balance_after,
+        }
+        if transaction.id:
+            data["id"] = transaction.id
+        operation = insert(Transaction).values(data).returning(Transaction.id)
+        result = await self.session.execute(operation)
+
+        result_id: UUID | None = transaction.id
+        if not result_id:
+            result_id = result.scalar_one_or_none()
+
+        return result_id
+
+    async def __post_with_version_check(self, transaction: Transaction) -> UUID:
+        """
+        Lança a transação com concorrência otimista: as contas são lidas sem bloqueio,
+        o lançamento é validado pelo agregado Account e os novos saldos são gravados
+        com compare-and-swap (UPDATE ... WHERE version = :version), em ordem crescente
+        de número de conta, ao final de um savepoint. Se outra transação alterou alguma
+        das contas desde a leitura, o savepoint é desfeito e o lançamento é refeito
+        sobre as versões atuais, até OPTIMISTIC_POSTING_MAX_ATTEMPTS vezes. Contas
+        particionadas, que concentram lançamentos concorrentes, e lançamentos que
+        esgotam as tentativas seguem pelo lançamento com bloqueio.
+        """
+        origin_account_number = transaction.account_number
+        destination_account_number = transaction.destination_account_number
+
+        for _ in range(OPTIMISTIC_POSTING_MAX_ATTEMPTS):
+            accounts = await self.__load_accounts(
+                self.__select_accounts(
+                    origin_account_number, destination_account_number
+                )
+            )
+            origin_account = accounts.get(origin_account_number)
+            if not origin_account or (
+                destination_account_number
+                and destination_account_number not in accounts
+            ):
+                raise BankAccountNotFound
+            if any(account.is_striped for account in accounts.values()):
+                return await self.__post_with_row_locks(transaction)
+
+            match transaction.type:
+                case TransactionType.DEPOSIT:
+                    origin_account.perform_deposit(transaction.amount)
+                case TransactionType.WITHDRAWAL:
+                    origin_account.perform_withdrawal(transaction.amount)
+                case TransactionType.TRANSFER:
+                    origin_account.perform_transfer(
+                        transaction.amount, destination_account_number
+                    )
+                    accounts[destination_account_number].receive_transfer(
+                        transaction.amount
+                    )
+
+            savepoint = await self.session.begin_nested()
+            result_id = await self.__insert_posted_transaction(
+                transaction,
+                origin_account.balance,
+                accounts[destination_account_number].balance
+                if destination_account_number
+                else None,
+            )
+            if await self.__swap_account_versions(accounts.values()):
+                await savepoint.commit()
+                return result_id
+
+            await savepoint.rollback()
+            METRICS.increment("optimistic_posting_conflicts")
+
+        METRICS.increment("optimistic_posting_fallbacks")
+        return await self.__post_with_row_locks(transaction)
+
+    async def __swap_account_versions(self, accounts: Iterable[Account]) -> bool:
+        """
+        Grava os saldos das contas apenas se as versões lidas ainda forem as atuais,
+        incrementando-as. Retorna se todas as contas foram atualizadas.
+        """
+        for account in sorted(accounts, key=lambda account: account.account_number):
+            swapped = (
+                await self.session.execute(
+                    update(Account)
+                    .where(Account.id == account.id, Account.version == account.version)
+                    .values(balance=account.balance, version=account.version + 1)
+                    .returning(Account.id)
+                )
+            ).scalar_one_or_none()
+            if not swapped:
+                return False
+
+        return True
+
+    async def __post_to_ledger(self, transaction: Transaction) -> UUID:
+        """
+        Lança a transação apenas no razão (ledger): a transação é inserida e as linhas
+        das contas não são atualizadas, pois o saldo é calculado a partir do último
+        ponto de verificação somado às movimentações posteriores.
+        """
+        origin_account_number = transaction.account_number
+        destination_account_number = transaction.destination_account_number
+        is_debit = transaction.type in [
+            TransactionType.WITHDRAWAL,
+            TransactionType.TRANSFER,
+        ]
+
+        accounts = await self.__lock_ledger_accounts(
+            origin_account_number,
+            destination_account_number,
+            debited=[origin_account_number] if is_debit else [],
+        )
+        origin_account = accounts.get(origin_account_number)
+        if not origin_account or (
+            destination_account_number and destination_account_number not in accounts
+        ):
+            raise BankAccountNotFound
+        if is_debit and origin_account.balance < transaction.amount:
+            raise InsufficientBalanceForTransaction
+
+        data: dict = {
+            "type": transaction.type.value,
+            "amount": transaction.amount,
+            "date": transaction.date,
+            "account_number": origin_account_number,
+            "destination_account_number": destination_account_number,
+            "ledger": True,
+        }
+        if transaction.id:
+            data["id"] = transaction.id
+        operation = insert(Transaction).values(data).returning(Transaction.id)
+
+        return (await self.session.execute(operation)).scalar_one()
+
+    async def __lock_ledger_accounts(
+        self, *account_numbers: str | None, debited: Sequence[str]
+    ) -> dict[str, Account]:
+        """
+        Prepara um lançamento no razão sem bloquear as linhas das contas. Na transação
+        (em READ COMMITTED), adquire bloqueios consultivos (advisory locks) em ordem crescente
+        de número de conta: compartilhados em todas as contas envolvidas, para que o
+        ponto de verificação aguarde os lançamentos em andamento, e exclusivos nas contas
+        debitadas, para que dois débitos da mesma conta não validem o mesmo saldo.
+        Retorna as contas (sem histórico) com o saldo efetivo, indexadas pelo número.
+        """
+        involved_account_numbers = sorted(set(account_numbers) - {None})
+        for account_number in involved_account_numbers:
+            await self.session.execute(
+                select(
+                    func.pg_advisory_xact_lock_shared(
+                        LEDGER_POSTING_LOCK_NAMESPACE, func.hashtext(account_number)
+                    )
+                )
+            )
+        for account_number in sorted(set(debited)):
+            await self.session.execute(
+                select(
+                    func.pg_advisory_xact_lock(
+                        LEDGER_DEBIT_LOCK_NAMESPACE, func.hashtext(account_number)
+                    )
+                )
+            )
+
+        ledger_accounts = (
+            await self.session.execute(
+                select(
+                    Account.id,
+                    Account.account_number,
+                    (
+                        Account.balance + Account.slots_balance + Account.ledger_balance
+                    ).label("balance"),
+                    Account.client_cpf,
+                    Account.balance_slots,
+                ).where(Account.account_number.in_(involved_account_numbers))
+            )
+        ).all()
+
+        return {
+            account.account_number: Account(
+                id=account.id,
+                account_number=account.account_number,
+                balance=account.balance,
+                client_cpf=account.client_cpf,
+                balance_slots=account.balance_slots,
+            )
+            for account in ledger_accounts
+        }
+
+    async def __credit(self, account_number: str, amount: Decimal) -> Decimal | None:
+        """
+        Credita um valor na conta (ou em uma parcela sorteada, se particionada),
+        retornando o saldo da conta após o crédito (nulo para contas particionadas).
+        Lança BankAccountNotFound se nenhuma conta for creditada.
+        """
+        credit_applied, balance_after = self.__credit_applied(
+            account_number, amount, "credited_account"
+        )
+        applied, balance = (
+            await self.session.execute(select(credit_applied, balance_after))
+        ).one()
+        if not applied:
+            raise BankAccountNotFound
+        return balance
+
+    async def __consolidate_balance_slots(
+        self, *account_numbers: str
+    ) -> dict[str, Decimal]:
+        """
+        Bloqueia e zera as parcelas de saldo das contas particionadas informadas,
+        retornando o valor retirado de cada conta para ser somado ao saldo principal.
+        """
+        slots = (
+            await self.session.execute(
+                select(BalanceSlot.account_number, BalanceSlot.balance)
+                .where(BalanceSlot.account_number.in_(account_numbers))
+                .order_by(BalanceSlot.account_number, BalanceSlot.slot)
                 .with_for_update()
             )
-            await self.session.execute(lock_destination_account)
+        ).all()
+
+        consolidated_amounts: dict[str, Decimal] = defaultdict(Decimal)
+        for slot in slots:
+            consolidated_amounts[slot.account_number] += slot.balance
+
+        await self.session.execute(
+            update(BalanceSlot)
+            .where(
+                BalanceSlot.account_number.in_(account_numbers),
+                BalanceSlot.balance != 0,
+            )
+            .values(balance=0)
+        )
+
+        return consolidated_amounts
+
+    async def __lock_accounts_for_concurrency(
+        self,
+        *account_numbers: str | None,
+        skip_striped: Sequence[str | None] = (),
+    ) -> dict[str, Account]:
+        """
+        Bloqueia as contas envolvidas para evitar problemas de concorrência.
+        As contas são bloqueadas sempre em ordem crescente de número, de modo que
+        transferências opostas entre as mesmas contas não entrem em deadlock.
+        Contas particionadas listadas em skip_striped não são bloqueadas.
+        Retorna as contas bloqueadas (sem histórico) indexadas pelo número.
+        """
+        lock_accounts = self.__select_accounts(*account_numbers).with_for_update()
+        if skip_striped:
+            lock_accounts = lock_accounts.where(
+                or_(
+                    Account.balance_slots == 0,
+                    Account.account_number.not_in(set(skip_striped) - {None}),
+                )
+            )
+        return await self.__load_accounts(lock_accounts)
+
+    async def __load_accounts(self, accounts_query: Select) -> dict[str, Account]:
+        """Executa a consulta das contas e monta os agregados, indexados pelo número."""
+        return {
+            account.account_number: Account(
+                id=account.id,
+                account_number=account.account_number,
+                balance=account.balance,
+                client_cpf=account.client_cpf,
+                balance_slots=account.balance_slots,
+                version=account.version,
+            )
+            for account in (await self.session.execute(accounts_query)).all()
+        }
+
+    @staticmethod
+    def __select_accounts(*account_numbers: str | None) -> Select:
+        """Monta a consulta das contas envolvidas (sem histórico), em ordem de número."""
+        return (
+            select(
+                Account.id,
+                Account.account_number,
+                Account.balance,
+                Account.client_cpf,
+                Account.balance_slots,
+                Account.version,
+            )
+            .where(Account.account_number.in_(sorted(set(account_numbers) - {None})))
+            .order_by(Account.account_number)
+        )
@@ -0,0 +1,494 @@
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from sqlalchemy import (
+    CTE,
+    BigInteger,
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    Numeric,
+    Select,
+    String,
+    Table,
+    Uuid,
+    and_,
+    case,
+    exists,
+    false,
+    func,
+    literal,
+    null,
+    select,
+    true,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.schema import CreateTable
+
+from business_contexts.domain.aggregates.bank_account import Account
+from business_contexts.domain.aggregates.bank_transaction import Transaction
+from business_contexts.domain.aggregates.client import Client
+from business_contexts.domain.value_objects.bank_account import BalanceSlot
+from business_contexts.domain.value_objects.bank_transaction import TransactionType
+from business_contexts.domain.value_objects.bulk_import import (
+    ImportCheckpoint,
+    ImportKind,
+)
+from business_contexts.utils.base_types import PostingStrategy
+from business_contexts.utils.constants import TRANSACTION_POSTING_STRATEGY
+from infra.database import DEFAULT_SQL_SESSION_FACTORY
+from libs.ddd.adapters.repository import (
+    DomainRepository,
+    retry_on_serialization_failure,
+)
+
+# Tabelas temporárias de carga, criadas a cada lote e descartadas no commit. Ficam fora
+# dos metadados do ORM para não serem criadas junto com as tabelas da aplicação.
+staging_metadata = MetaData()
+
+client_staging_table = Table(
+    "import_staging_client",
+    staging_metadata,
+    Column("line", BigInteger, nullable=False),
+    Column("name", String, nullable=False),
+    Column("cpf", String, nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+bank_account_staging_table = Table(
+    "import_staging_bank_account",
+    staging_metadata,
+    Column("line", BigInteger, nullable=False),
+    Column("account_number", String, nullable=False),
+    Column("balance", Numeric, nullable=False),
+    Column("client_cpf", String, nullable=False),
+    Column("balance_slots", Integer, nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+bank_transaction_staging_table = Table(
+    "import_staging_bank_transaction",
+    staging_metadata,
+    Column("line", BigInteger, nullable=False),
+    Column("id", Uuid, nullable=False),
+    Column("type", String, nullable=False),
+    Column("amount", Numeric, nullable=False),
+    Column("date", DateTime(timezone=True), nullable=False),
+    Column("account_number", String, nullable=False),
+    Column("destination_account_number", String, nullable=True),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+
+class BulkImportDomainRepo(DomainRepository):
+    """
+    Repositório de domínio para a importação em massa de clientes, contas e transações.
+    Cada lote é copiado com COPY para uma tabela temporária e incorporado às tabelas
+    da aplicação com um único comando, na mesma transação que grava o ponto de
+    retomada (checkpoint) da importação.
+    """
+
+    def __init__(
+        self,
+        session_factory: Any = DEFAULT_SQL_SESSION_FACTORY,
+        posting_strategy: PostingStrategy | str = TRANSACTION_POSTING_STRATEGY,
+    ) -> None:
+        """Inicializa o repositório com a factory de sessão e a estratégia de lançamento."""
+        super().__init__(session_factory=session_factory)
+        self.posting_strategy = PostingStrategy(posting_strategy)
+
+    async def query_checkpoint(self, source: str) -> ImportCheckpoint | None:
+        """Consulta o ponto de retomada de uma importação pela origem."""
+        async with self:
+            checkpoint = (
+                await self.session.execute(
+                    select(ImportCheckpoint).where(ImportCheckpoint.source == source)
+                )
+            ).scalar_one_or_none()
+
+        return checkpoint
+
+    async def import_batch(
+        self,
+        kind: ImportKind,
+        source: str,
+        records: Sequence[tuple],
+        last_line: int,
+        invalid: int = 0,
+    ) -> list[int]:
+        """
+        Importa um lote de registros já validados, na ordem das colunas da tabela
+        temporária do tipo informado, e avança o ponto de retomada até a última linha
+        do lote, somando aos rejeitados as linhas descartadas na validação. Retorna as
+        linhas rejeitadas na incorporação (duplicadas ou com referência a cliente ou
+        conta inexistente).
+        """
+        match kind:
+            case ImportKind.CLIENTS:
+                staging_table, merge = client_staging_table, self.__merge_clients
+            case ImportKind.ACCOUNTS:
+                staging_table, merge = (
+                    bank_account_staging_table,
+                    self.__merge_bank_accounts,
+                )
+            case ImportKind.TRANSACTIONS:
+                staging_table, merge = (
+                    bank_transaction_staging_table,
+                    self.__merge_bank_transactions,
+                )
+
+        return await self.__import(
+            kind, source, records, last_line, invalid, staging_table, merge
+        )
+
+    @retry_on_serialization_failure
+    async def __import(
+        self,
+        kind: ImportKind,
+        source: str,
+        records: Sequence[tuple],
+        last_line: int,
+        invalid: int,
+        staging_table: Table,
+        merge: Callable[[Table], Select],
+    ) -> list[int]:
+        """Copia o lote para a tabela temporária, incorpora-o e grava o ponto de retomada."""
+        async with self:
+            try:
+                await self.session.execute(CreateTable(staging_table))
+                connection = await (
+                    await self.session.connection()
+                ).get_raw_connection()
+                await connection.driver_connection.copy_records_to_table(
+                    staging_table.name,
+                    records=records,
+                    columns=[column.name for column in staging_table.columns],
+                )
+
+                if kind == ImportKind.TRANSACTIONS:
+                    await self.session.execute(
+                        self.__lock_staged_accounts(staging_table)
+                    )
+                rejected_lines = list(
+                    (await self.session.execute(merge(staging_table))).scalars().all()
+                )
+                await self.__save_checkpoint(
+                    kind,
+                    source,
+                    last_line,
+                    imported=len(records) - len(rejected_lines),
+                    rejected=len(rejected_lines) + invalid,
+                )
+                await self.commit()
+            except Exception:
+                await self.rollback()
+                raise
+
+        return rejected_lines
+
+    async def __save_checkpoint(
+        self, kind: ImportKind, source: str, line: int, imported: int, rejected: int
+    ) -> None:
+        """Grava ou avança o ponto de retomada da importação, acumulando os totais."""
+        operation = pg_insert(ImportCheckpoint).values(
+            source=source,
+            kind=kind.value,
+            line=line,
+            imported=imported,
+            rejected=rejected,
+        )
+        await self.session.execute(
+            operation.on_conflict_do_update(
+                index_elements=["source"],
+                set_={
+                    "line": operation.excluded.line,
+                    "imported": ImportCheckpoint.imported + operation.excluded.imported,
+                    "rejected": ImportCheckpoint.rejected + operation.excluded.rejected,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    @staticmethod
+    def __lock_staged_accounts(staged: Table) -> Select:
+        """
+        Bloqueia as contas movimentadas pelo lote antes da incorporação, sempre em
+        ordem crescente de número, de modo que lotes e lançamentos concorrentes sobre
+        as mesmas contas não entrem em deadlock e que os saldos lidos na verificação
+        de saldo suficiente não mudem até o commit.
+        """
+        return (
+            select(Account.id)
+            .where(
+                Account.account_number.in_(
+                    union_all(
+                        select(staged.c.account_number),
+                        select(staged.c.destination_account_number),
+                    )
+                )
+            )
+            .order_by(Account.account_number)
+            .with_for_update()
+        )
+
+    @staticmethod
+    def __account_exists(account_number: Any) -> Any:
+        """Condição que indica se a conta informada está cadastrada."""
+        return exists(
+            select(Account.id).where(Account.account_number == account_number)
+        )
+
+    @staticmethod
+    def __rejected_lines(staged: Table, imported: CTE) -> Select:
+        """Linhas do lote que não constam entre as linhas efetivamente importadas."""
+        return (
+            select(staged.c.line)
+            .where(
+                ~exists(select(imported.c.line).where(imported.c.line == staged.c.line))
+            )
+            .order_by(staged.c.line)
+        )
+
+    @classmethod
+    def __merge_clients(cls, staged: Table) -> Select:
+        """
+        Insere os clientes do lote, mantendo a primeira linha de cada CPF e ignorando
+        os CPFs já cadastrados.
+        """
+        chosen = (
+            select(staged)
+            .distinct(staged.c.cpf)
+            .order_by(staged.c.cpf, staged.c.line)
+            .cte("chosen")
+        )
+        inserted = (
+            pg_insert(Client)
+            .from_select(
+                ["id", "name", "cpf"],
+                select(func.gen_random_uuid(), chosen.c.name, chosen.c.cpf),
+            )
+            .on_conflict_do_nothing(index_elements=["cpf"])
+            .returning(Client.cpf)
+            .cte("inserted")
+        )
+        imported = (
+            select(chosen.c.line)
+            .join(inserted, inserted.c.cpf == chosen.c.cpf)
+            .cte("imported")
+        )
+
+        return cls.__rejected_lines(staged, imported)
+
+    @classmethod
+    def __merge_bank_accounts(cls, staged: Table) -> Select:
+        """
+        Insere as contas do lote cujo cliente existe, mantendo a primeira linha de cada
+        número de conta e ignorando os já cadastrados. As contas particionadas recebem
+        as suas parcelas de saldo zeradas.
+        """
+        chosen = (
+            select(staged)
+            .distinct(staged.c.account_number)
+            .where(exists(select(Client.id).where(Client.cpf == staged.c.client_cpf)))
+            .order_by(staged.c.account_number, staged.c.line)
+            .cte("chosen")
+        )
+        inserted = (
+            pg_insert(Account)
+            .from_select(
+                ["id", "account_number", "balance", "client_cpf", "balance_slots"],
+                select(
+                    func.gen_random_uuid(),
+                    chosen.c.account_number,
+                    chosen.c.balance,
+                    chosen.c.client_cpf,
+                    chosen.c.balance_slots,
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=["account_number"])
+            .returning(Account.account_number, Account.balance_slots)
+            .cte("inserted")
+        )
+        created_slots = (
+            pg_insert(BalanceSlot)
+            .from_select(
+                ["account_number", "slot", "balance"],
+                select(
+                    inserted.c.account_number,
+                    func.generate_series(0, inserted.c.balance_slots - 1),
+                    literal(0),
+                ).where(inserted.c.balance_slots > 0),
+            )
+            .cte("created_slots")
+        )
+        imported = (
+            select(chosen.c.line)
+            .join(inserted, inserted.c.account_number == chosen.c.account_number)
+            .cte("imported")
+        )
+
+        return cls.__rejected_lines(staged, imported).add_cte(created_slots)
+
+    def __merge_bank_transactions(self, staged: Table) -> Select:
+        """
+        Insere as transações do lote cujas contas existem, ignorando identificadores
+        repetidos ou já cadastrados, e aplica aos saldos das contas o efeito líquido
+        das transações importadas. Saques e transferências que deixariam a conta de
+        origem com saldo negativo são rejeitados: o saldo disponível é o da linha da
+        conta mais a soma acumulada, na ordem das linhas do arquivo, dos depósitos e
+        débitos do lote; as transferências recebidas no lote não entram na conta, pois
+        podem ser rejeitadas, de modo que a verificação nunca superestima o saldo.
+        O saldo após cada transação é calculado pela soma acumulada das movimentações
+        da conta; ele fica nulo para contas particionadas e no modo razão, em que o
+        saldo da linha da conta não é o saldo completo.
+        """
+        candidates = (
+            select(staged)
+            .distinct(staged.c.id)
+            .where(
+                self.__account_exists(staged.c.account_number),
+                staged.c.destination_account_number.is_(None)
+                | self.__account_exists(staged.c.destination_account_number),
+                ~exists(select(Transaction.id).where(Transaction.id == staged.c.id)),
+            )
+            .order_by(staged.c.id, staged.c.line)
+            .cte("candidates")
+        )
+        available = (
+            select(
+                candidates.c.line,
+                candidates.c.type,
+                (
+                    Account.balance
+                    + func.sum(
+                        case(
+                            (
+                                candidates.c.type == TransactionType.DEPOSIT.value,
+                                candidates.c.amount,
+                            ),
+                            else_=-candidates.c.amount,
+                        )
+                    ).over(
+                        partition_by=candidates.c.account_number,
+                        order_by=candidates.c.line,
+                    )
+                ).label("balance"),
+            )
+            .join(Account, Account.account_number == candidates.c.account_number)
+            .subquery("available")
+        )
+        overdrawn = select(available.c.line).where(
+            available.c.type != TransactionType.DEPOSIT.value, available.c.balance < 0
+        )
+        chosen = (
+            select(candidates).where(candidates.c.line.not_in(overdrawn)).cte("chosen")
+        )
+        movements = union_all(
+            select(
+                chosen.c.line,
+                chosen.c.account_number,
+                case(
+                    (chosen.c.type == TransactionType.DEPOSIT.value, chosen.c.amount),
+                    else_=-chosen.c.amount,
+                ).label("delta"),
+                false().label("is_destination"),
+            ),
+            select(
+                chosen.c.line,
+                chosen.c.destination_account_number,
+                chosen.c.amount,
+                true(),
+            ).where(chosen.c.destination_account_number.is_not(None)),
+        ).cte("movements")
+
+        running_balance: Any = Account.balance + func.sum(movements.c.delta).over(
+            partition_by=movements.c.account_number, order_by=movements.c.line
+        )
+        if self.posting_strategy == PostingStrategy.LEDGER:
+            running_balance = null()
+        running = (
+            select(
+                movements.c.line,
+                movements.c.is_destination,
+                case((Account.balance_slots == 0, running_balance)).label(
+                    "balance_after"
+                ),
+            )
+            .join(Account, Account.account_number == movements.c.account_number)
+            .cte("running")
+        )
+        origin = running.alias("origin")
+        destination = running.alias("destination")
+
+        inserted = (
+            pg_insert(Transaction)
+            .from_select(
+                [
+                    "id",
+                    "type",
+                    "amount",
+                    "date",
+                    "account_number",
+                    "destination_account_number",
+                    "balance_after",
+                    "destination_balance_after",
+                ],
+                select(
+                    chosen.c.id,
+                    chosen.c.type,
+                    chosen.c.amount,
+                    chosen.c.date,
+                    chosen.c.account_number,
+                    chosen.c.destination_account_number,
+                    origin.c.balance_after,
+                    destination.c.balance_after,
+                )
+                .join(
+                    origin,
+                    and_(origin.c.line == chosen.c.line, ~origin.c.is_destination),
+                )
+                .outerjoin(
+                    destination,
+                    and_(
+                        destination.c.line == chosen.c.line,
+                        destination.c.is_destination,
+                    ),
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=["id"])
+            .returning(Transaction.id)
+            .cte("inserted")
+        )
+        imported = (
+            select(chosen.c.line)
+            .join(inserted, inserted.c.id == chosen.c.id)
+            .cte("imported")
+        )
+
+        net_amounts = (
+            select(
+                movements.c.account_number,
+                func.sum(movements.c.delta).label("delta"),
+            )
+            .where(movements.c.line.in_(select(imported.c.line)))
+            .group_by(movements.c.account_number)
+            .subquery("net_amounts")
+        )
+        updated_accounts = (
+            update(Account)
+            .where(Account.account_number == net_amounts.c.account_number)
+            .values(
+                balance=Account.balance + net_amounts.c.delta,
+                version=Account.version + 1,
+            )
+            .returning(Account.account_number)
+            .cte("updated_accounts")
+        )
+
+        return self.__rejected_lines(staged, imported).add_cte(updated_accounts)
@@ -1,10 +1,18 @@
+from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import insert, update, delete, Uuid, select
+from fastapi import HTTPException
+from sqlalchemy import Uuid, delete, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from business_contexts.domain.aggregates.client import Client
+from business_contexts.domain.exceptions import ClientAlreadyRegistered
+from business_contexts.repository.cache import CLIENT_CACHE
 from business_contexts.utils.base_types import OperationType
-from libs.ddd.adapters.repository import DomainRepository
+from libs.ddd.adapters.repository import (
+    DomainRepository,
+    retry_on_serialization_failure,
+)
 
 
 class ClientDomainRepo(DomainRepository):
@@ -27,12 +35,17 @@ class ClientDomainRepo(DomainRepository):
             )
         return aggregate
 
+    @retry_on_serialization_failure
     async def add(
         self,
         client: Client,
         operation_type: OperationType,
     ) -> UUID:
-        """Adiciona ou atualiza um cliente no banco de dados."""
+        """
+        Adiciona ou atualiza um cliente no banco de dados e, após o commit, invalida o
+        cliente (inclusive o CPF anterior, se alterado) no cache de clientes.
+        """
+        previous_cpf: str | None = None
         async with self:
             try:
                 data: dict = {
@@ -46,30 +59,98 @@ class ClientDomainRepo(DomainRepository):
                         result = await self.session.execute(operation)
 
                     case OperationType.UPDATE:
+                        previous_cpf = (
+                            await self.session.execute(
+                                select(Client.cpf)
+                                .where(Client.id == client.id)
+                                .with_for_update()
+                            )
+                        ).scalar_one_or_none()
                         operation = (
                             update(Client).where(Client.id == client.id).values(data)
                         )
                         await self.session.execute(operation)
 
+                await self._publish_events(client)
                 await self.commit()
-            except Exception as error:
+            except Exception:
                 await self.rollback()
-                raise error
+                raise
 
             result_id: UUID | None = client.id
             if not result_id:
                 result_id = result.scalar_one_or_none()
 
+        await CLIENT_CACHE.invalidate(client.cpf, previous_cpf, ids=(result_id,))
         return result_id
 
+    @retry_on_serialization_failure
+    async def add_batch(
+        self, clients: Sequence[Client]
+    ) -> list[Client | HTTPException]:
+        """
+        Cadastra um lote de clientes, com CPFs distintos, em uma única transação de
+        banco de dados. Os CPFs já cadastrados são verificados com uma única consulta,
+        e os novos clientes são inseridos com um único INSERT ... RETURNING.
+        Retorna, na ordem do lote, o cliente criado ou o erro de cada item.
+        """
+        async with self:
+            try:
+                registered_cpfs = set(
+                    (
+                        await self.session.execute(
+                            select(Client.cpf).where(
+                                Client.cpf.in_([client.cpf for client in clients])
+                            )
+                        )
+                    ).scalars()
+                )
+
+                new_clients = [
+                    client for client in clients if client.cpf not in registered_cpfs
+                ]
+                if new_clients:
+                    operation = (
+                        pg_insert(Client)
+                        .on_conflict_do_nothing(index_elements=["cpf"])
+                        .returning(Client.id, Client.cpf)
+                    )
+                    result = (
+                        await self.session.execute(
+                            operation,
+                            [
+                                {"name": client.name, "cpf": client.cpf}
+                                for client in new_clients
+                            ],
+                        )
+                    ).all()
+                    result_ids = {cpf: id for id, cpf in result}
+                    for client in new_clients:
+                        client.id = result_ids.get(client.cpf)
+                    await self._publish_events(
+                        *[client for client in new_clients if client.id]
+                    )
+
+                await self.commit()
+            except Exception:
+                await self.rollback()
+                raise
+
+        return [
+            client if client.id else ClientAlreadyRegistered() for client in clients
+        ]
+
+    @retry_on_serialization_failure
     async def remove(self, client: Client) -> None:
-        """Remove um cliente do banco de dados."""
+        """Remove um cliente do banco de dados e o invalida no cache de clientes."""
         async with self:
             try:
                 operation = delete(Client).where(Client.id == client.id)
 
                 await self.session.execute(operation)
                 await self.commit()
-            except Exception as error:
+            except Exception:
                 await self.rollback()
-                raise error
+                raise
+
+        await CLIENT_CACHE.invalidate(client.cpf, ids=(client.id,))
@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from sqlalchemy import delete
+
+from business_contexts.domain.value_objects.idempotency import IdempotencyRecord
+from libs.ddd.adapters.repository import (
+    DomainRepository,
+    retry_on_serialization_failure,
+)
+
+
+class IdempotencyRecordDomainRepo(DomainRepository):
+    """Repositório de domínio para operações de escrita de registros de idempotência."""
+
+    @retry_on_serialization_failure
+    async def remove_expired(self, created_before: datetime) -> int:
+        """Remove os registros criados antes da data informada, retornando quantos foram removidos."""
+        async with self:
+            try:
+                operation = delete(IdempotencyRecord).where(
+                    IdempotencyRecord.created_at < created_before
+                )
+
+                result = await self.session.execute(operation)
+                await self.commit()
+            except Exception:
+                await self.rollback()
+                raise
+
+        return result.rowcount
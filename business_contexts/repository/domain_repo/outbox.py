@@ -0,0 +1,109 @@
+from collections.abc import Sequence
+from datetime import timedelta
+
+from sqlalchemy import delete, func, or_, select, update
+
+from libs.ddd.adapters.repository import DomainRepository
+from libs.ddd.domain.event import OutboxMessage
+
+
+class OutboxDomainRepo(DomainRepository):
+    """Repositório de domínio para a entrega das mensagens da tabela de outbox."""
+
+    async def claim_batch(
+        self,
+        event_types: Sequence[str],
+        batch_size: int,
+        max_attempts: int,
+        claim_timeout_ms: int,
+    ) -> Sequence[OutboxMessage]:
+        """
+        Reivindica um lote de mensagens pendentes dos tipos de evento informados com
+        FOR UPDATE SKIP LOCKED, de modo que dispatchers concorrentes recebam lotes
+        distintos, e as marca como reivindicadas por claim_timeout_ms. A transação é
+        confirmada antes da entrega, liberando os bloqueios de linha; se o dispatcher
+        não concluir o lote nesse prazo, as mensagens voltam a ser reivindicáveis.
+        """
+        async with self:
+            try:
+                await self._set_isolation_level(self.locking_isolation_level)
+                messages = (
+                    (
+                        await self.session.execute(
+                            select(OutboxMessage)
+                            .where(
+                                OutboxMessage.event_type.in_(event_types),
+                                OutboxMessage.attempts < max_attempts,
+                                or_(
+                                    OutboxMessage.claimed_until.is_(None),
+                                    OutboxMessage.claimed_until < func.now(),
+                                ),
+                            )
+                            .order_by(OutboxMessage.created_at)
+                            .limit(batch_size)
+                            .with_for_update(skip_locked=True)
+                        )
+                    )
+                    .scalars()
+                    .all()
+                )
+
+                if messages:
+                    await self.session.execute(
+                        update(OutboxMessage)
+                        .where(
+                            OutboxMessage.id.in_([message.id for message in messages])
+                        )
+                        .values(
+                            claimed_until=func.now()
+                            + timedelta(milliseconds=claim_timeout_ms)
+                        )
+                    )
+
+                await self.commit()
+            except Exception:
+                await self.rollback()
+                raise
+
+        return messages
+
+    async def finish_batch(
+        self,
+        delivered: Sequence[OutboxMessage],
+        failed: Sequence[tuple[OutboxMessage, Exception]],
+    ) -> None:
+        """
+        Conclui a entrega de um lote reivindicado, em uma transação curta: as mensagens
+        entregues são removidas; as que falharam têm a tentativa e o erro registrados
+        e a reivindicação liberada, voltando a ser entregues no próximo lote.
+        Como a remoção é confirmada após a entrega, a garantia é de ao menos uma entrega.
+        """
+        if not delivered and not failed:
+            return
+
+        async with self:
+            try:
+                if delivered:
+                    await self.session.execute(
+                        delete(OutboxMessage).where(
+                            OutboxMessage.id.in_([message.id for message in delivered])
+                        )
+                    )
+                if failed:
+                    await self.session.execute(
+                        update(OutboxMessage),
+                        [
+                            {
+                                "id": message.id,
+                                "attempts": message.attempts + 1,
+                                "last_error": repr(error),
+                                "claimed_until": None,
+                            }
+                            for message, error in failed
+                        ],
+                    )
+
+                await self.commit()
+            except Exception:
+                await self.rollback()
+                raise
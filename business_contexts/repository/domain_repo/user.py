@@ -1,10 +1,14 @@
 from uuid import UUID
 
-from sqlalchemy import Uuid, select, insert, update, delete
+from sqlalchemy import Uuid, delete, insert, select, update
 
 from business_contexts.domain.aggregates.user import User
+from business_contexts.repository.cache import USER_CACHE
 from business_contexts.utils.base_types import OperationType
-from libs.ddd.adapters.repository import DomainRepository
+from libs.ddd.adapters.repository import (
+    DomainRepository,
+    retry_on_serialization_failure,
+)
 
 
 class UserDomainRepo(DomainRepository):
@@ -50,12 +54,17 @@ class UserDomainRepo(DomainRepository):
             )
         return aggregate
 
+    @retry_on_serialization_failure
     async def add(
         self,
         user: User,
         operation_type: OperationType,
     ) -> UUID:
-        """Adiciona ou atualiza um usuário no banco de dados."""
+        """
+        Adiciona ou atualiza um usuário no banco de dados e, após o commit, invalida o
+        usuário (inclusive o email anterior, se alterado) no cache de usuários.
+        """
+        previous_email: str | None = None
         async with self:
             try:
                 data: dict = {
@@ -72,28 +81,39 @@ class UserDomainRepo(DomainRepository):
                         result = await self.session.execute(operation)
 
                     case OperationType.UPDATE:
+                        previous_email = (
+                            await self.session.execute(
+                                select(User.email)
+                                .where(User.id == user.id)
+                                .with_for_update()
+                            )
+                        ).scalar_one_or_none()
                         operation = update(User).where(User.id == user.id).values(data)
                         await self.session.execute(operation)
 
                 await self.commit()
-            except Exception as error:
+            except Exception:
                 await self.rollback()
-                raise error
+                raise
 
             result_id: UUID | None = user.id
             if not result_id:
                 result_id = result.scalar_one_or_none()
 
+        await USER_CACHE.invalidate(user.email, previous_email, ids=(result_id,))
         return result_id
 
+    @retry_on_serialization_failure
     async def remove(self, user: User) -> None:
-        """Remove um usuário do banco de dados."""
+        """Remove um usuário do banco de dados e o invalida no cache de usuários."""
         async with self:
             try:
                 operation = delete(User).where(User.id == user.id)
 
                 await self.session.execute(operation)
                 await self.commit()
-            except Exception as error:
+            except Exception:
                 await self.rollback()
-                raise error
+                raise
+
+        await USER_CACHE.invalidate(user.email, ids=(user.id,))
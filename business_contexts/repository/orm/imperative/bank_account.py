@@ -1,9 +1,36 @@
 from uuid import uuid4
 
-from sqlalchemy import Table, Column, String, ForeignKey, Uuid, Numeric
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    Column,
+    ColumnElement,
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Numeric,
+    String,
+    Table,
+    Uuid,
+    case,
+    func,
+    select,
+)
+from sqlalchemy.orm import column_property, relationship
 
 from business_contexts.domain.aggregates.bank_account import Account
+from business_contexts.domain.value_objects.bank_account import (
+    BalanceSlot,
+    BalanceSnapshot,
+    DailyRollup,
+    RollupWatermark,
+)
+from business_contexts.domain.value_objects.bank_transaction import TransactionType
+from business_contexts.repository.orm.imperative.bank_transaction import (
+    bank_transaction_table,
+)
+from business_contexts.utils.constants import BALANCE_CHECK_CONSTRAINT
 from infra.database import mapper_registry
 
 bank_account_table: Table = Table(
@@ -13,6 +40,153 @@ bank_account_table: Table = Table(
     Column("account_number", String(255), nullable=False, index=True, unique=True),
     Column("balance", Numeric, nullable=False),
     Column("client_cpf", String(11), ForeignKey("client.cpf"), nullable=False),
+    Column("balance_slots", Integer, nullable=False, default=0, server_default="0"),
+    # Incrementada a cada alteração da linha, para o lançamento otimista (compare-and-swap)
+    Column("version", Integer, nullable=False, default=0, server_default="0"),
+    CheckConstraint("balance >= 0", name=BALANCE_CHECK_CONSTRAINT),
+)
+
+bank_account_balance_slot_table: Table = Table(
+    "bank_account_balance_slot",
+    mapper_registry.metadata,
+    Column(
+        "account_number",
+        String(255),
+        ForeignKey(
+            "bank_account.account_number", onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        primary_key=True,
+    ),
+    Column("slot", Integer, primary_key=True),
+    Column("balance", Numeric, nullable=False, default=0),
+)
+
+bank_account_balance_snapshot_table: Table = Table(
+    "bank_account_balance_snapshot",
+    mapper_registry.metadata,
+    Column(
+        "account_number",
+        String(255),
+        ForeignKey(
+            "bank_account.account_number", onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        primary_key=True,
+    ),
+    Column("sequence", BigInteger, primary_key=True),
+    Column("ledger_balance", Numeric, nullable=False),
+    Column(
+        "taken_at", DateTime(timezone=True), nullable=False, server_default=func.now()
+    ),
+)
+
+bank_account_daily_rollup_table: Table = Table(
+    "bank_account_daily_rollup",
+    mapper_registry.metadata,
+    Column(
+        "account_number",
+        String(255),
+        ForeignKey(
+            "bank_account.account_number", onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        primary_key=True,
+    ),
+    Column("day", Date, primary_key=True),
+    Column("type", String(255), primary_key=True),
+    Column("count", BigInteger, nullable=False, default=0),
+    Column("credits", Numeric, nullable=False, default=0),
+    Column("debits", Numeric, nullable=False, default=0),
+)
+
+bank_account_daily_rollup_watermark_table: Table = Table(
+    "bank_account_daily_rollup_watermark",
+    mapper_registry.metadata,
+    Column("name", String(255), primary_key=True),
+    Column("sequence", BigInteger, nullable=False, default=0),
+    Column("gap_detected_at", DateTime(timezone=True), nullable=True),
+)
+
+
+def _latest_snapshot(column: Column) -> ColumnElement:
+    """Valor da coluna no ponto de verificação mais recente da conta (0 se não houver)."""
+    return func.coalesce(
+        select(column)
+        .where(
+            bank_account_balance_snapshot_table.c.account_number
+            == bank_account_table.c.account_number
+        )
+        .order_by(bank_account_balance_snapshot_table.c.sequence.desc())
+        .limit(1)
+        .correlate(bank_account_table)
+        .scalar_subquery(),
+        0,
+    )
+
+
+def _ledger_entries(account_column: Column, aggregate: ColumnElement) -> ColumnElement:
+    """Agrega as movimentações do razão da conta posteriores ao último ponto de verificação."""
+    return (
+        select(aggregate)
+        .where(
+            bank_transaction_table.c.ledger,
+            account_column == bank_account_table.c.account_number,
+            bank_transaction_table.c.sequence
+            > _latest_snapshot(bank_account_balance_snapshot_table.c.sequence),
+        )
+        .scalar_subquery()
+    )
+
+
+# Saldo lançado no razão: último ponto de verificação mais as movimentações posteriores
+# (0 para contas que nunca receberam lançamentos no modo razão)
+ledger_balance: ColumnElement = (
+    _latest_snapshot(bank_account_balance_snapshot_table.c.ledger_balance)
+    + _ledger_entries(
+        bank_transaction_table.c.account_number,
+        func.coalesce(
+            func.sum(
+                case(
+                    (
+                        bank_transaction_table.c.type == TransactionType.DEPOSIT.value,
+                        bank_transaction_table.c.amount,
+                    ),
+                    else_=-bank_transaction_table.c.amount,
+                )
+            ),
+            0,
+        ),
+    )
+    + _ledger_entries(
+        bank_transaction_table.c.destination_account_number,
+        func.coalesce(func.sum(bank_transaction_table.c.amount), 0),
+    )
+)
+
+# Quantidade de movimentações do razão ainda não consolidadas em um ponto de verificação
+ledger_pending_entries: ColumnElement = _ledger_entries(
+    bank_transaction_table.c.account_number, func.count()
+) + _ledger_entries(bank_transaction_table.c.destination_account_number, func.count())
+
+
+def _last_sequence(account_column: Column) -> ColumnElement:
+    """Ordem de lançamento da última transação da conta na ponta informada (0 se não houver)."""
+    return func.coalesce(
+        select(func.max(bank_transaction_table.c.sequence))
+        .where(account_column == bank_account_table.c.account_number)
+        .scalar_subquery(),
+        0,
+    )
+
+
+# Ordem de lançamento da última transação enviada ou recebida pela conta, que muda a
+# cada lançamento mesmo quando a linha da conta não é atualizada (parcelas e razão)
+last_sequence: ColumnElement = func.greatest(
+    _last_sequence(bank_transaction_table.c.account_number),
+    _last_sequence(bank_transaction_table.c.destination_account_number),
+)
+
+balance_slot_mapper = mapper_registry.map_imperatively(
+    BalanceSlot,
+    bank_account_balance_slot_table,
 )
 
 account_mapper = mapper_registry.map_imperatively(
@@ -25,5 +199,38 @@ account_mapper = mapper_registry.map_imperatively(
             back_populates="account",
             foreign_keys="[Transaction.account_number]",
         ),
+        # Soma das parcelas de saldo de contas particionadas (0 para contas comuns)
+        "slots_balance": column_property(
+            select(
+                func.coalesce(func.sum(bank_account_balance_slot_table.c.balance), 0)
+            )
+            .where(
+                bank_account_balance_slot_table.c.account_number
+                == bank_account_table.c.account_number
+            )
+            .scalar_subquery()
+        ),
+        # Carregado nos agregados apenas no modo razão (undefer), pois as subconsultas
+        # sobre as transações e os pontos de verificação custam em toda leitura
+        "ledger_balance": column_property(ledger_balance, deferred=True),
+        "ledger_pending_entries": column_property(
+            ledger_pending_entries, deferred=True
+        ),
+        "last_sequence": column_property(last_sequence, deferred=True),
     },
 )
+
+balance_snapshot_mapper = mapper_registry.map_imperatively(
+    BalanceSnapshot,
+    bank_account_balance_snapshot_table,
+)
+
+daily_rollup_mapper = mapper_registry.map_imperatively(
+    DailyRollup,
+    bank_account_daily_rollup_table,
+)
+
+rollup_watermark_mapper = mapper_registry.map_imperatively(
+    RollupWatermark,
+    bank_account_daily_rollup_watermark_table,
+)
@@ -1,6 +1,19 @@
 from uuid import uuid4
 
-from sqlalchemy import Table, Column, String, ForeignKey, Uuid, Numeric, DateTime, func
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Identity,
+    Index,
+    Numeric,
+    String,
+    Table,
+    Uuid,
+    func,
+)
 from sqlalchemy.orm import relationship
 
 from business_contexts.domain.aggregates.bank_transaction import Transaction
@@ -25,6 +38,60 @@ bank_transaction_table: Table = Table(
         ForeignKey("bank_account.account_number"),
         nullable=True,
     ),
+    # Ordem de lançamento, usada pelos pontos de verificação do modo razão (ledger)
+    Column("sequence", BigInteger, Identity(), nullable=False, unique=True),
+    # Lançada apenas no razão, sem atualizar o saldo da linha da conta
+    Column("ledger", Boolean, nullable=False, default=False, server_default="false"),
+    # Saldo das contas de origem e de destino logo após o lançamento
+    Column("balance_after", Numeric, nullable=True),
+    Column("destination_balance_after", Numeric, nullable=True),
+)
+
+# Índices parciais das movimentações do razão ainda não consolidadas em um ponto de verificação
+Index(
+    "ix_bank_transaction_ledger_origin",
+    bank_transaction_table.c.account_number,
+    bank_transaction_table.c.sequence,
+    postgresql_where=bank_transaction_table.c.ledger,
+)
+Index(
+    "ix_bank_transaction_ledger_destination",
+    bank_transaction_table.c.destination_account_number,
+    bank_transaction_table.c.sequence,
+    postgresql_where=bank_transaction_table.c.ledger,
+)
+
+# Índices do extrato: lançamentos enviados e recebidos por conta, em ordem de data
+Index(
+    "ix_bank_transaction_account_date",
+    bank_transaction_table.c.account_number,
+    bank_transaction_table.c.date,
+)
+Index(
+    "ix_bank_transaction_destination_date",
+    bank_transaction_table.c.destination_account_number,
+    bank_transaction_table.c.date,
+)
+
+# Índices dos lançamentos enviados e recebidos por conta, em ordem de lançamento: a
+# última transação da conta (ETags das contas) e o saldo gravado no último lançamento
+# anterior a uma data (saldos de abertura e de fechamento do extrato)
+Index(
+    "ix_bank_transaction_account_sequence",
+    bank_transaction_table.c.account_number,
+    bank_transaction_table.c.sequence,
+)
+Index(
+    "ix_bank_transaction_destination_sequence",
+    bank_transaction_table.c.destination_account_number,
+    bank_transaction_table.c.sequence,
+)
+
+# Índice da paginação por cursor (keyset) da listagem de transações
+Index(
+    "ix_bank_transaction_date_id",
+    bank_transaction_table.c.date,
+    bank_transaction_table.c.id,
 )
 
 bank_transaction_mapper = mapper_registry.map_imperatively(
@@ -0,0 +1,26 @@
+from sqlalchemy import BigInteger, Column, DateTime, String, Table, func
+
+from business_contexts.domain.value_objects.bulk_import import ImportCheckpoint
+from infra.database import mapper_registry
+
+import_checkpoint_table: Table = Table(
+    "import_checkpoint",
+    mapper_registry.metadata,
+    Column("source", String(1024), primary_key=True),
+    Column("kind", String(32), nullable=False),
+    Column("line", BigInteger, nullable=False),
+    Column("imported", BigInteger, nullable=False, default=0),
+    Column("rejected", BigInteger, nullable=False, default=0),
+    Column(
+        "updated_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    ),
+)
+
+import_checkpoint_mapper = mapper_registry.map_imperatively(
+    ImportCheckpoint,
+    import_checkpoint_table,
+)
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, DateTime, ForeignKey, String, Table, Text, Uuid, func
+
+from business_contexts.domain.value_objects.idempotency import IdempotencyRecord
+from infra.database import mapper_registry
+
+idempotency_record_table: Table = Table(
+    "idempotency_record",
+    mapper_registry.metadata,
+    Column(
+        "user_id",
+        Uuid,
+        ForeignKey("user.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("key", String(255), primary_key=True),
+    Column("request_hash", String(64), nullable=False),
+    Column("response", Text, nullable=False),
+    Column(
+        "created_at",
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+        server_default=func.now(),
+    ),
+)
+
+idempotency_record_mapper = mapper_registry.map_imperatively(
+    IdempotencyRecord,
+    idempotency_record_table,
+)
@@ -0,0 +1,29 @@
+from sqlalchemy import JSON, Column, DateTime, Integer, String, Table, Text, Uuid, func
+
+from infra.database import mapper_registry
+from libs.ddd.domain.event import OutboxMessage
+
+outbox_message_table: Table = Table(
+    "outbox_message",
+    mapper_registry.metadata,
+    Column("id", Uuid, primary_key=True),
+    Column("event_type", String(255), nullable=False),
+    Column("aggregate_type", String(255), nullable=False),
+    Column("aggregate_id", String(255), nullable=True),
+    Column("payload", JSON, nullable=False),
+    Column(
+        "created_at",
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+        server_default=func.now(),
+    ),
+    Column("attempts", Integer, nullable=False, default=0, server_default="0"),
+    Column("last_error", Text, nullable=True),
+    Column("claimed_until", DateTime(timezone=True), nullable=True),
+)
+
+outbox_message_mapper = mapper_registry.map_imperatively(
+    OutboxMessage,
+    outbox_message_table,
+)
@@ -1,13 +1,51 @@
+from collections import defaultdict
+from datetime import date, datetime
 from typing import Sequence
+from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import (
+    CompoundSelect,
+    Date,
+    ScalarSelect,
+    String,
+    any_,
+    bindparam,
+    case,
+    cast,
+    func,
+    literal,
+    select,
+    true,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from business_contexts.domain.aggregates.bank_account import Account
 from business_contexts.domain.aggregates.bank_transaction import Transaction
-from business_contexts.domain.entities.bank_account import AccountEntity
+from business_contexts.domain.entities.bank_account import (
+    AccountEntity,
+    AccountStatementEntity,
+    AccountSummaryEntity,
+    AccountVersionEntity,
+    StatementEntryEntity,
+    SummaryEntryEntity,
+)
+from business_contexts.domain.entities.bank_transaction import TransactionEntity
+from business_contexts.domain.value_objects.bank_account import DailyRollup
+from business_contexts.domain.value_objects.bank_transaction import TransactionType
+from business_contexts.repository.cache import ACCOUNT_CACHE
+from business_contexts.repository.query_repo.pagination import paginate, to_page
+from business_contexts.repository.query_repo.projections import (
+    account_columns,
+    account_version_columns,
+    to_account_entity,
+    to_account_version_entity,
+    to_transaction_entity,
+    transaction_columns,
+)
+from business_contexts.utils.base_types import SummaryPeriod
 from libs.ddd.adapters.repository import QueryRepository
-from libs.ddd.adapters.viewers import Filters
+from libs.ddd.adapters.viewers import Filters, Page, Pagination
 
 
 class BankAccountQueryRepo(QueryRepository):
@@ -15,118 +53,415 @@ class BankAccountQueryRepo(QueryRepository):
 
     async def query_by_filters(self, filters: Filters) -> Sequence[AccountEntity]:
         """Consulta contas bancárias aplicando os filtros fornecidos."""
-        list_transactions: bool = True
-        if "list_transactions" in filters:
-            list_transactions = filters.get("list_transactions")
-            filters.pop("list_transactions")
+        return await self.__query_accounts(filters)
+
+    async def query_page_by_filters(
+        self, filters: Filters, pagination: Pagination
+    ) -> Page[AccountEntity]:
+        """
+        Consulta uma página de contas bancárias aplicando os filtros fornecidos, em
+        ordem de ID, a partir do cursor da paginação. A consulta da primeira página de
+        uma conta por ID ou número, sem transações, usa o cache de contas.
+        """
+        if pagination.after is None and self.__is_cacheable(filters):
+            account = await self.__query_cached(filters)
+            return Page(items=[account] if account else [])
+
+        accounts = await self.__query_accounts(filters, pagination=pagination)
+        return to_page(accounts, pagination, lambda account: (account.id,))
+
+    async def query_version_page(
+        self, filters: Filters, pagination: Pagination
+    ) -> Page[AccountVersionEntity]:
+        """
+        Consulta a versão das contas da página que query_page_by_filters retornaria
+        com os mesmos filtros e paginação, sem ler os saldos nem as transações, para
+        responder às requisições condicionais (ETag) sem montar a página.
+        """
+        filters = Filters(
+            {key: value for key, value in filters.items() if key != "list_transactions"}
+        )
+        query = paginate(
+            select(*account_version_columns()).filter_by(**filters),
+            pagination,
+            Account.id,
+        )
 
         async with self:
-            operation = select(Account).filter_by(**filters)
-            if list_transactions:
-                operation = operation.options(joinedload(Account.transactions))
-            accounts = (await self.session.execute(operation)).unique().scalars().all()
-
-            account_entities: list[AccountEntity] = []
-            for account in accounts:
-                transactions_list: list[Transaction] = []
-                if list_transactions:
-                    received_transactions = (
-                        (
-                            await self.session.execute(
-                                select(Transaction).where(
-                                    Transaction.destination_account_number
-                                    == account.account_number
-                                )
-                            )
-                        )
-                        .scalars()
-                        .all()
-                    )
+            rows = await self.session.execute(query)
+            versions = [to_account_version_entity(row) for row in rows]
+
+        return to_page(versions, pagination, lambda version: (version.id,))
+
+    async def query_one_by_filters(self, filters: Filters) -> AccountEntity | None:
+        """
+        Consulta uma única conta bancária aplicando os filtros fornecidos. A consulta
+        por ID ou número, sem transações, usa o cache de contas.
+        """
+        if self.__is_cacheable(filters):
+            return await self.__query_cached(filters)
+
+        accounts = await self.__query_accounts(filters, one=True)
+        return accounts[0] if accounts else None
 
-                    all_transactions = list(account.transactions) + list(
-                        received_transactions
+    @staticmethod
+    def __is_cacheable(filters: Filters) -> bool:
+        """Indica se o cache está habilitado e a consulta é de uma conta sem transações."""
+        return filters.get("list_transactions") is False and ACCOUNT_CACHE.accepts(
+            filters, ignored=("list_transactions",)
+        )
+
+    async def __query_cached(self, filters: Filters) -> AccountEntity | None:
+        """
+        Consulta a conta (sem transações) por ID e/ou número no cache de contas,
+        carregando-a do primário na ausência, para que o cache, invalidado após as
+        escritas, não armazene uma versão defasada da réplica. Os carregamentos usam
+        outra instância do repositório, restrita ao primário, sem alterar esta.
+        """
+        primary = BankAccountQueryRepo(
+            session_factory=self.session_factory, use_replica=False
+        )
+
+        async def load(account_number: str) -> AccountEntity | None:
+            accounts = await primary.__query_accounts(
+                Filters({"account_number": account_number, "list_transactions": False}),
+                one=True,
+            )
+            return accounts[0] if accounts else None
+
+        async def load_account_number(id: UUID) -> str | None:
+            async with primary:
+                return (
+                    await primary.session.execute(
+                        select(Account.account_number).where(Account.id == id)
                     )
-                    all_transactions.sort(key=lambda t: t.date, reverse=True)
-
-                    transactions_list = [
-                        Transaction(
-                            id=transaction.id,
-                            type=transaction.type,
-                            amount=transaction.amount,
-                            date=transaction.date,
-                            account_number=transaction.account_number,
-                            destination_account_number=transaction.destination_account_number,
-                        )
-                        for transaction in all_transactions
-                    ]
-
-                account_entities.append(
-                    AccountEntity(
-                        id=account.id,
-                        account_number=account.account_number,
-                        balance=account.balance,
-                        client_cpf=account.client_cpf,
-                        transactions=transactions_list,
+                ).scalar_one_or_none()
+
+        return await ACCOUNT_CACHE.get(filters, load, load_account_number)
+
+    async def query_statement(
+        self,
+        account_number: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> AccountStatementEntity | None:
+        """
+        Consulta o extrato da conta no período [start_date, end_date) em um único
+        comando, com um snapshot consistente: os lançamentos enviados e recebidos
+        (com o valor negativo nos débitos) são unidos e o saldo após cada um é
+        calculado no banco por uma soma acumulada (window function). Os saldos de
+        abertura e de fechamento são os saldos gravados (balance_after) no último
+        lançamento anterior a start_date e a end_date, localizados pelos índices
+        (account_number, sequence) e (destination_account_number, sequence). Se não
+        houver saldo gravado (créditos em contas particionadas e modo razão), o de
+        fechamento é o saldo atual menos os lançamentos desde end_date, e o de
+        abertura, o de fechamento menos os lançamentos do período.
+        Retorna None se a conta não existir.
+        """
+        movements = self.__movements(account_number, start_date, end_date).cte(
+            "movements"
+        )
+
+        closing_balance = (
+            select(Account.balance + Account.slots_balance + Account.ledger_balance)
+            .where(Account.account_number == account_number)
+            .scalar_subquery()
+        )
+        if end_date is not None:
+            since_end = self.__movements(account_number, end_date).subquery()
+            closing_balance = func.coalesce(
+                self.__balance_before(account_number, end_date),
+                closing_balance
+                - select(
+                    func.coalesce(func.sum(since_end.c.signed_amount), 0)
+                ).scalar_subquery(),
+            )
+        closing = select(closing_balance.label("closing_balance")).cte("closing")
+
+        opening_balance = closing.c.closing_balance - func.coalesce(
+            select(func.sum(movements.c.signed_amount)).scalar_subquery(), 0
+        )
+        if start_date is not None:
+            opening_balance = func.coalesce(
+                self.__balance_before(account_number, start_date), opening_balance
+            )
+        balances = select(
+            opening_balance.label("opening_balance"), closing.c.closing_balance
+        ).cte("balances")
+
+        ordering = (movements.c.date, movements.c.sequence, movements.c.leg)
+        query = (
+            select(
+                balances.c.opening_balance,
+                balances.c.closing_balance,
+                movements.c.id,
+                movements.c.type,
+                movements.c.signed_amount,
+                movements.c.date,
+                movements.c.account_number,
+                movements.c.destination_account_number,
+                (
+                    balances.c.opening_balance
+                    + func.sum(movements.c.signed_amount).over(
+                        order_by=ordering, rows=(None, 0)
                     )
+                ).label("balance"),
+            )
+            .select_from(balances.outerjoin(movements, true()))
+            .order_by(*ordering)
+        )
+
+        async with self:
+            rows = (await self.session.execute(query)).all()
+
+        if rows[0].opening_balance is None:
+            return None
+
+        return AccountStatementEntity(
+            account_number=account_number,
+            start_date=start_date,
+            end_date=end_date,
+            opening_balance=rows[0].opening_balance,
+            closing_balance=rows[0].closing_balance,
+            entries=[
+                StatementEntryEntity(
+                    id=row.id,
+                    type=TransactionType(row.type),
+                    amount=row.signed_amount,
+                    date=row.date,
+                    account_number=row.account_number,
+                    destination_account_number=row.destination_account_number,
+                    balance=row.balance,
                 )
+                for row in rows
+                if row.id is not None
+            ],
+        )
 
-        return account_entities
+    @staticmethod
+    def __movements(
+        account_number: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> CompoundSelect:
+        """
+        Une os lançamentos enviados e recebidos pela conta no período [start_date,
+        end_date), com o valor negativo nos débitos.
+        """
+        columns = (
+            Transaction.id,
+            Transaction.type,
+            Transaction.amount,
+            Transaction.date,
+            Transaction.account_number,
+            Transaction.destination_account_number,
+            Transaction.sequence,
+        )
+        sent = select(
+            *columns,
+            case(
+                (Transaction.type == TransactionType.DEPOSIT.value, Transaction.amount),
+                else_=-Transaction.amount,
+            ).label("signed_amount"),
+            literal(0).label("leg"),
+        ).where(Transaction.account_number == account_number)
+        received = select(
+            *columns,
+            Transaction.amount.label("signed_amount"),
+            literal(1).label("leg"),
+        ).where(Transaction.destination_account_number == account_number)
+        if start_date is not None:
+            sent = sent.where(Transaction.date >= start_date)
+            received = received.where(Transaction.date >= start_date)
+        if end_date is not None:
+            sent = sent.where(Transaction.date < end_date)
+            received = received.where(Transaction.date < end_date)
+        return union_all(sent, received)
 
-    async def query_one_by_filters(self, filters: Filters) -> AccountEntity | None:
-        """Consulta uma única conta bancária aplicando os filtros fornecidos."""
+    @staticmethod
+    def __balance_before(account_number: str, moment: datetime) -> ScalarSelect:
+        """
+        Saldo gravado no último lançamento da conta (enviado ou recebido) anterior ao
+        momento informado, buscado do fim dos índices (account_number, sequence) e
+        (destination_account_number, sequence). É nulo se não houver lançamento ou se
+        o saldo não tiver sido gravado nele.
+        """
+        sent = (
+            select(Transaction.sequence, Transaction.balance_after.label("balance"))
+            .where(
+                Transaction.account_number == account_number, Transaction.date < moment
+            )
+            .order_by(Transaction.sequence.desc())
+            .limit(1)
+            .subquery()
+        )
+        received = (
+            select(
+                Transaction.sequence,
+                Transaction.destination_balance_after.label("balance"),
+            )
+            .where(
+                Transaction.destination_account_number == account_number,
+                Transaction.date < moment,
+            )
+            .order_by(Transaction.sequence.desc())
+            .limit(1)
+            .subquery()
+        )
+        last = union_all(select(sent), select(received)).subquery()
+        return (
+            select(last.c.balance)
+            .order_by(last.c.sequence.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+
+    async def query_summaries(
+        self,
+        account_number: str,
+        period: SummaryPeriod,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> AccountSummaryEntity | None:
+        """
+        Consulta o resumo da movimentação da conta nos dias [start_date, end_date),
+        com os totais por dia ou mês e tipo de transação somados a partir dos totais
+        diários, sem ler as transações. Os totais refletem as transações já agregadas
+        pelo projetor, que podem atrasar em relação aos lançamentos mais recentes.
+        Retorna None se a conta não existir.
+        """
+        period_start = cast(func.date_trunc(period.value, DailyRollup.day), Date)
+        rollups = select(
+            period_start.label("period_start"),
+            DailyRollup.type,
+            func.sum(DailyRollup.count).label("count"),
+            func.sum(DailyRollup.credits).label("credits"),
+            func.sum(DailyRollup.debits).label("debits"),
+        ).where(DailyRollup.account_number == account_number)
+        if start_date is not None:
+            rollups = rollups.where(DailyRollup.day >= start_date)
+        if end_date is not None:
+            rollups = rollups.where(DailyRollup.day < end_date)
+        summaries = rollups.group_by(period_start, DailyRollup.type).subquery(
+            "summaries"
+        )
+
+        # A conta é a base da consulta, para distinguir a conta sem movimentação da
+        # conta inexistente no mesmo comando
+        query = (
+            select(Account.account_number, summaries)
+            .outerjoin(summaries, true())
+            .where(Account.account_number == account_number)
+            .order_by(summaries.c.period_start, summaries.c.type)
+        )
+
+        async with self:
+            rows = (await self.session.execute(query)).all()
+
+        if not rows:
+            return None
+
+        return AccountSummaryEntity(
+            account_number=account_number,
+            period=period,
+            start_date=start_date,
+            end_date=end_date,
+            entries=[
+                SummaryEntryEntity(
+                    period_start=row.period_start,
+                    type=TransactionType(row.type),
+                    count=row.count,
+                    credits=row.credits,
+                    debits=row.debits,
+                    net=row.credits - row.debits,
+                )
+                for row in rows
+                if row.period_start is not None
+            ],
+        )
+
+    async def __query_accounts(
+        self,
+        filters: Filters,
+        one: bool = False,
+        pagination: Pagination | None = None,
+    ) -> list[AccountEntity]:
+        """
+        Consulta as contas que atendem aos filtros (no máximo uma, se one, ou uma
+        página, se paginada) e, se solicitado (padrão), as transações enviadas e
+        recebidas por elas, com uma consulta para as contas e outra para as
+        transações de todas elas. O item a mais da consulta paginada, que só indica
+        a existência da próxima página, não tem as transações carregadas.
+        """
         list_transactions: bool = True
         if "list_transactions" in filters:
             list_transactions = filters.get("list_transactions")
             filters.pop("list_transactions")
 
+        query = select(*account_columns()).filter_by(**filters)
+        if pagination is not None:
+            query = paginate(query, pagination, Account.id)
+
         async with self:
-            operation = select(Account).filter_by(**filters)
-            if list_transactions:
-                operation = operation.options(joinedload(Account.transactions))
-            account = (
-                (await self.session.execute(operation)).unique().scalar_one_or_none()
+            result = await self.session.execute(query)
+            if one:
+                account = result.one_or_none()
+                accounts = [account] if account else []
+            else:
+                accounts = result.all()
+
+            listed_accounts = (
+                accounts if pagination is None else accounts[: pagination.limit]
             )
-            if not account:
-                return None
-
-            transactions_list: list[Transaction] = []
-            if list_transactions:
-                received_transactions = (
-                    (
-                        await self.session.execute(
-                            select(Transaction).where(
-                                Transaction.destination_account_number
-                                == account.account_number
-                            )
-                        )
-                    )
-                    .scalars()
-                    .all()
+            transactions_by_account: dict[str, list[TransactionEntity]] = {}
+            if list_transactions and listed_accounts:
+                transactions_by_account = await self.__query_transactions(
+                    [account.account_number for account in listed_accounts]
                 )
 
-                all_transactions = list(account.transactions) + list(
-                    received_transactions
+            return [
+                to_account_entity(
+                    account, transactions_by_account.get(account.account_number, [])
                 )
-                all_transactions.sort(key=lambda t: t.date, reverse=True)
-
-                transactions_list = [
-                    Transaction(
-                        id=transaction.id,
-                        type=transaction.type,
-                        amount=transaction.amount,
-                        date=transaction.date,
-                        account_number=transaction.account_number,
-                        destination_account_number=transaction.destination_account_number,
-                    )
-                    for transaction in all_transactions
-                ]
-
-            account_entity = AccountEntity(
-                id=account.id,
-                account_number=account.account_number,
-                balance=account.balance,
-                client_cpf=account.client_cpf,
-                transactions=transactions_list,
+                for account in accounts
+            ]
+
+    async def __query_transactions(
+        self, account_numbers: list[str]
+    ) -> dict[str, list[TransactionEntity]]:
+        """
+        Consulta em um único comando (UNION ALL das enviadas e das recebidas, ordenado
+        por data no banco) as transações das contas informadas, agrupando-as por conta
+        em uma única passagem. Uma transferência para a própria conta aparece nas duas
+        pontas, como enviada e como recebida. Os números das contas são enviados como
+        um único parâmetro (array), independentemente da quantidade de contas.
+        """
+        listed_account_numbers = bindparam(
+            "account_numbers", account_numbers, type_=ARRAY(String)
+        )
+        columns = (*transaction_columns(), Transaction.sequence)
+        listed_transactions = union_all(
+            select(
+                *columns, Transaction.account_number.label("listed_account_number")
+            ).where(Transaction.account_number == any_(listed_account_numbers)),
+            select(
+                *columns,
+                Transaction.destination_account_number.label("listed_account_number"),
+            ).where(
+                Transaction.destination_account_number == any_(listed_account_numbers)
+            ),
+        ).subquery("listed_transactions")
+
+        rows = await self.session.execute(
+            select(listed_transactions).order_by(
+                listed_transactions.c.date.desc(), listed_transactions.c.sequence.desc()
+            )
+        )
+
+        transactions_by_account: dict[str, list[TransactionEntity]] = defaultdict(list)
+        for row in rows:
+            transactions_by_account[row.listed_account_number].append(
+                to_transaction_entity(row)
             )
 
-        return account_entity
+        return transactions_by_account
@@ -1,54 +1,125 @@
-from typing import Sequence
+from collections.abc import AsyncGenerator, Sequence
+from datetime import datetime
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import or_, select
 
 from business_contexts.domain.aggregates.bank_transaction import Transaction
 from business_contexts.domain.entities.bank_transaction import TransactionEntity
+from business_contexts.repository.query_repo.pagination import paginate, to_page
+from business_contexts.repository.query_repo.projections import (
+    to_transaction_entity,
+    transaction_columns,
+)
+from business_contexts.utils.constants import TRANSACTION_EXPORT_FETCH_SIZE
 from libs.ddd.adapters.repository import QueryRepository
-from libs.ddd.adapters.viewers import Filters
+from libs.ddd.adapters.viewers import Filters, Page, Pagination
 
 
 class BankTransactionQueryRepo(QueryRepository):
-    """Repositório de consulta para transações bancárias."""
+    """
+    Repositório de consulta para transações bancárias. As consultas projetam apenas
+    as colunas de TransactionEntity, montada diretamente das linhas retornadas.
+    """
 
     async def query_by_filters(self, filters: Filters) -> Sequence[TransactionEntity]:
         """Consulta transações bancárias aplicando os filtros fornecidos."""
         async with self:
-            transactions = (
-                (await self.session.execute(select(Transaction).filter_by(**filters)))
-                .scalars()
-                .all()
+            rows = await self.session.execute(
+                select(*transaction_columns()).filter_by(**filters)
             )
+            return [to_transaction_entity(row) for row in rows]
 
-            transaction_entities: list[TransactionEntity] = [
-                TransactionEntity(
-                    id=transaction.id,
-                    type=transaction.type,
-                    amount=transaction.amount,
-                    date=transaction.date,
-                    account_number=transaction.account_number,
-                    destination_account_number=transaction.destination_account_number,
+    async def query_page_by_filters(
+        self, filters: Filters, pagination: Pagination
+    ) -> Page[TransactionEntity]:
+        """
+        Consulta uma página de transações bancárias aplicando os filtros fornecidos,
+        em ordem de data e ID, a partir do cursor da paginação.
+        """
+        async with self:
+            rows = await self.session.execute(
+                paginate(
+                    select(*transaction_columns()).filter_by(**filters),
+                    pagination,
+                    Transaction.date,
+                    Transaction.id,
+                )
+            )
+            transaction_entities = [to_transaction_entity(row) for row in rows]
+
+        return to_page(
+            transaction_entities,
+            pagination,
+            lambda transaction: (transaction.date, transaction.id),
+        )
+
+    async def query_key_page(
+        self, filters: Filters, pagination: Pagination
+    ) -> Page[tuple[datetime, UUID]]:
+        """
+        Consulta as chaves (data e ID) das transações da página que
+        query_page_by_filters retornaria com os mesmos filtros e paginação, pelo
+        índice da paginação, para responder às requisições condicionais (ETag) sem
+        montar a página. As transações não são alteradas após o lançamento.
+        """
+        async with self:
+            rows = await self.session.execute(
+                paginate(
+                    select(Transaction.date, Transaction.id).filter_by(**filters),
+                    pagination,
+                    Transaction.date,
+                    Transaction.id,
+                )
+            )
+            keys = [(date, id) for date, id in rows]
+
+        return to_page(keys, pagination, lambda key: key)
+
+    async def stream_by_filters(
+        self,
+        account_number: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        fetch_size: int = TRANSACTION_EXPORT_FETCH_SIZE,
+    ) -> AsyncGenerator[Sequence[TransactionEntity]]:
+        """
+        Percorre as transações bancárias (enviadas ou recebidas pela conta, se
+        informada, com data a partir de start_date e anterior a end_date), em ordem
+        de data e ID, por um cursor do lado do servidor: as linhas são buscadas e
+        entregues em lotes de fetch_size, de modo que a memória ocupada não depende
+        da quantidade de transações. O cursor e a sessão são encerrados quando o
+        gerador é fechado, mesmo antes do fim.
+        """
+        query = select(*transaction_columns()).order_by(
+            Transaction.date, Transaction.id
+        )
+        if account_number is not None:
+            query = query.where(
+                or_(
+                    Transaction.account_number == account_number,
+                    Transaction.destination_account_number == account_number,
                 )
-                for transaction in transactions
-            ]
+            )
+        if start_date is not None:
+            query = query.where(Transaction.date >= start_date)
+        if end_date is not None:
+            query = query.where(Transaction.date < end_date)
 
-        return transaction_entities
+        async with self:
+            result = await self.session.stream(
+                query.execution_options(yield_per=fetch_size)
+            )
+            async for rows in result.partitions():
+                yield [to_transaction_entity(row) for row in rows]
 
     async def query_one_by_filters(self, filters: Filters) -> TransactionEntity | None:
         """Consulta uma única transação bancária aplicando os filtros fornecidos."""
-        transaction = (
-            await self.session.execute(select(Transaction).filter_by(**filters))
-        ).scalar_one_or_none()
-        if not transaction:
-            return None
-
-        transaction_entity = TransactionEntity(
-            id=transaction.id,
-            type=transaction.type,
-            amount=transaction.amount,
-            date=transaction.date,
-            account_number=transaction.account_number,
-            destination_account_number=transaction.destination_account_number,
-        )
+        async with self:
+            row = (
+                await self.session.execute(
+                    select(*transaction_columns()).filter_by(**filters)
+                )
+            ).one_or_none()
 
-        return transaction_entity
+        return to_transaction_entity(row) if row else None
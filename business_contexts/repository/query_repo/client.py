@@ -1,49 +1,97 @@
 from typing import Sequence
+from uuid import UUID
 
 from sqlalchemy import select
 
 from business_contexts.domain.aggregates.client import Client
 from business_contexts.domain.entities.client import ClientEntity
+from business_contexts.repository.cache import CLIENT_CACHE
+from business_contexts.repository.query_repo.pagination import paginate, to_page
+from business_contexts.repository.query_repo.projections import (
+    client_columns,
+    to_client_entity,
+)
 from libs.ddd.adapters.repository import QueryRepository
-from libs.ddd.adapters.viewers import Filters
+from libs.ddd.adapters.viewers import Filters, Page, Pagination
 
 
 class ClientQueryRepo(QueryRepository):
-    """Repositório de consulta para clientes."""
+    """
+    Repositório de consulta para clientes. As consultas projetam apenas as colunas
+    da entidade, montada diretamente das linhas retornadas.
+    """
 
     async def query_by_filters(self, filters: Filters) -> Sequence[ClientEntity]:
         """Consulta clientes aplicando os filtros fornecidos."""
         async with self:
-            clients = (
-                (await self.session.execute(select(Client).filter_by(**filters)))
-                .scalars()
-                .all()
+            rows = await self.session.execute(
+                select(*client_columns()).filter_by(**filters)
             )
 
-            client_entities: list[ClientEntity] = [
-                ClientEntity(
-                    id=client.id,
-                    name=client.name,
-                    cpf=client.cpf,
+            return [to_client_entity(row) for row in rows]
+
+    async def query_page_by_filters(
+        self, filters: Filters, pagination: Pagination
+    ) -> Page[ClientEntity]:
+        """
+        Consulta uma página de clientes aplicando os filtros fornecidos, em ordem de ID,
+        a partir do cursor da paginação. A consulta da primeira página de um cliente por
+        ID ou CPF usa o cache de clientes.
+        """
+        if pagination.after is None and CLIENT_CACHE.accepts(filters):
+            client = await self.__query_cached(filters)
+            return Page(items=[client] if client else [])
+
+        async with self:
+            rows = await self.session.execute(
+                paginate(
+                    select(*client_columns()).filter_by(**filters),
+                    pagination,
+                    Client.id,
                 )
-                for client in clients
-            ]
+            )
 
-        return client_entities
+            client_entities = [to_client_entity(row) for row in rows]
+
+        return to_page(client_entities, pagination, lambda client: (client.id,))
 
     async def query_one_by_filters(self, filters: Filters) -> ClientEntity | None:
-        """Consulta um único cliente aplicando os filtros fornecidos."""
+        """
+        Consulta um único cliente aplicando os filtros fornecidos. A consulta por ID
+        ou CPF usa o cache de clientes.
+        """
+        if CLIENT_CACHE.accepts(filters):
+            return await self.__query_cached(filters)
+
+        return await self.__query_one(filters)
+
+    async def __query_one(self, filters: Filters) -> ClientEntity | None:
+        """Consulta o único cliente que atende aos filtros, se existir."""
         async with self:
-            client = (
-                await self.session.execute(select(Client).filter_by(**filters))
-            ).scalar_one_or_none()
-            if not client:
-                return None
-
-            client_entity = ClientEntity(
-                id=client.id,
-                name=client.name,
-                cpf=client.cpf,
-            )
+            row = (
+                await self.session.execute(
+                    select(*client_columns()).filter_by(**filters)
+                )
+            ).one_or_none()
+
+            return to_client_entity(row) if row else None
+
+    async def __query_cached(self, filters: Filters) -> ClientEntity | None:
+        """
+        Consulta o cliente por ID e/ou CPF no cache de clientes, carregando-o do
+        primário na ausência.
+        """
+        self.use_replica = False
+
+        async def load(cpf: str) -> ClientEntity | None:
+            return await self.__query_one(Filters({"cpf": cpf}))
+
+        async def load_cpf(id: UUID) -> str | None:
+            async with self:
+                return (
+                    await self.session.execute(
+                        select(Client.cpf).where(Client.id == id)
+                    )
+                ).scalar_one_or_none()
 
-        return client_entity
+        return await CLIENT_CACHE.get(filters, load, load_cpf)
@@ -0,0 +1,38 @@
+from sqlalchemy import select
+
+from business_contexts.domain.entities.idempotency import IdempotencyRecordEntity
+from business_contexts.domain.value_objects.idempotency import IdempotencyRecord
+from libs.ddd.adapters.repository import QueryRepository
+from libs.ddd.adapters.viewers import Filters
+
+
+class IdempotencyRecordQueryRepo(QueryRepository):
+    """
+    Repositório de consulta para registros de idempotência, lidos sempre do primário:
+    uma repetição deve encontrar o registro gravado pela requisição original.
+    """
+
+    use_replica: bool = False
+
+    async def query_one_by_filters(
+        self, filters: Filters
+    ) -> IdempotencyRecordEntity | None:
+        """Consulta um único registro de idempotência aplicando os filtros fornecidos."""
+        async with self:
+            record = (
+                await self.session.execute(
+                    select(IdempotencyRecord).filter_by(**filters)
+                )
+            ).scalar_one_or_none()
+            if not record:
+                return None
+
+            record_entity = IdempotencyRecordEntity(
+                user_id=record.user_id,
+                key=record.key,
+                request_hash=record.request_hash,
+                response=record.response,
+                created_at=record.created_at,
+            )
+
+        return record_entity
@@ -0,0 +1,55 @@
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from business_contexts.domain.exceptions import InvalidPaginationCursor
+from libs.ddd.adapters.viewers import Page, Pagination, decode_cursor, encode_cursor
+
+
+def paginate(
+    query: Select, pagination: Pagination, *keys: InstrumentedAttribute
+) -> Select:
+    """
+    Aplica a paginação por cursor (keyset) à consulta: ordena pelas chaves e, havendo
+    cursor, continua a partir do último item lido com uma comparação de tuplas, que
+    percorre o índice das chaves sem ler e descartar as linhas das páginas anteriores
+    (como faria um OFFSET). Busca um item a mais para saber se há próxima página.
+    """
+    if pagination.after is not None:
+        query = query.where(
+            tuple_(*keys) > tuple_(*_parse_cursor(pagination.after, keys))
+        )
+    return query.order_by(*keys).limit(pagination.limit + 1)
+
+
+def to_page[T](
+    items: Sequence[T], pagination: Pagination, cursor_keys: Callable[[T], tuple]
+) -> Page[T]:
+    """
+    Monta a página com os itens retornados por uma consulta paginada e, se houver
+    mais itens que o limite, o cursor da próxima página com as chaves do último item.
+    """
+    if len(items) <= pagination.limit:
+        return Page(items=items)
+
+    items = items[: pagination.limit]
+    return Page(items=items, next_cursor=encode_cursor(*cursor_keys(items[-1])))
+
+
+def _parse_cursor(cursor: str, keys: Sequence[InstrumentedAttribute]) -> list[Any]:
+    """Converte as chaves do cursor para os tipos das colunas de ordenação."""
+    try:
+        values = decode_cursor(cursor)
+        if len(values) != len(keys):
+            raise ValueError(f"Cursor inválido: {cursor}")
+        return [
+            datetime.fromisoformat(value)
+            if key.type.python_type is datetime
+            else key.type.python_type(value)
+            for key, value in zip(keys, values)
+        ]
+    except ValueError as error:
+        raise InvalidPaginationCursor from error
@@ -0,0 +1,168 @@
+from sqlalchemy import ColumnElement, Row, case, literal
+
+from business_contexts.domain.aggregates.bank_account import Account
+from business_contexts.domain.aggregates.bank_transaction import Transaction
+from business_contexts.domain.aggregates.client import Client
+from business_contexts.domain.aggregates.user import User
+from business_contexts.domain.entities.bank_account import (
+    AccountEntity,
+    AccountVersionEntity,
+)
+from business_contexts.domain.entities.bank_transaction import TransactionEntity
+from business_contexts.domain.entities.client import ClientEntity
+from business_contexts.domain.entities.user import UserEntity
+from business_contexts.domain.value_objects.bank_transaction import TransactionType
+from business_contexts.utils.base_types import PostingStrategy
+from business_contexts.utils.constants import TRANSACTION_POSTING_STRATEGY
+
+# As consultas dos repositórios de consulta projetam apenas as colunas das entidades,
+# que são montadas diretamente das linhas retornadas, sem instanciar os agregados
+# mapeados (mapa de identidade e instrumentação de atributos). As entidades são
+# montadas pelos nomes das colunas de cada linha (row._mapping), independentemente da
+# ordem delas e de colunas adicionais da consulta (como as de ordenação).
+# As funções são chamadas a cada consulta, pois os atributos das classes só existem
+# após o mapeamento (start_mappers).
+
+
+def transaction_columns() -> tuple[ColumnElement, ...]:
+    """Colunas das transações, com os nomes dos campos de TransactionEntity."""
+    return (
+        Transaction.type,
+        Transaction.amount,
+        Transaction.date,
+        Transaction.account_number,
+        Transaction.id,
+        Transaction.destination_account_number,
+        Transaction.balance_after,
+        Transaction.destination_balance_after,
+    )
+
+
+def to_transaction_entity(row: Row) -> TransactionEntity:
+    """Monta a transação a partir das colunas de transaction_columns."""
+    values = row._mapping
+    return TransactionEntity(
+        type=TransactionType(values["type"]),
+        amount=values["amount"],
+        date=values["date"],
+        account_number=values["account_number"],
+        id=values["id"],
+        destination_account_number=values["destination_account_number"],
+        balance_after=values["balance_after"],
+        destination_balance_after=values["destination_balance_after"],
+    )
+
+
+def is_ledger_mode() -> bool:
+    """Indica se as transações são lançadas no modo razão (ledger)."""
+    return PostingStrategy(TRANSACTION_POSTING_STRATEGY) == PostingStrategy.LEDGER
+
+
+def last_sequence_column() -> ColumnElement:
+    """
+    Ordem de lançamento da última transação da conta, que muda a cada lançamento
+    mesmo quando a linha da conta não é atualizada. Fora do modo razão, só as contas
+    particionadas recebem lançamentos sem atualizar a linha (nas parcelas de saldo);
+    para as demais, a versão da linha basta e as subconsultas sobre as transações
+    não são executadas (0).
+    """
+    if is_ledger_mode():
+        return Account.last_sequence
+    return case(
+        (Account.balance_slots > 0, Account.last_sequence), else_=literal(0)
+    ).label("last_sequence")
+
+
+def account_columns() -> tuple[ColumnElement, ...]:
+    """
+    Colunas das contas: ID, número, CPF do cliente, quantidade de parcelas de saldo,
+    versão (as de account_version_columns) e as parcelas do saldo total (saldo da
+    linha, das parcelas de saldo e do razão). O saldo do razão só é consultado no
+    modo razão; nos demais, é 0.
+    """
+    return (
+        Account.id,
+        Account.account_number,
+        Account.client_cpf,
+        Account.balance_slots,
+        Account.version,
+        last_sequence_column(),
+        Account.balance,
+        Account.slots_balance,
+        (
+            Account.ledger_balance
+            if is_ledger_mode()
+            else literal(0).label("ledger_balance")
+        ),
+    )
+
+
+def to_account_entity(
+    row: Row, transactions: list[TransactionEntity] | None = None
+) -> AccountEntity:
+    """Monta a conta a partir das colunas de account_columns e das suas transações."""
+    values = row._mapping
+    return AccountEntity(
+        id=values["id"],
+        account_number=values["account_number"],
+        balance=(
+            values["balance"] + values["slots_balance"] + values["ledger_balance"]
+        ),
+        client_cpf=values["client_cpf"],
+        transactions=transactions,
+        balance_slots=values["balance_slots"],
+        version=values["version"],
+        last_sequence=values["last_sequence"],
+    )
+
+
+def account_version_columns() -> tuple[ColumnElement, ...]:
+    """Colunas da versão das contas, com os nomes dos campos de AccountVersionEntity."""
+    return Account.id, Account.account_number, Account.version, last_sequence_column()
+
+
+def to_account_version_entity(row: Row) -> AccountVersionEntity:
+    """Monta a versão da conta a partir das colunas de account_version_columns."""
+    values = row._mapping
+    return AccountVersionEntity(
+        id=values["id"],
+        account_number=values["account_number"],
+        version=values["version"],
+        last_sequence=values["last_sequence"],
+    )
+
+
+def client_columns() -> tuple[ColumnElement, ...]:
+    """Colunas dos clientes, com os nomes dos campos de ClientEntity."""
+    return Client.id, Client.name, Client.cpf
+
+
+def to_client_entity(row: Row) -> ClientEntity:
+    """Monta o cliente a partir das colunas de client_columns."""
+    values = row._mapping
+    return ClientEntity(id=values["id"], name=values["name"], cpf=values["cpf"])
+
+
+def user_columns(with_password: bool = True) -> tuple[ColumnElement, ...]:
+    """
+    Colunas dos usuários, com os nomes dos campos de UserEntity (a senha, em
+    "password"). Sem a senha, o hash não é lido do banco.
+    """
+    columns = (User.id, User.name, User.email, User.is_admin, User.is_active)
+    return (*columns, User.password) if with_password else columns
+
+
+def to_user_entity(row: Row) -> UserEntity:
+    """
+    Monta o usuário a partir das colunas de user_columns, com a senha vazia se ela
+    não tiver sido lida.
+    """
+    values = row._mapping
+    return UserEntity(
+        id=values["id"],
+        name=values["name"],
+        email=values["email"],
+        is_admin=values["is_admin"],
+        is_active=values["is_active"],
+        _password=values.get("password", ""),
+    )
@@ -1,55 +1,98 @@
 from typing import Sequence
+from uuid import UUID
 
 from sqlalchemy import select
 
 from business_contexts.domain.aggregates.user import User
 from business_contexts.domain.entities.user import UserEntity
+from business_contexts.repository.cache import USER_CACHE
+from business_contexts.repository.query_repo.pagination import paginate, to_page
+from business_contexts.repository.query_repo.projections import (
+    to_user_entity,
+    user_columns,
+)
 from libs.ddd.adapters.repository import QueryRepository
-from libs.ddd.adapters.viewers import Filters
+from libs.ddd.adapters.viewers import Filters, Page, Pagination
 
 
 class UserQueryRepo(QueryRepository):
-    """Repositório de consulta para usuários."""
+    """
+    Repositório de consulta para usuários. As consultas projetam apenas as colunas
+    da entidade, montada diretamente das linhas retornadas.
+    """
 
     async def query_by_filters(self, filters: Filters) -> Sequence[UserEntity]:
         """Consulta usuários aplicando os filtros fornecidos."""
         async with self:
-            users = (
-                (await self.session.execute(select(User).filter_by(**filters)))
-                .scalars()
-                .all()
+            rows = await self.session.execute(
+                select(*user_columns()).filter_by(**filters)
             )
 
-            user_entities: list[UserEntity] = [
-                UserEntity(
-                    id=user.id,
-                    name=user.name,
-                    email=user.email,
-                    is_admin=user.is_admin,
-                    is_active=user.is_active,
-                    _password=user.password,
+            return [to_user_entity(row) for row in rows]
+
+    async def query_page_by_filters(
+        self, filters: Filters, pagination: Pagination
+    ) -> Page[UserEntity]:
+        """
+        Consulta uma página de usuários aplicando os filtros fornecidos, em ordem de ID,
+        a partir do cursor da paginação. A consulta da primeira página de um usuário por
+        ID ou email usa o cache de usuários.
+        """
+        if pagination.after is None and USER_CACHE.accepts(filters):
+            user = await self.__query_cached(filters)
+            return Page(items=[user] if user else [])
+
+        async with self:
+            rows = await self.session.execute(
+                paginate(
+                    select(*user_columns()).filter_by(**filters), pagination, User.id
                 )
-                for user in users
-            ]
+            )
+
+            user_entities = [to_user_entity(row) for row in rows]
 
-        return user_entities
+        return to_page(user_entities, pagination, lambda user: (user.id,))
 
     async def query_one_by_filters(self, filters: Filters) -> UserEntity | None:
-        """Consulta um único usuário aplicando os filtros fornecidos."""
+        """
+        Consulta um único usuário aplicando os filtros fornecidos. A consulta por ID
+        ou email usa o cache de usuários.
+        """
+        if USER_CACHE.accepts(filters):
+            return await self.__query_cached(filters)
+
+        return await self.__query_one(filters)
+
+    async def __query_one(
+        self, filters: Filters, with_password: bool = True
+    ) -> UserEntity | None:
+        """Consulta o único usuário que atende aos filtros, se existir."""
         async with self:
-            user = (
-                await self.session.execute(select(User).filter_by(**filters))
-            ).scalar_one_or_none()
-            if not user:
-                return None
-
-            user_entity = UserEntity(
-                id=user.id,
-                name=user.name,
-                email=user.email,
-                is_admin=user.is_admin,
-                is_active=user.is_active,
-                _password=user.password,
+            row = (
+                await self.session.execute(
+                    select(*user_columns(with_password)).filter_by(**filters)
+                )
+            ).one_or_none()
+
+            return to_user_entity(row) if row else None
+
+    async def __query_cached(self, filters: Filters) -> UserEntity | None:
+        """
+        Consulta o usuário por ID e/ou email no cache de usuários, carregando-o do
+        primário na ausência. O usuário é armazenado sem o hash da senha, lido do
+        banco apenas na autenticação.
+        """
+        self.use_replica = False
+
+        async def load(email: str) -> UserEntity | None:
+            return await self.__query_one(
+                Filters({"email": email}), with_password=False
             )
 
-        return user_entity
+        async def load_email(id: UUID) -> str | None:
+            async with self:
+                return (
+                    await self.session.execute(select(User.email).where(User.id == id))
+                ).scalar_one_or_none()
+
+        return await USER_CACHE.get(filters, load, load_email)
@@ -1,23 +1,28 @@
+from fastapi import HTTPException
 from sqlalchemy import Uuid
 
+from business_contexts.domain.aggregates.bank_account import Account
+from business_contexts.domain.entities.bank_account import (
+    CreateBankAccount,
+    ReadBankAccountBatchItem,
+    UpdateBankAccount,
+)
 from business_contexts.domain.exceptions import (
-    ClientNotFound,
-    BankAccountNotFound,
     BankAccountAlreadyRegistered,
-)
-from business_contexts.repository.query_repo.client import ClientQueryRepo
-from business_contexts.domain.aggregates.bank_account import Account
-from business_contexts.repository.query_repo.bank_account import (
-    BankAccountQueryRepo,
+    BankAccountBatchTooLarge,
+    BankAccountNotFound,
+    ClientNotFound,
+    NegativeBankAccountBalance,
 )
 from business_contexts.repository.domain_repo.bank_account import (
     BankAccountDomainRepo,
 )
-from business_contexts.domain.entities.bank_account import (
-    CreateBankAccount,
-    UpdateBankAccount,
+from business_contexts.repository.query_repo.bank_account import (
+    BankAccountQueryRepo,
 )
+from business_contexts.repository.query_repo.client import ClientQueryRepo
 from business_contexts.utils.base_types import OperationType
+from business_contexts.utils.constants import BANK_ACCOUNT_BATCH_MAX_SIZE
 from libs.ddd.adapters.viewers import Filters
 
 
@@ -41,6 +46,7 @@ async def create_account(
         account_number=bank_account.account_number,
         balance=bank_account.balance,
         client_cpf=bank_account.client_cpf,
+        balance_slots=bank_account.balance_slots,
     )
 
     result_id = await BankAccountDomainRepo().add(
@@ -52,6 +58,54 @@ async def create_account(
     return new_bank_account
 
 
+async def create_accounts_batch(
+    bank_accounts: list[CreateBankAccount],
+) -> list[ReadBankAccountBatchItem]:
+    """
+    Cadastra um lote de contas bancárias em uma única transação de banco de dados.
+    Itens com saldo negativo ou número de conta repetido no lote são rejeitados sem
+    consultar o banco.
+    """
+    if len(bank_accounts) > BANK_ACCOUNT_BATCH_MAX_SIZE:
+        raise BankAccountBatchTooLarge
+
+    results: list[Account | HTTPException] = []
+    batch_account_numbers: set[str] = set()
+    for bank_account in bank_accounts:
+        if bank_account.balance < 0:
+            results.append(NegativeBankAccountBalance())
+            continue
+
+        if bank_account.account_number in batch_account_numbers:
+            results.append(BankAccountAlreadyRegistered())
+            continue
+
+        batch_account_numbers.add(bank_account.account_number)
+        results.append(
+            Account.return_aggregate_for_creation(
+                account_number=bank_account.account_number,
+                balance=bank_account.balance,
+                client_cpf=bank_account.client_cpf,
+                balance_slots=bank_account.balance_slots,
+            )
+        )
+
+    new_accounts = [result for result in results if isinstance(result, Account)]
+    if new_accounts:
+        created_accounts = iter(
+            await BankAccountDomainRepo().add_batch(accounts=new_accounts)
+        )
+        results = [
+            next(created_accounts) if isinstance(result, Account) else result
+            for result in results
+        ]
+
+    return [
+        ReadBankAccountBatchItem.from_result(index=index, result=result)
+        for index, result in enumerate(results)
+    ]
+
+
 async def update_account(
     updated_bank_account: UpdateBankAccount,
 ) -> Account:
@@ -66,6 +120,7 @@ async def update_account(
     account.update(
         account_number=updated_bank_account.account_number,
         client_cpf=updated_bank_account.client_cpf,
+        balance_slots=updated_bank_account.balance_slots,
     )
 
     await BankAccountDomainRepo().add(
@@ -78,7 +133,7 @@ async def update_account(
 
 async def delete_account(id: Uuid) -> str:
     """Remove uma conta bancária pelo ID."""
-    account = await BankAccountDomainRepo().query_by_id(id=id)
+    account = await BankAccountDomainRepo().query_by_id(id=id, with_transactions=False)
 
     if not account:
         raise BankAccountNotFound
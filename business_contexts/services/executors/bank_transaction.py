@@ -1,41 +1,175 @@
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, nullcontext
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
 from business_contexts.domain.aggregates.bank_transaction import Transaction
-from business_contexts.domain.exceptions import BankAccountNotFound
-from business_contexts.repository.query_repo.bank_account import (
-    BankAccountQueryRepo,
+from business_contexts.domain.business_rules.bank_transaction import get_local_time
+from business_contexts.domain.entities.bank_transaction import (
+    CreateBankTransaction,
+    ReadBankTransaction,
+    ReadBankTransactionBatchItem,
 )
-from business_contexts.repository.domain_repo.bank_account import (
-    BankAccountDomainRepo,
+from business_contexts.domain.exceptions import (
+    NegativeTransactionAmount,
+    TransactionBatchTooLarge,
 )
+from business_contexts.domain.value_objects.bank_transaction import TransactionType
+from business_contexts.domain.value_objects.idempotency import IdempotencyRecord
 from business_contexts.repository.domain_repo.bank_transaction import (
     BankTransactionDomainRepo,
 )
-from business_contexts.domain.entities.bank_transaction import (
-    CreateBankTransaction,
+from business_contexts.services.executors.idempotency import run_idempotently
+from business_contexts.services.tasks.group_commit import get_group_commit_writer
+from business_contexts.utils.constants import (
+    ACCOUNT_WRITE_SERIALIZER_ENABLED,
+    TRANSACTION_BATCH_MAX_SIZE,
+    TRANSACTION_GROUP_COMMIT_ENABLED,
 )
-from libs.ddd.adapters.viewers import Filters
+from libs.ddd.adapters.keyed_lock import KeyedLock
+from libs.metrics import METRICS
+
+ACCOUNT_WRITE_LOCKS: KeyedLock[str] = KeyedLock()
 
 
 async def create_bank_transaction(
     bank_transaction: CreateBankTransaction,
-) -> Transaction:
-    """Cadastra uma nova transação bancária, validando as contas envolvidas."""
-    origin_account = await BankAccountDomainRepo().query_by_account_number(
-        account_number=bank_transaction.account_number
-    )
-    if not origin_account:
-        raise BankAccountNotFound
+    idempotency_key: str | None = None,
+    user_id: UUID | None = None,
+) -> Transaction | ReadBankTransaction:
+    """
+    Cadastra uma nova transação bancária; as contas envolvidas são validadas no lançamento.
+    Com uma chave de idempotência, a transação é lançada uma única vez e as
+    repetições da requisição recebem a resposta original; a chave pertence ao
+    usuário autenticado (user_id), que deve ser informado junto com ela.
+    Com o group commit habilitado, a transação é enfileirada e lançada junto com as
+    demais requisições concorrentes do processo, e as validações ocorrem no lote.
+    Requisições com chave de idempotência não passam pelo group commit, pois o
+    registro da chave precisa ser gravado na mesma transação do lançamento.
+    Fora do group commit, lançamentos concorrentes na mesma conta aguardam a vez em
+    memória, sem ocupar conexões do banco de dados.
+    """
+    if idempotency_key:
+        response = await run_idempotently(
+            user_id=user_id,
+            key=idempotency_key,
+            request=bank_transaction,
+            execute=lambda request_hash: post_bank_transaction_idempotently(
+                bank_transaction=bank_transaction,
+                user_id=user_id,
+                idempotency_key=idempotency_key,
+                request_hash=request_hash,
+            ),
+        )
+        return ReadBankTransaction.model_validate_json(response)
 
+    if TRANSACTION_GROUP_COMMIT_ENABLED:
+        return await get_group_commit_writer().submit(bank_transaction)
+
+    async with serialize_account_writes(bank_transaction):
+        new_bank_transaction = build_bank_transaction(bank_transaction)
+        result_id = await BankTransactionDomainRepo().add(
+            transaction=new_bank_transaction,
+        )
+    new_bank_transaction.id = result_id
+
+    return new_bank_transaction
+
+
+@asynccontextmanager
+async def serialize_account_writes(
+    bank_transaction: CreateBankTransaction,
+) -> AsyncIterator[None]:
+    """
+    Aguarda em memória a vez das escritas nas contas da transação neste processo,
+    antes de abrir sessões no banco de dados: as escritas concorrentes na mesma conta
+    formam fila sem ocupar conexões do pool aguardando o bloqueio da linha.
+    O tempo na fila e o tempo no banco de dados são registrados em resumos separados.
+    """
+    account_numbers = [bank_transaction.account_number]
     if bank_transaction.destination_account_number:
-        destination_account = await BankAccountQueryRepo().query_one_by_filters(
-            Filters({"account_number": bank_transaction.destination_account_number})
+        account_numbers.append(bank_transaction.destination_account_number)
+
+    queued_at = time.perf_counter()
+    account_writes = (
+        ACCOUNT_WRITE_LOCKS.hold(*account_numbers)
+        if ACCOUNT_WRITE_SERIALIZER_ENABLED
+        else nullcontext()
+    )
+    async with account_writes:
+        started_at = time.perf_counter()
+        METRICS.observe("account_write_queue_wait_ms", (started_at - queued_at) * 1000)
+        METRICS.set_gauge("account_write_locks", len(ACCOUNT_WRITE_LOCKS))
+        try:
+            yield
+        finally:
+            METRICS.observe(
+                "account_write_db_ms", (time.perf_counter() - started_at) * 1000
+            )
+
+
+def build_bank_transaction(bank_transaction: CreateBankTransaction) -> Transaction:
+    """
+    Cria o agregado da transação sem consultar as contas: a existência das contas e o
+    saldo da conta de origem são verificados pelo repositório no próprio lançamento.
+    """
+    if bank_transaction.amount < 0:
+        raise NegativeTransactionAmount
+
+    return Transaction.return_aggregate_for_creation(
+        type=bank_transaction.type,
+        amount=bank_transaction.amount,
+        date=get_local_time(),
+        account_number=bank_transaction.account_number,
+        destination_account_number=(
+            bank_transaction.destination_account_number or None
+            if bank_transaction.type == TransactionType.TRANSFER
+            else None
+        ),
+    )
+
+
+async def post_bank_transaction_idempotently(
+    bank_transaction: CreateBankTransaction,
+    user_id: UUID,
+    idempotency_key: str,
+    request_hash: str,
+) -> IdempotencyRecord:
+    """Lança a transação gravando, na mesma transação de banco de dados, o registro de idempotência."""
+    async with serialize_account_writes(bank_transaction):
+        new_bank_transaction = build_bank_transaction(bank_transaction)
+        new_bank_transaction.id = uuid4()
+
+        idempotency_record = IdempotencyRecord(
+            user_id=user_id,
+            key=idempotency_key,
+            request_hash=request_hash,
+            response=ReadBankTransaction.from_transaction(
+                new_bank_transaction
+            ).model_dump_json(),
+            created_at=datetime.now(UTC),
         )
-        if not destination_account:
-            raise BankAccountNotFound
+        await BankTransactionDomainRepo().add(
+            transaction=new_bank_transaction,
+            idempotency_record=idempotency_record,
+        )
+
+    return idempotency_record
 
-    new_bank_transaction: Transaction = origin_account.new_transaction(bank_transaction)
-    result_id = await BankTransactionDomainRepo().add(
-        transaction=new_bank_transaction,
+
+async def create_bank_transactions_batch(
+    bank_transactions: list[CreateBankTransaction],
+) -> list[ReadBankTransactionBatchItem]:
+    """Cadastra um lote de transações bancárias em uma única transação de banco de dados."""
+    if len(bank_transactions) > TRANSACTION_BATCH_MAX_SIZE:
+        raise TransactionBatchTooLarge
+
+    results = await BankTransactionDomainRepo().add_batch(
+        bank_transactions=bank_transactions,
     )
-    new_bank_transaction.id = result_id
 
-    return new_bank_transaction
+    return [
+        ReadBankTransactionBatchItem.from_result(index=index, result=result)
+        for index, result in enumerate(results)
+    ]
@@ -0,0 +1,259 @@
+import asyncio
+import csv
+import json
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TextIO
+from uuid import NAMESPACE_URL, UUID, uuid5
+
+import pytz
+
+from business_contexts.domain.entities.bank_account import CreateBankAccount
+from business_contexts.domain.entities.bank_transaction import CreateBankTransaction
+from business_contexts.domain.entities.client import CreateClient
+from business_contexts.domain.value_objects.bank_transaction import TransactionType
+from business_contexts.domain.value_objects.bulk_import import ImportKind
+from business_contexts.repository.domain_repo.bulk_import import (
+    BulkImportDomainRepo,
+)
+from business_contexts.utils.base_types import CPF, AccountNumber
+from business_contexts.utils.constants import IMPORT_BATCH_SIZE
+from libs.metrics import METRICS
+
+# Erros de validação de uma linha: campos ausentes, tipos e valores inválidos
+ROW_ERRORS: tuple[type[Exception], ...] = (
+    ValueError,
+    TypeError,
+    KeyError,
+    ArithmeticError,
+)
+
+
+@dataclass
+class ImportBatch:
+    """Lote de linhas lidas e validadas, pronto para ser importado."""
+
+    records: list[tuple] = field(default_factory=list)
+    rows: dict[int, Any] = field(default_factory=dict)
+    invalid: list[tuple[int, str]] = field(default_factory=list)
+    last_line: int = 0
+
+
+@dataclass
+class ImportReport:
+    """Resumo de uma importação em massa."""
+
+    source: str
+    imported: int = 0
+    rejected: int = 0
+    skipped: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Vazão da importação, em linhas processadas por segundo."""
+        if not self.elapsed_seconds:
+            return 0.0
+        return (self.imported + self.rejected) / self.elapsed_seconds
+
+
+def read_rows(path: Path) -> Iterator[dict[str, Any] | str]:
+    """
+    Lê as linhas de um arquivo CSV (com cabeçalho) ou JSONL, na ordem do arquivo.
+    As linhas JSONL são retornadas como texto e decodificadas na validação, para que
+    uma linha malformada seja rejeitada sem interromper a importação.
+    """
+    with path.open(newline="", encoding="utf-8") as file:
+        if path.suffix.lower() == ".csv":
+            yield from csv.DictReader(file)
+        else:
+            yield from (line for line in file if line.strip())
+
+
+def validate_client(line: int, row: dict[str, Any], source: str) -> tuple:
+    """Valida uma linha de cliente, retornando o registro da tabela de carga."""
+    client = CreateClient(**row)
+    if not client.name.strip():
+        raise ValueError("Nome do cliente não informado")
+
+    return line, client.name, str(CPF(client.cpf))
+
+
+def validate_bank_account(line: int, row: dict[str, Any], source: str) -> tuple:
+    """Valida uma linha de conta bancária, retornando o registro da tabela de carga."""
+    account = CreateBankAccount(
+        **{key: value for key, value in row.items() if value != ""}
+    )
+    if account.balance < 0:
+        raise ValueError("Saldo da conta não pode ser negativo")
+
+    return (
+        line,
+        AccountNumber(account.account_number),
+        account.balance,
+        str(CPF(account.client_cpf)),
+        account.balance_slots,
+    )
+
+
+def validate_bank_transaction(line: int, row: dict[str, Any], source: str) -> tuple:
+    """
+    Valida uma linha de transação bancária, retornando o registro da tabela de carga.
+    A data é obrigatória (datas sem fuso são consideradas no horário de São Paulo) e,
+    sem identificador informado, a transação recebe um derivado da origem e da linha,
+    de modo que reimportar o mesmo arquivo não a duplique.
+    """
+    transaction = CreateBankTransaction(
+        type=row["type"],
+        amount=row["amount"],
+        account_number=row["account_number"],
+        destination_account_number=row.get("destination_account_number") or "",
+    )
+    if transaction.amount < 0:
+        raise ValueError("O valor da transação não pode ser negativo.")
+
+    destination_account_number = None
+    if transaction.type == TransactionType.TRANSFER:
+        if not transaction.destination_account_number:
+            raise ValueError("Conta de destino não informada para a transferência")
+        destination_account_number = AccountNumber(
+            transaction.destination_account_number
+        )
+    elif transaction.destination_account_number:
+        raise ValueError(
+            "Conta de destino informada para transação que não é transferência"
+        )
+
+    date = datetime.fromisoformat(row["date"])
+    if not date.tzinfo:
+        date = pytz.timezone("America/Sao_Paulo").localize(date)
+
+    transaction_id = (
+        UUID(str(row["id"]))
+        if row.get("id")
+        else uuid5(NAMESPACE_URL, f"{source}#{line}")
+    )
+
+    return (
+        line,
+        transaction_id,
+        transaction.type.value,
+        transaction.amount,
+        date,
+        AccountNumber(transaction.account_number),
+        destination_account_number,
+    )
+
+
+ROW_VALIDATORS = {
+    ImportKind.CLIENTS: validate_client,
+    ImportKind.ACCOUNTS: validate_bank_account,
+    ImportKind.TRANSACTIONS: validate_bank_transaction,
+}
+
+
+def read_batches(
+    kind: ImportKind, path: Path, source: str, first_line: int, batch_size: int
+) -> Iterator[ImportBatch]:
+    """Lê e valida o arquivo em lotes, a partir da linha informada."""
+    validate = ROW_VALIDATORS[kind]
+    batch = ImportBatch()
+    for line, row in enumerate(read_rows(path), start=1):
+        if line < first_line:
+            continue
+
+        try:
+            if isinstance(row, str):
+                row = json.loads(row)
+            batch.records.append(validate(line, row, source))
+        except ROW_ERRORS as error:
+            batch.invalid.append((line, str(error)))
+        batch.rows[line] = row
+        batch.last_line = line
+
+        if len(batch.rows) >= batch_size:
+            yield batch
+            batch = ImportBatch()
+
+    if batch.rows:
+        yield batch
+
+
+def write_rejects(
+    rejects: TextIO, batch: ImportBatch, rejected_lines: list[int]
+) -> None:
+    """Registra no arquivo de rejeitados as linhas inválidas e as não incorporadas do lote."""
+    reasons = dict(batch.invalid) | {
+        line: "Registro duplicado, com cliente/conta inexistente ou sem saldo suficiente"
+        for line in rejected_lines
+    }
+    rejects.writelines(
+        json.dumps(
+            {"line": line, "reason": reasons[line], "row": batch.rows[line]},
+            default=str,
+            ensure_ascii=False,
+        )
+        + "\n"
+        for line in sorted(reasons)
+    )
+    rejects.flush()
+
+
+async def import_file(
+    kind: ImportKind,
+    path: Path,
+    source: str | None = None,
+    rejects_path: Path | None = None,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> ImportReport:
+    """
+    Importa um arquivo CSV ou JSONL de clientes, contas ou transações em lotes.
+    A importação é retomada a partir do último lote confirmado da mesma origem, e a
+    leitura e validação de cada lote ocorrem em uma thread enquanto o lote anterior é
+    gravado no banco de dados. As linhas rejeitadas são registradas em JSONL no
+    arquivo de rejeitados (por padrão, ao lado do arquivo importado).
+    """
+    source = source or f"{kind.value}:{path.resolve()}"
+    rejects_path = rejects_path or path.with_name(f"{path.name}.rejected.jsonl")
+    report = ImportReport(source=source)
+    started_at = time.monotonic()
+
+    checkpoint = await BulkImportDomainRepo().query_checkpoint(source)
+    first_line = checkpoint.line + 1 if checkpoint else 1
+    report.skipped = first_line - 1
+
+    batches = read_batches(kind, path, source, first_line, batch_size)
+    with rejects_path.open("a", encoding="utf-8") as rejects:
+        batch = await asyncio.to_thread(next, batches, None)
+        while batch:
+            posting = asyncio.create_task(
+                BulkImportDomainRepo().import_batch(
+                    kind,
+                    source,
+                    batch.records,
+                    batch.last_line,
+                    invalid=len(batch.invalid),
+                )
+            )
+            try:
+                next_batch = await asyncio.to_thread(next, batches, None)
+            finally:
+                rejected_lines = await posting
+
+            write_rejects(rejects, batch, rejected_lines)
+            rejected = len(batch.invalid) + len(rejected_lines)
+            report.imported += len(batch.rows) - rejected
+            report.rejected += rejected
+            METRICS.increment(
+                "bulk_import_rows", label=kind.value, value=len(batch.rows) - rejected
+            )
+            METRICS.increment(
+                "bulk_import_rejected_rows", label=kind.value, value=rejected
+            )
+            batch = next_batch
+
+    report.elapsed_seconds = time.monotonic() - started_at
+    return report
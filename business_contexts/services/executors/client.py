@@ -1,19 +1,24 @@
+from fastapi import HTTPException
 from sqlalchemy import Uuid
 
 from business_contexts.domain.aggregates.client import Client
+from business_contexts.domain.entities.client import (
+    CreateClient,
+    ReadClientBatchItem,
+    UpdateClient,
+)
 from business_contexts.domain.exceptions import (
     ClientAlreadyRegistered,
+    ClientBatchTooLarge,
     ClientNotFound,
+    InvalidClientCPF,
 )
+from business_contexts.repository.domain_repo.client import ClientDomainRepo
 from business_contexts.repository.query_repo.client import (
     ClientQueryRepo,
 )
-from business_contexts.repository.domain_repo.client import ClientDomainRepo
-from business_contexts.domain.entities.client import (
-    CreateClient,
-    UpdateClient,
-)
-from business_contexts.utils.base_types import OperationType, CPF
+from business_contexts.utils.base_types import CPF, OperationType
+from business_contexts.utils.constants import CLIENT_BATCH_MAX_SIZE
 from libs.ddd.adapters.viewers import Filters
 
 
@@ -41,6 +46,46 @@ async def create_client(
     return new_client
 
 
+async def create_clients_batch(
+    clients: list[CreateClient],
+) -> list[ReadClientBatchItem]:
+    """
+    Cadastra um lote de clientes em uma única transação de banco de dados.
+    Itens com CPF inválido ou repetido no lote são rejeitados sem consultar o banco.
+    """
+    if len(clients) > CLIENT_BATCH_MAX_SIZE:
+        raise ClientBatchTooLarge
+
+    results: list[Client | HTTPException] = []
+    batch_cpfs: set[str] = set()
+    for client in clients:
+        try:
+            cpf = CPF(client.cpf)
+        except ValueError:
+            results.append(InvalidClientCPF())
+            continue
+
+        if cpf in batch_cpfs:
+            results.append(ClientAlreadyRegistered())
+            continue
+
+        batch_cpfs.add(cpf)
+        results.append(Client.return_aggregate_for_creation(name=client.name, cpf=cpf))
+
+    new_clients = [result for result in results if isinstance(result, Client)]
+    if new_clients:
+        created_clients = iter(await ClientDomainRepo().add_batch(clients=new_clients))
+        results = [
+            next(created_clients) if isinstance(result, Client) else result
+            for result in results
+        ]
+
+    return [
+        ReadClientBatchItem.from_result(index=index, result=result)
+        for index, result in enumerate(results)
+    ]
+
+
 async def update_client(updated_client: UpdateClient) -> Client:
     """Atualiza os dados de um cliente existente."""
     client = await ClientDomainRepo().query_by_id(id=updated_client._id)
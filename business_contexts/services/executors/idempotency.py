@@ -0,0 +1,109 @@
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from business_contexts.domain.entities.idempotency import IdempotencyRecordEntity
+from business_contexts.domain.exceptions import (
+    IdempotencyKeyReused,
+    IdempotentRequestAlreadyProcessed,
+)
+from business_contexts.domain.value_objects.idempotency import IdempotencyRecord
+from business_contexts.repository.query_repo.idempotency import (
+    IdempotencyRecordQueryRepo,
+)
+from business_contexts.utils.constants import (
+    IDEMPOTENCY_CACHE_MAX_SIZE,
+    IDEMPOTENCY_KEY_TTL_HOURS,
+)
+from libs.ddd.adapters.cache import LRUCache
+from libs.ddd.adapters.viewers import Filters
+from libs.metrics import METRICS
+
+IdempotencyKey = tuple[UUID, str]
+
+IDEMPOTENCY_CACHE: LRUCache[
+    IdempotencyKey, IdempotencyRecordEntity | IdempotencyRecord
+] = LRUCache(
+    max_size=IDEMPOTENCY_CACHE_MAX_SIZE,
+    ttl_seconds=IDEMPOTENCY_KEY_TTL_HOURS * 3600,
+)
+IN_FLIGHT_REQUESTS: dict[IdempotencyKey, asyncio.Future[None]] = {}
+
+
+def hash_request(request: BaseModel) -> str:
+    """Gera o hash (SHA-256) do corpo da requisição, usado para detectar reuso de chave."""
+    return hashlib.sha256(request.model_dump_json().encode()).hexdigest()
+
+
+async def find_idempotency_record(
+    user_id: UUID, key: str
+) -> IdempotencyRecordEntity | IdempotencyRecord | None:
+    """Busca o registro da chave do usuário no cache em memória e, em seguida, no banco de dados."""
+    record = IDEMPOTENCY_CACHE.get((user_id, key))
+    if record:
+        METRICS.increment("idempotency_cache_hits")
+        return record
+
+    record = await IdempotencyRecordQueryRepo().query_one_by_filters(
+        Filters({"user_id": user_id, "key": key})
+    )
+    if record:
+        IDEMPOTENCY_CACHE.set((user_id, key), record)
+
+    return record
+
+
+def replay_response(
+    record: IdempotencyRecordEntity | IdempotencyRecord, request_hash: str
+) -> str:
+    """Retorna a resposta armazenada, desde que a chave tenha sido usada com a mesma requisição."""
+    if record.request_hash != request_hash:
+        raise IdempotencyKeyReused
+
+    METRICS.increment("idempotency_replays")
+    return record.response
+
+
+async def run_idempotently(
+    user_id: UUID,
+    key: str,
+    request: BaseModel,
+    execute: Callable[[str], Awaitable[IdempotencyRecord]],
+) -> str:
+    """
+    Executa a operação uma única vez por chave de idempotência do usuário, retornando a
+    resposta serializada; usuários diferentes podem usar a mesma chave. A operação recebe o hash da requisição e deve gravar o registro de
+    idempotência na mesma transação de banco de dados em que é confirmada.
+    Requisições duplicadas concorrentes no processo aguardam a que está em andamento
+    e reaproveitam a sua resposta; entre processos, o índice único da chave garante
+    que apenas uma delas seja confirmada.
+    """
+    request_hash = hash_request(request)
+    scoped_key = (user_id, key)
+
+    while in_flight := IN_FLIGHT_REQUESTS.get(scoped_key):
+        await asyncio.shield(in_flight)
+
+    in_flight = asyncio.get_running_loop().create_future()
+    IN_FLIGHT_REQUESTS[scoped_key] = in_flight
+    try:
+        record = await find_idempotency_record(user_id, key)
+        if record:
+            return replay_response(record, request_hash)
+
+        try:
+            record = await execute(request_hash)
+        except IdempotentRequestAlreadyProcessed:
+            record = await find_idempotency_record(user_id, key)
+            if not record:
+                raise
+            return replay_response(record, request_hash)
+
+        IDEMPOTENCY_CACHE.set(scoped_key, record)
+        return record.response
+    finally:
+        del IN_FLIGHT_REQUESTS[scoped_key]
+        in_flight.set_result(None)
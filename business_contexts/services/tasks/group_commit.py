@@ -0,0 +1,161 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import sentry_sdk
+from fastapi import HTTPException
+
+from business_contexts.domain.aggregates.bank_transaction import Transaction
+from business_contexts.domain.entities.bank_transaction import (
+    CreateBankTransaction,
+)
+from business_contexts.repository.domain_repo.bank_transaction import (
+    BankTransactionDomainRepo,
+)
+from business_contexts.utils.constants import (
+    TRANSACTION_GROUP_COMMIT_FLUSH_INTERVAL_MS,
+    TRANSACTION_GROUP_COMMIT_MAX_BATCH_SIZE,
+)
+from libs.ddd.adapters.repository import DATABASE_ERRORS
+from libs.metrics import METRICS
+
+PostBatch = Callable[
+    [list[CreateBankTransaction]], Awaitable[list[Transaction | HTTPException]]
+]
+
+
+class GroupCommitWriter:
+    """
+    Agrupa transações bancárias concorrentes do mesmo processo e as lança em lotes,
+    cada lote confirmado em uma única transação de banco de dados (group commit).
+    Um lote é enviado quando atinge o tamanho máximo ou quando o intervalo de
+    espera se esgota, e cada requisição recebe o seu próprio resultado ou erro.
+    """
+
+    def __init__(
+        self,
+        post_batch: PostBatch,
+        flush_interval_ms: int = TRANSACTION_GROUP_COMMIT_FLUSH_INTERVAL_MS,
+        max_batch_size: int = TRANSACTION_GROUP_COMMIT_MAX_BATCH_SIZE,
+    ) -> None:
+        """Inicializa o escritor com a função que lança um lote e os limites de agrupamento."""
+        self.post_batch = post_batch
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_batch_size = max_batch_size
+        self._queue: asyncio.Queue[
+            tuple[CreateBankTransaction, asyncio.Future[Transaction]]
+        ] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Inicia a tarefa de agrupamento, caso ainda não esteja em execução."""
+        if not self._worker or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Lança as transações pendentes e encerra a tarefa de agrupamento."""
+        if not self._worker:
+            return
+        await self._queue.join()
+        if not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+    async def submit(self, bank_transaction: CreateBankTransaction) -> Transaction:
+        """Enfileira uma transação e aguarda o lançamento do lote em que ela foi incluída."""
+        self.start()
+        future: asyncio.Future[Transaction] = asyncio.get_running_loop().create_future()
+        await self._queue.put((bank_transaction, future))
+        METRICS.set_gauge("group_commit_queue_depth", self._queue.qsize())
+        return await future
+
+    async def _run(self) -> None:
+        """Consome a fila continuamente, montando e lançando os lotes."""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = asyncio.get_running_loop().time() + self.flush_interval
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
+
+            METRICS.set_gauge("group_commit_queue_depth", self._queue.qsize())
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(
+        self, batch: list[tuple[CreateBankTransaction, asyncio.Future[Transaction]]]
+    ) -> None:
+        """Lança um lote e entrega a cada requisição o seu resultado ou erro."""
+        METRICS.set_gauge("group_commit_batch_size", len(batch))
+        METRICS.increment("group_commit_batches", label="total")
+        METRICS.increment("group_commit_transactions", label="total", value=len(batch))
+
+        try:
+            results = await self.post_batch(
+                [bank_transaction for bank_transaction, _ in batch]
+            )
+        except DATABASE_ERRORS as error:
+            self._fail(batch, error)
+            return
+        except Exception as error:  # noqa: BLE001
+            # Erros de programação também são entregues às requisições do lote e
+            # registrados, sem encerrar a tarefa: as requisições enfileiradas atrás
+            # do lote seguem sendo lançadas
+            sentry_sdk.capture_exception(error)
+            self._fail(batch, error)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, HTTPException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    def _fail(
+        batch: list[tuple[CreateBankTransaction, asyncio.Future[Transaction]]],
+        error: Exception,
+    ) -> None:
+        """Entrega o erro às requisições do lote que ainda aguardam o resultado."""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+
+GROUP_COMMIT_WRITER: GroupCommitWriter | None = None
+
+
+def get_group_commit_writer() -> GroupCommitWriter:
+    """Retorna o escritor de group commit do processo, criando-o se necessário."""
+    global GROUP_COMMIT_WRITER
+
+    if not GROUP_COMMIT_WRITER:
+        GROUP_COMMIT_WRITER = GroupCommitWriter(
+            post_batch=lambda bank_transactions: BankTransactionDomainRepo().add_batch(
+                bank_transactions=bank_transactions
+            ),
+        )
+
+    return GROUP_COMMIT_WRITER
+
+
+async def stop_group_commit_writer() -> None:
+    """Encerra o escritor de group commit do processo, se estiver ativo."""
+    global GROUP_COMMIT_WRITER
+
+    if GROUP_COMMIT_WRITER:
+        await GROUP_COMMIT_WRITER.stop()
+        GROUP_COMMIT_WRITER = None
@@ -0,0 +1,70 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import sentry_sdk
+
+from business_contexts.repository.domain_repo.idempotency import (
+    IdempotencyRecordDomainRepo,
+)
+from business_contexts.utils.constants import (
+    IDEMPOTENCY_EXPIRATION_INTERVAL_SECONDS,
+    IDEMPOTENCY_KEY_TTL_HOURS,
+)
+from libs.ddd.adapters.repository import DATABASE_ERRORS
+from libs.metrics import METRICS
+
+
+class IdempotencyRecordExpirer:
+    """Remove periodicamente os registros de idempotência mais antigos que o tempo de vida da chave."""
+
+    def __init__(
+        self,
+        interval_seconds: int = IDEMPOTENCY_EXPIRATION_INTERVAL_SECONDS,
+        ttl_hours: int = IDEMPOTENCY_KEY_TTL_HOURS,
+    ) -> None:
+        """Inicializa a tarefa com o intervalo entre execuções e o tempo de vida das chaves."""
+        self.interval_seconds = interval_seconds
+        self.ttl = timedelta(hours=ttl_hours)
+        self._worker: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Inicia a tarefa de expiração, caso ainda não esteja em execução."""
+        if not self._worker or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Encerra a tarefa de expiração."""
+        if not self._worker:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def expire(self) -> int:
+        """Remove os registros expirados, retornando quantos foram removidos."""
+        removed = await IdempotencyRecordDomainRepo().remove_expired(
+            created_before=datetime.now(UTC) - self.ttl
+        )
+        METRICS.increment("idempotency_records_expired", label="total", value=removed)
+        return removed
+
+    async def _run(self) -> None:
+        """Executa a expiração continuamente, no intervalo configurado."""
+        while True:
+            try:
+                await self.expire()
+            except DATABASE_ERRORS as error:
+                sentry_sdk.capture_exception(error)
+            except Exception as error:  # noqa: BLE001
+                # Erros inesperados também são registrados, sem encerrar a tarefa
+                sentry_sdk.capture_exception(error)
+                METRICS.increment(
+                    "background_task_errors", label="idempotency_expiration"
+                )
+            await asyncio.sleep(self.interval_seconds)
+
+
+IDEMPOTENCY_RECORD_EXPIRER: IdempotencyRecordExpirer = IdempotencyRecordExpirer()
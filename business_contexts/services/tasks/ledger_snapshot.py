@@ -0,0 +1,78 @@
+import asyncio
+
+import sentry_sdk
+
+from business_contexts.repository.domain_repo.bank_account import (
+    BankAccountDomainRepo,
+)
+from business_contexts.utils.constants import (
+    LEDGER_SNAPSHOT_INTERVAL_SECONDS,
+    LEDGER_SNAPSHOT_MIN_ENTRIES,
+)
+from libs.ddd.adapters.repository import DATABASE_ERRORS
+from libs.metrics import METRICS
+
+
+class LedgerSnapshotter:
+    """
+    Grava periodicamente pontos de verificação do saldo das contas lançadas no razão
+    (ledger), para que a leitura do saldo some apenas as movimentações recentes.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: int = LEDGER_SNAPSHOT_INTERVAL_SECONDS,
+        min_entries: int = LEDGER_SNAPSHOT_MIN_ENTRIES,
+    ) -> None:
+        """Inicializa a tarefa com o intervalo entre execuções e o mínimo de movimentações pendentes."""
+        self.interval_seconds = interval_seconds
+        self.min_entries = min_entries
+        self._worker: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Inicia a tarefa de pontos de verificação, caso ainda não esteja em execução."""
+        if not self._worker or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Encerra a tarefa de pontos de verificação."""
+        if not self._worker:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def snapshot(self) -> int:
+        """Grava os pontos de verificação pendentes, retornando quantos foram criados."""
+        account_numbers = (
+            await BankAccountDomainRepo().query_account_numbers_pending_snapshot(
+                min_entries=self.min_entries
+            )
+        )
+
+        created = 0
+        for account_number in account_numbers:
+            if await BankAccountDomainRepo().add_balance_snapshot(account_number):
+                created += 1
+
+        METRICS.increment("ledger_snapshots", label="total", value=created)
+        return created
+
+    async def _run(self) -> None:
+        """Executa os pontos de verificação continuamente, no intervalo configurado."""
+        while True:
+            try:
+                await self.snapshot()
+            except DATABASE_ERRORS as error:
+                sentry_sdk.capture_exception(error)
+            except Exception as error:  # noqa: BLE001
+                # Erros inesperados também são registrados, sem encerrar a tarefa
+                sentry_sdk.capture_exception(error)
+                METRICS.increment("background_task_errors", label="ledger_snapshot")
+            await asyncio.sleep(self.interval_seconds)
+
+
+LEDGER_SNAPSHOTTER: LedgerSnapshotter = LedgerSnapshotter()
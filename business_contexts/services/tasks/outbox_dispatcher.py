@@ -0,0 +1,131 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+
+import sentry_sdk
+
+from business_contexts.repository.domain_repo.outbox import OutboxDomainRepo
+from business_contexts.utils.constants import (
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_CLAIM_TIMEOUT_MS,
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_POLL_INTERVAL_MS,
+)
+from libs.ddd.adapters.cache import CacheBackendError
+from libs.ddd.adapters.repository import DATABASE_ERRORS
+from libs.ddd.domain.event import OutboxDeliveryError, OutboxMessage
+from libs.metrics import METRICS
+
+EventHandler = Callable[[OutboxMessage], Awaitable[None]]
+
+# Falhas de entrega que são registradas na mensagem e tentadas novamente no próximo
+# lote; demais erros dos handlers são erros de programação e encerram o dispatcher
+DELIVERY_ERRORS: tuple[type[Exception], ...] = (
+    *DATABASE_ERRORS,
+    CacheBackendError,
+    OutboxDeliveryError,
+)
+
+
+class OutboxDispatcher:
+    """
+    Entrega os eventos de domínio gravados na tabela de outbox aos handlers
+    registrados para cada tipo de evento, fora do caminho das requisições.
+    Mensagens de tipos sem handler registrado permanecem na outbox.
+    A entrega é de ao menos uma vez: os handlers devem ser idempotentes.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        poll_interval_ms: int = OUTBOX_POLL_INTERVAL_MS,
+        max_attempts: int = OUTBOX_MAX_ATTEMPTS,
+        claim_timeout_ms: int = OUTBOX_CLAIM_TIMEOUT_MS,
+    ) -> None:
+        """
+        Inicializa o dispatcher com o tamanho do lote, o intervalo de consulta, o limite
+        de tentativas e o prazo da reivindicação de um lote.
+        """
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval_ms / 1000
+        self.max_attempts = max_attempts
+        self.claim_timeout_ms = claim_timeout_ms
+        self.handlers: dict[str, list[EventHandler]] = defaultdict(list)
+        self._worker: asyncio.Task | None = None
+
+    def register(self, event_type: str, handler: EventHandler) -> None:
+        """Registra um handler para um tipo de evento (ex.: "TransactionPosted")."""
+        self.handlers[event_type].append(handler)
+
+    def start(self) -> None:
+        """Inicia a tarefa de entrega, caso ainda não esteja em execução."""
+        if not self._worker or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Encerra a tarefa de entrega, caso ela ainda esteja em execução."""
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+    async def deliver(self, message: OutboxMessage) -> None:
+        """Entrega a mensagem a todos os handlers registrados para o seu tipo de evento."""
+        for handler in self.handlers.get(message.event_type, []):
+            await handler(message)
+
+    async def dispatch(self) -> int:
+        """
+        Reivindica um lote de mensagens pendentes dos tipos com handler registrado e as
+        entrega fora da transação da reivindicação; o resultado é registrado em outra
+        transação curta. Retorna a quantidade de mensagens reivindicadas.
+        """
+        if not self.handlers:
+            return 0
+
+        messages = await OutboxDomainRepo().claim_batch(
+            event_types=list(self.handlers),
+            batch_size=self.batch_size,
+            max_attempts=self.max_attempts,
+            claim_timeout_ms=self.claim_timeout_ms,
+        )
+        METRICS.increment("outbox_messages_claimed", label="total", value=len(messages))
+
+        delivered: list[OutboxMessage] = []
+        failed: list[tuple[OutboxMessage, Exception]] = []
+        try:
+            for message in messages:
+                try:
+                    await self.deliver(message)
+                except DELIVERY_ERRORS as error:
+                    failed.append((message, error))
+                else:
+                    delivered.append(message)
+        finally:
+            # Um erro de programação interrompe o lote: as mensagens já entregues são
+            # removidas e as restantes voltam a ser reivindicáveis ao fim do prazo
+            await OutboxDomainRepo().finish_batch(delivered, failed)
+        return len(messages)
+
+    async def _run(self) -> None:
+        """Entrega lotes continuamente, aguardando o intervalo quando a outbox esvazia."""
+        while True:
+            try:
+                claimed = await self.dispatch()
+            except DATABASE_ERRORS as error:
+                sentry_sdk.capture_exception(error)
+                claimed = 0
+            except Exception as error:  # noqa: BLE001
+                # Erros inesperados (como os de programação dos handlers) também são
+                # registrados, sem encerrar a tarefa
+                sentry_sdk.capture_exception(error)
+                METRICS.increment("background_task_errors", label="outbox_dispatcher")
+                claimed = 0
+            if claimed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+
+OUTBOX_DISPATCHER: OutboxDispatcher = OutboxDispatcher()
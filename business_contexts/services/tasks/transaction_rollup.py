@@ -0,0 +1,76 @@
+import asyncio
+
+import sentry_sdk
+
+from business_contexts.repository.domain_repo.bank_account import (
+    BankAccountDomainRepo,
+)
+from business_contexts.utils.constants import (
+    TRANSACTION_ROLLUP_BATCH_SIZE,
+    TRANSACTION_ROLLUP_INTERVAL_MS,
+)
+from libs.ddd.adapters.repository import DATABASE_ERRORS
+from libs.metrics import METRICS
+
+
+class TransactionRollupProjector:
+    """
+    Projeta continuamente as transações lançadas nos totais diários das contas, fora
+    do caminho dos lançamentos, para que os resumos diários e mensais não precisem
+    varrer o histórico de transações.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = TRANSACTION_ROLLUP_BATCH_SIZE,
+        interval_ms: int = TRANSACTION_ROLLUP_INTERVAL_MS,
+    ) -> None:
+        """Inicializa o projetor com o tamanho do lote e o intervalo entre consultas."""
+        self.batch_size = batch_size
+        self.interval = interval_ms / 1000
+        self._worker: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Inicia a tarefa de projeção, caso ainda não esteja em execução."""
+        if not self._worker or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Encerra a tarefa de projeção."""
+        if not self._worker:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def project(self) -> int:
+        """Agrega um lote de transações pendentes, retornando quantas agregou."""
+        projected = await BankAccountDomainRepo().project_daily_rollups(
+            batch_size=self.batch_size
+        )
+        METRICS.increment(
+            "transaction_rollups_projected", label="total", value=projected
+        )
+        return projected
+
+    async def _run(self) -> None:
+        """Agrega lotes continuamente, aguardando o intervalo se o lote não enche."""
+        while True:
+            try:
+                projected = await self.project()
+            except DATABASE_ERRORS as error:
+                sentry_sdk.capture_exception(error)
+                projected = 0
+            except Exception as error:  # noqa: BLE001
+                # Erros inesperados também são registrados, sem encerrar a tarefa
+                sentry_sdk.capture_exception(error)
+                METRICS.increment("background_task_errors", label="transaction_rollup")
+                projected = 0
+            if projected < self.batch_size:
+                await asyncio.sleep(self.interval)
+
+
+TRANSACTION_ROLLUP_PROJECTOR: TransactionRollupProjector = TransactionRollupProjector()
@@ -0,0 +1,103 @@
+import csv
+import io
+import json
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+from decimal import Decimal
+
+from fastapi import Request
+
+from business_contexts.domain.entities.bank_transaction import TransactionEntity
+from business_contexts.utils.base_types import ExportFormat
+from libs.metrics import METRICS
+
+# Campos da exportação, compatíveis com a importação em massa de transações
+EXPORT_FIELDS: tuple[str, ...] = (
+    "id",
+    "type",
+    "amount",
+    "date",
+    "account_number",
+    "destination_account_number",
+    "balance_after",
+    "destination_balance_after",
+)
+
+EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def to_export_values(transaction: TransactionEntity) -> tuple[str | None, ...]:
+    """Retorna os valores exportados da transação, na ordem de EXPORT_FIELDS."""
+    return (
+        str(transaction.id),
+        transaction.type.value,
+        str(transaction.amount),
+        transaction.date.isoformat(),
+        transaction.account_number,
+        transaction.destination_account_number,
+        _to_text(transaction.balance_after),
+        _to_text(transaction.destination_balance_after),
+    )
+
+
+async def encode_transactions(
+    partitions: AsyncIterator[Sequence[TransactionEntity]],
+    export_format: ExportFormat,
+) -> AsyncIterator[bytes]:
+    """
+    Codifica as transações no formato informado à medida que os lotes chegam, com um
+    bloco de bytes por lote. No CSV, o cabeçalho é entregue antes da primeira consulta.
+    """
+    if export_format == ExportFormat.CSV:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_FIELDS)
+        yield buffer.getvalue().encode()
+        async for transactions in partitions:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(
+                to_export_values(transaction) for transaction in transactions
+            )
+            yield buffer.getvalue().encode()
+        return
+
+    async for transactions in partitions:
+        yield "".join(
+            json.dumps(
+                dict(zip(EXPORT_FIELDS, to_export_values(transaction))),
+                ensure_ascii=False,
+            )
+            + "\n"
+            for transaction in transactions
+        ).encode()
+
+
+async def stream_until_disconnected(
+    request: Request,
+    partitions: AsyncGenerator[Sequence[TransactionEntity]],
+) -> AsyncIterator[Sequence[TransactionEntity]]:
+    """
+    Repassa os lotes de transações enquanto o cliente estiver conectado, verificando
+    a conexão antes de cada lote. Ao fim, antecipado ou não, fecha o gerador de
+    origem, encerrando o cursor no banco; exportações interrompidas são
+    contabilizadas na métrica "transaction_exports_interrupted".
+    """
+    completed = False
+    try:
+        async for transactions in partitions:
+            if await request.is_disconnected():
+                return
+            yield transactions
+        completed = True
+    finally:
+        if not completed:
+            METRICS.increment("transaction_exports_interrupted", label="total")
+        await partitions.aclose()
+
+
+def _to_text(value: Decimal | None) -> str | None:
+    """Converte o valor numérico em texto, preservando a ausência de valor."""
+    return None if value is None else str(value)
@@ -0,0 +1,56 @@
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import Response, status
+
+from business_contexts.domain.entities.bank_account import (
+    AccountEntity,
+    AccountVersionEntity,
+)
+from business_contexts.utils.constants import ETAG_HEADER, NEXT_CURSOR_HEADER
+from libs.ddd.adapters.viewers import Page, compute_etag
+from libs.metrics import METRICS
+
+
+def account_etag(
+    accounts: Page[AccountEntity] | Page[AccountVersionEntity],
+    list_transactions: bool,
+) -> str:
+    """
+    Calcula a ETag de uma página de contas pela versão de cada conta (versão da linha
+    e última transação), pelo cursor da próxima página e pela presença das transações
+    na representação. A página de contas e a de versões das mesmas contas, no mesmo
+    estado, têm a mesma ETag.
+    """
+    return compute_etag(
+        "accounts",
+        list_transactions,
+        accounts.next_cursor,
+        *(
+            (account.id, account.account_number, account.version, account.last_sequence)
+            for account in accounts.items
+        ),
+    )
+
+
+def transaction_etag(
+    keys: Sequence[tuple[datetime, UUID]], next_cursor: str | None
+) -> str:
+    """
+    Calcula a ETag de uma página de transações pelos IDs das transações, que não são
+    alteradas após o lançamento, e pelo cursor da próxima página.
+    """
+    return compute_etag("transactions", next_cursor, *(id for _, id in keys))
+
+
+def not_modified(etag: str, next_cursor: str | None = None) -> Response:
+    """
+    Retorna a resposta 304 (Not Modified), sem corpo, com a ETag e o cursor da próxima
+    página; as respostas são contabilizadas na métrica "not_modified_responses".
+    """
+    METRICS.increment("not_modified_responses")
+    headers = {ETAG_HEADER: etag}
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
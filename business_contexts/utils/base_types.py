@@ -1,6 +1,9 @@
 from enum import Enum
 from random import randint
+from typing import Any
 
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
 from validate_docbr import CPF as CPFValidator
 
 
@@ -12,6 +15,44 @@ class OperationType(Enum):
     DELETE = "delete"
 
 
+class PostingStrategy(Enum):
+    """Estratégias disponíveis para lançamento de transações bancárias."""
+
+    ATOMIC = "atomic"
+    PESSIMISTIC = "pessimistic"
+    OPTIMISTIC = "optimistic"
+    LEDGER = "ledger"
+
+
+class IsolationLevel(Enum):
+    """Níveis de isolamento de transação suportados pelo PostgreSQL."""
+
+    READ_COMMITTED = "READ COMMITTED"
+    REPEATABLE_READ = "REPEATABLE READ"
+    SERIALIZABLE = "SERIALIZABLE"
+
+
+class ExportFormat(Enum):
+    """Formatos disponíveis para a exportação de registros."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class SummaryPeriod(Enum):
+    """Períodos de agrupamento dos resumos de movimentação das contas."""
+
+    DAY = "day"
+    MONTH = "month"
+
+
+class CacheBackendType(Enum):
+    """Armazenamentos disponíveis para o cache de entidades."""
+
+    MEMORY = "memory"
+    REDIS = "redis"
+
+
 class CPF(str):
     """Tipo de valor que representa e valida um CPF brasileiro."""
 
@@ -55,6 +96,15 @@ class AccountNumber(str):
         cls.validate(account_number)
         return account_number
 
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        """Valida o número da conta nos modelos e na desserialização do pydantic."""
+        return core_schema.no_info_after_validator_function(
+            cls, core_schema.str_schema()
+        )
+
     @classmethod
     def validate(cls, account_number: str) -> None:
         """Valida se o número da conta possui pelo menos três dígitos numéricos."""
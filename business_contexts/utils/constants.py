@@ -28,6 +28,12 @@ DB_PORT: int = int(get_config_value("DB_PORT", "54321"))
 DB_PASSWORD: str = get_config_value("DB_PASSWORD", "postgres")
 DB_USER: str = get_config_value("DB_USER", "postgres")
 DB_NAME: str = get_config_value("DB_NAME", "transacoes_bancarias")
+DB_REPLICA_HOST: str = get_config_value("DB_REPLICA_HOST", default="")
+DB_REPLICA_PORT: int = int(get_config_value("DB_REPLICA_PORT", str(DB_PORT)))
+DB_REPLICA_LSN_REFRESH_MS: int = int(
+    get_config_value("DB_REPLICA_LSN_REFRESH_MS", default="50")
+)
+CONSISTENCY_TOKEN_HEADER: str = "X-Consistency-Token"
 
 SENTRY_DSN: str = get_config_value("SENTRY_DSN", default="")
 
@@ -37,6 +43,139 @@ ACCESS_TOKEN_EXPIRE_MINUTES: int = int(
     get_config_value("ACCESS_TOKEN_EXPIRE_MINUTES", default="30")
 )
 
+BALANCE_CHECK_CONSTRAINT: str = "ck_bank_account_balance_non_negative"
+MAX_BALANCE_SLOTS: int = 64
+TRANSACTION_POSTING_STRATEGY: str = get_config_value(
+    "TRANSACTION_POSTING_STRATEGY", default="atomic"
+)
+OPTIMISTIC_POSTING_MAX_ATTEMPTS: int = int(
+    get_config_value("OPTIMISTIC_POSTING_MAX_ATTEMPTS", default="3")
+)
+TRANSACTION_BATCH_MAX_SIZE: int = int(
+    get_config_value("TRANSACTION_BATCH_MAX_SIZE", default="1000")
+)
+CLIENT_BATCH_MAX_SIZE: int = int(
+    get_config_value("CLIENT_BATCH_MAX_SIZE", default="5000")
+)
+BANK_ACCOUNT_BATCH_MAX_SIZE: int = int(
+    get_config_value("BANK_ACCOUNT_BATCH_MAX_SIZE", default="5000")
+)
+PAGE_DEFAULT_SIZE: int = int(get_config_value("PAGE_DEFAULT_SIZE", default="100"))
+PAGE_MAX_SIZE: int = int(get_config_value("PAGE_MAX_SIZE", default="1000"))
+NEXT_CURSOR_HEADER: str = "X-Next-Cursor"
+ETAG_HEADER: str = "ETag"
+TRANSACTION_EXPORT_FETCH_SIZE: int = int(
+    get_config_value("TRANSACTION_EXPORT_FETCH_SIZE", default="1000")
+)
+ACCOUNT_WRITE_SERIALIZER_ENABLED: bool = (
+    get_config_value("ACCOUNT_WRITE_SERIALIZER_ENABLED", default="true").lower()
+    == "true"
+)
+TRANSACTION_GROUP_COMMIT_ENABLED: bool = (
+    get_config_value("TRANSACTION_GROUP_COMMIT_ENABLED", default="false").lower()
+    == "true"
+)
+TRANSACTION_GROUP_COMMIT_FLUSH_INTERVAL_MS: int = int(
+    get_config_value("TRANSACTION_GROUP_COMMIT_FLUSH_INTERVAL_MS", default="5")
+)
+TRANSACTION_GROUP_COMMIT_MAX_BATCH_SIZE: int = int(
+    get_config_value("TRANSACTION_GROUP_COMMIT_MAX_BATCH_SIZE", default="100")
+)
+DB_ISOLATION_LEVEL: str = get_config_value(
+    "DB_ISOLATION_LEVEL", default="REPEATABLE READ"
+)
+LOCKING_ISOLATION_LEVEL: str = get_config_value(
+    "LOCKING_ISOLATION_LEVEL", default="READ COMMITTED"
+)
+QUERY_ISOLATION_LEVEL: str = get_config_value(
+    "QUERY_ISOLATION_LEVEL", default="READ COMMITTED"
+)
+QUERY_READ_ONLY: bool = (
+    get_config_value("QUERY_READ_ONLY", default="true").lower() == "true"
+)
+QUERY_DEFERRABLE: bool = (
+    get_config_value("QUERY_DEFERRABLE", default="false").lower() == "true"
+)
+SERIALIZATION_FAILURE_MAX_RETRIES: int = int(
+    get_config_value("SERIALIZATION_FAILURE_MAX_RETRIES", default="3")
+)
+SERIALIZATION_FAILURE_BACKOFF_BASE_MS: int = int(
+    get_config_value("SERIALIZATION_FAILURE_BACKOFF_BASE_MS", default="10")
+)
+SERIALIZATION_FAILURE_BACKOFF_MAX_MS: int = int(
+    get_config_value("SERIALIZATION_FAILURE_BACKOFF_MAX_MS", default="200")
+)
+IDEMPOTENCY_KEY_TTL_HOURS: int = int(
+    get_config_value("IDEMPOTENCY_KEY_TTL_HOURS", default="24")
+)
+IDEMPOTENCY_CACHE_MAX_SIZE: int = int(
+    get_config_value("IDEMPOTENCY_CACHE_MAX_SIZE", default="10000")
+)
+IDEMPOTENCY_EXPIRATION_INTERVAL_SECONDS: int = int(
+    get_config_value("IDEMPOTENCY_EXPIRATION_INTERVAL_SECONDS", default="3600")
+)
+LEDGER_POSTING_LOCK_NAMESPACE: int = 1001
+LEDGER_DEBIT_LOCK_NAMESPACE: int = 1002
+LEDGER_SNAPSHOT_INTERVAL_SECONDS: int = int(
+    get_config_value("LEDGER_SNAPSHOT_INTERVAL_SECONDS", default="60")
+)
+LEDGER_SNAPSHOT_MIN_ENTRIES: int = int(
+    get_config_value("LEDGER_SNAPSHOT_MIN_ENTRIES", default="100")
+)
+OUTBOX_ENABLED: bool = (
+    get_config_value("OUTBOX_ENABLED", default="false").lower() == "true"
+)
+OUTBOX_DISPATCHER_ENABLED: bool = (
+    get_config_value("OUTBOX_DISPATCHER_ENABLED", default="true").lower() == "true"
+)
+OUTBOX_BATCH_SIZE: int = int(get_config_value("OUTBOX_BATCH_SIZE", default="100"))
+OUTBOX_POLL_INTERVAL_MS: int = int(
+    get_config_value("OUTBOX_POLL_INTERVAL_MS", default="500")
+)
+OUTBOX_MAX_ATTEMPTS: int = int(get_config_value("OUTBOX_MAX_ATTEMPTS", default="10"))
+OUTBOX_CLAIM_TIMEOUT_MS: int = int(
+    get_config_value("OUTBOX_CLAIM_TIMEOUT_MS", default="60000")
+)
+TRANSACTION_ROLLUP_ENABLED: bool = (
+    get_config_value("TRANSACTION_ROLLUP_ENABLED", default="true").lower() == "true"
+)
+TRANSACTION_ROLLUP_BATCH_SIZE: int = int(
+    get_config_value("TRANSACTION_ROLLUP_BATCH_SIZE", default="1000")
+)
+TRANSACTION_ROLLUP_INTERVAL_MS: int = int(
+    get_config_value("TRANSACTION_ROLLUP_INTERVAL_MS", default="1000")
+)
+TRANSACTION_ROLLUP_GAP_TIMEOUT_MS: int = int(
+    get_config_value("TRANSACTION_ROLLUP_GAP_TIMEOUT_MS", default="60000")
+)
+DAILY_ROLLUP_WATERMARK: str = "bank_account_daily_rollup"
+ROLLUP_TIMEZONE: str = get_config_value("ROLLUP_TIMEZONE", default="America/Sao_Paulo")
+CACHE_ENABLED: bool = (
+    get_config_value("CACHE_ENABLED", default="true").lower() == "true"
+)
+CACHE_BACKEND: str = get_config_value("CACHE_BACKEND", default="memory")
+CACHE_MAX_SIZE: int = int(get_config_value("CACHE_MAX_SIZE", default="10000"))
+CACHE_KEY_PREFIX: str = get_config_value("CACHE_KEY_PREFIX", default="transacoes:v1:")
+CACHE_REDIS_URL: str = get_config_value(
+    "CACHE_REDIS_URL", default="redis://localhost:6379/0"
+)
+CACHE_REDIS_POOL_SIZE: int = int(
+    get_config_value("CACHE_REDIS_POOL_SIZE", default="10")
+)
+CACHE_REDIS_TIMEOUT_MS: int = int(
+    get_config_value("CACHE_REDIS_TIMEOUT_MS", default="100")
+)
+ACCOUNT_CACHE_TTL_SECONDS: float = float(
+    get_config_value("ACCOUNT_CACHE_TTL_SECONDS", default="5")
+)
+CLIENT_CACHE_TTL_SECONDS: float = float(
+    get_config_value("CLIENT_CACHE_TTL_SECONDS", default="60")
+)
+USER_CACHE_TTL_SECONDS: float = float(
+    get_config_value("USER_CACHE_TTL_SECONDS", default="60")
+)
+IMPORT_BATCH_SIZE: int = int(get_config_value("IMPORT_BATCH_SIZE", default="50000"))
+
 FIRST_USER_EMAIL: str = get_config_value("EMAIL_PRIMEIRO_USUARIO")
 FIRST_USER_PASSWORD: str = get_config_value("SENHA_PRIMEIRO_USUARIO")
 oauth2_scheme: OAuth2PasswordBearer = OAuth2PasswordBearer(tokenUrl="/api/token")
@@ -18,3 +18,12 @@ def start_mappers() -> None:
     from business_contexts.repository.orm.imperative.bank_transaction import (
         bank_transaction_mapper as bank_transaction_mapper,
     )
+    from business_contexts.repository.orm.imperative.idempotency import (
+        idempotency_record_mapper as idempotency_record_mapper,
+    )
+    from business_contexts.repository.orm.imperative.outbox import (
+        outbox_message_mapper as outbox_message_mapper,
+    )
+    from business_contexts.repository.orm.imperative.bulk_import import (
+        import_checkpoint_mapper as import_checkpoint_mapper,
+    )
@@ -1,5 +1,6 @@
 import os
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, AsyncEngine
 from sqlalchemy.orm import sessionmaker, registry
 
@@ -11,7 +12,13 @@ from business_contexts.utils.constants import (
     DB_USER,
     DB_NAME,
     DB_PORT,
+    DB_ISOLATION_LEVEL,
+    DB_REPLICA_HOST,
+    DB_REPLICA_LSN_REFRESH_MS,
+    DB_REPLICA_PORT,
 )
+from business_contexts.utils.base_types import IsolationLevel
+from libs.ddd.adapters.replica import ReplicaLsnTracker
 from libs.ddd.adapters.viewers import Filters
 
 mapper_registry: registry = registry()
@@ -27,13 +34,28 @@ def get_database_uri() -> str:
     return f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}"
 
 
+def get_replica_database_uri() -> str | None:
+    """
+    Retorna a URI de conexão com a réplica de leitura, com as mesmas credenciais e
+    banco do primário, ou None se a réplica não estiver configurada.
+    """
+    host: str = os.getenv("DB_REPLICA_HOST", DB_REPLICA_HOST)
+    if not host:
+        return None
+    port: int = int(os.getenv("DB_REPLICA_PORT", str(DB_REPLICA_PORT)))
+    password: str = os.getenv("DB_PASSWORD", DB_PASSWORD)
+    user: str = os.getenv("DB_USER", DB_USER)
+    db_name: str = os.getenv("DB_NAME", DB_NAME)
+    return f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}"
+
+
 async def create_first_user() -> None:
     """Cria o primeiro usuário administrador caso não exista nenhum usuário cadastrado."""
     from business_contexts.repository.query_repo.user import UserQueryRepo
     from business_contexts.domain.entities.user import CreateUser
     from business_contexts.services.executors.user import create_user
 
-    users = await UserQueryRepo().query_by_filters(Filters({}))
+    users = await UserQueryRepo(use_replica=False).query_by_filters(Filters({}))
     if not users:
         user = CreateUser(
             name="Admin",
@@ -49,23 +71,89 @@ ASYNC_ENGINE: AsyncEngine | None = None
 
 
 def get_async_engine() -> AsyncEngine:
-    """Retorna a engine assíncrona do SQLAlchemy (PostgreSQL), criando-a se necessário."""
+    """
+    Retorna a engine assíncrona do SQLAlchemy (PostgreSQL), criando-a se necessário.
+    O nível de isolamento da engine é o padrão das operações de escrita; consultas e
+    operações protegidas por bloqueios escolhem o seu próprio nível por transação.
+    """
     global ASYNC_ENGINE
 
     if not ASYNC_ENGINE:
         ASYNC_ENGINE = create_async_engine(
             get_database_uri(),
-            isolation_level="REPEATABLE READ",
+            isolation_level=IsolationLevel(DB_ISOLATION_LEVEL).value,
             future=True,
         )
 
     return ASYNC_ENGINE
 
 
+REPLICA_ASYNC_ENGINE: AsyncEngine | None = None
+
+
+def get_replica_async_engine() -> AsyncEngine | None:
+    """
+    Retorna a engine assíncrona da réplica de leitura, criando-a se necessário, ou
+    None se a réplica não estiver configurada. As transações na réplica são sempre
+    de consulta, com o nível de isolamento definido pelos repositórios de consulta.
+    """
+    global REPLICA_ASYNC_ENGINE
+
+    if not REPLICA_ASYNC_ENGINE:
+        replica_database_uri = get_replica_database_uri()
+        if not replica_database_uri:
+            return None
+        REPLICA_ASYNC_ENGINE = create_async_engine(replica_database_uri, future=True)
+
+    return REPLICA_ASYNC_ENGINE
+
+
+async def get_primary_wal_lsn() -> int:
+    """
+    Retorna a posição de inserção atual do WAL (LSN) do primário, que inclui todas as
+    transações já confirmadas: a réplica que a reproduziu reflete essas transações.
+    """
+    async with get_async_engine().connect() as connection:
+        return int(
+            (
+                await connection.execute(
+                    text("SELECT pg_wal_lsn_diff(pg_current_wal_insert_lsn(), '0/0')")
+                )
+            ).scalar_one()
+        )
+
+
+async def get_replica_replay_lsn() -> int:
+    """
+    Retorna a posição do WAL (LSN) já reproduzida pela réplica. Um servidor que não
+    está em recuperação (como um substituto da réplica em testes) retorna a sua
+    posição atual, estando sempre em dia.
+    """
+    async with get_replica_async_engine().connect() as connection:
+        return int(
+            (
+                await connection.execute(
+                    text(
+                        "SELECT pg_wal_lsn_diff(CASE WHEN pg_is_in_recovery() "
+                        "THEN coalesce(pg_last_wal_replay_lsn(), '0/0') "
+                        "ELSE pg_current_wal_lsn() END, '0/0')"
+                    )
+                )
+            ).scalar_one()
+        )
+
+
+REPLICA_LSN_TRACKER: ReplicaLsnTracker = ReplicaLsnTracker(
+    fetch_replay_lsn=get_replica_replay_lsn,
+    refresh_interval_ms=DB_REPLICA_LSN_REFRESH_MS,
+)
+
+
 def reset_engine() -> None:
-    """Reseta a engine global. Usado para testes que precisam trocar a URI."""
-    global ASYNC_ENGINE
+    """Reseta as engines globais. Usado para testes que precisam trocar a URI."""
+    global ASYNC_ENGINE, REPLICA_ASYNC_ENGINE
     ASYNC_ENGINE = None
+    REPLICA_ASYNC_ENGINE = None
 
 
 def DEFAULT_SQL_SESSION_FACTORY() -> sessionmaker[AsyncSession]:
@@ -79,3 +167,21 @@ def DEFAULT_SQL_SESSION_FACTORY() -> sessionmaker[AsyncSession]:
     )
 
     return async_session
+
+
+def REPLICA_SQL_SESSION_FACTORY() -> sessionmaker[AsyncSession] | None:
+    """
+    Retorna a factory de sessão SQL assíncrona da réplica de leitura, ou None se a
+    réplica não estiver configurada.
+    """
+    _engine: AsyncEngine | None = get_replica_async_engine()
+    if not _engine:
+        return None
+
+    async_session: sessionmaker[AsyncSession] = sessionmaker(
+        bind=_engine,
+        expire_on_commit=False,
+        class_=AsyncSession,
+    )
+
+    return async_session
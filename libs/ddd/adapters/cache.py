@@ -0,0 +1,290 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Mapping, Sequence
+
+from pydantic import TypeAdapter, ValidationError
+
+from libs.metrics import METRICS
+
+
+class LRUCache[K: Hashable, V]:
+    """Cache em memória de tamanho limitado (LRU), com expiração opcional por tempo (TTL)."""
+
+    def __init__(self, max_size: int, ttl_seconds: float | None = None) -> None:
+        """Inicializa o cache com a quantidade máxima de itens e o tempo de vida de cada item."""
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._items: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """Retorna o valor armazenado para a chave, ou None se ausente ou expirado."""
+        item = self._items.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._items[key]
+            return None
+
+        self._items.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> int:
+        """
+        Armazena o valor para a chave, descartando os itens menos usados se necessário.
+        O tempo de vida informado substitui o padrão do cache para este item.
+        Retorna a quantidade de itens descartados.
+        """
+        ttl_seconds = ttl_seconds or self.ttl_seconds
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else float("inf")
+        self._items[key] = (expires_at, value)
+        self._items.move_to_end(key)
+        evicted = 0
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def delete(self, key: K) -> None:
+        """Remove a chave do cache, se existir."""
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove todos os itens do cache."""
+        self._items.clear()
+
+    def keys(self) -> list[K]:
+        """Retorna as chaves armazenadas, inclusive as expiradas ainda não removidas."""
+        return list(self._items)
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de itens armazenados."""
+        return len(self._items)
+
+
+class CacheBackendError(Exception):
+    """Exceção lançada quando o armazenamento do cache está indisponível ou falha."""
+
+
+class CacheBackend(ABC):
+    """
+    Armazenamento de um cache de chaves e valores em bytes, com operações em lote
+    (cada uma em uma única ida ao armazenamento) e expiração por item.
+    """
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Retorna os valores das chaves, na ordem informada (None se ausente)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_many(
+        self, items: Mapping[str, bytes], ttl_seconds: float | None = None
+    ) -> None:
+        """Armazena os valores das chaves, com o tempo de vida informado."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        """Remove as chaves, se existirem."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def increment_many(
+        self, keys: Sequence[str], ttl_seconds: float | None = None
+    ) -> None:
+        """Incrementa os contadores das chaves (0 se ausentes), renovando o tempo de vida."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def clear(self, prefix: str) -> None:
+        """Remove todas as chaves iniciadas pelo prefixo."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Libera os recursos do armazenamento, como conexões."""
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Armazenamento do cache na memória do processo, sobre um LRUCache. Os descartes
+    por tamanho são registrados na métrica "cache_evictions".
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Inicializa o armazenamento com a quantidade máxima de chaves."""
+        self._items: LRUCache[str, bytes] = LRUCache(max_size)
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Retorna os valores das chaves, na ordem informada (None se ausente)."""
+        return [self._items.get(key) for key in keys]
+
+    async def set_many(
+        self, items: Mapping[str, bytes], ttl_seconds: float | None = None
+    ) -> None:
+        """Armazena os valores das chaves, com o tempo de vida informado."""
+        evicted = sum(
+            self._items.set(key, value, ttl_seconds) for key, value in items.items()
+        )
+        if evicted:
+            METRICS.increment("cache_evictions", label="total", value=evicted)
+
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        """Remove as chaves, se existirem."""
+        for key in keys:
+            self._items.delete(key)
+
+    async def increment_many(
+        self, keys: Sequence[str], ttl_seconds: float | None = None
+    ) -> None:
+        """Incrementa os contadores das chaves (0 se ausentes), renovando o tempo de vida."""
+        await self.set_many(
+            {key: str(int(self._items.get(key) or 0) + 1).encode() for key in keys},
+            ttl_seconds,
+        )
+
+    async def clear(self, prefix: str) -> None:
+        """Remove todas as chaves iniciadas pelo prefixo."""
+        # LRUCache.keys() retorna uma cópia, que admite remoções durante a iteração
+        for key in self._items.keys():  # noqa: SIM118
+            if key.startswith(prefix):
+                self._items.delete(key)
+
+
+class ReadThroughCache[K: Hashable, V]:
+    """
+    Cache de leitura (read-through) sobre um CacheBackend: o valor ausente é carregado
+    pela função informada e armazenado, serializado em JSON pelo pydantic a partir do
+    tipo dos valores (nunca com pickle, pois o armazenamento pode ser compartilhado);
+    um valor que não corresponda ao tipo é tratado como ausente. Cada chave tem uma
+    versão no armazenamento, lida junto com o valor e incrementada na invalidação; o
+    valor é gravado com a versão lida antes do carregamento e só é usado enquanto ela
+    for a atual, de modo que um carregamento anterior a uma invalidação, mesmo que em
+    outro processo, nunca é servido. No processo, leituras concorrentes da mesma chave
+    aguardam um único carregamento (proteção contra stampede). Falhas do armazenamento
+    não interrompem as leituras, que recorrem à função de carregamento.
+    Acertos, faltas e falhas são registrados nas métricas "<name>_hits",
+    "<name>_misses" e "<name>_errors".
+    """
+
+    def __init__(
+        self,
+        name: str,
+        backend: CacheBackend,
+        value_type: type[V],
+        ttl_seconds: float | None = None,
+        enabled: bool = True,
+        prefix: str = "",
+    ) -> None:
+        """
+        Inicializa o cache com o nome (usado nas chaves e nas métricas), o armazenamento,
+        o tipo dos valores, o tempo de vida dos valores e o prefixo das chaves
+        (ex.: versão do formato).
+        """
+        self.name = name
+        self.backend = backend
+        self._serializer: TypeAdapter[tuple[int, V]] = TypeAdapter(
+            tuple[int, value_type]
+        )
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.prefix = f"{prefix}{name}:"
+        self._loading: dict[K, asyncio.Future[None]] = {}
+
+    async def get(self, key: K, load: Callable[[], Awaitable[V | None]]) -> V | None:
+        """
+        Retorna o valor da chave, carregando-o se ausente, expirado ou invalidado.
+        Valores None (como registros inexistentes) não são armazenados.
+        Desabilitado, sempre carrega.
+        """
+        if not self.enabled:
+            return await load()
+
+        while True:
+            try:
+                value, version = await self.__read(key)
+            except CacheBackendError:
+                METRICS.increment(f"{self.name}_errors", label="total")
+                return await load()
+            if value is not None:
+                METRICS.increment(f"{self.name}_hits")
+                return value
+            in_flight = self._loading.get(key)
+            if in_flight is None:
+                break
+            await asyncio.shield(in_flight)
+
+        METRICS.increment(f"{self.name}_misses")
+        in_flight = asyncio.get_running_loop().create_future()
+        self._loading[key] = in_flight
+        try:
+            value = await load()
+            if value is not None and self._loading.get(key) is in_flight:
+                try:
+                    await self.backend.set_many(
+                        {
+                            self.__value_key(key): self._serializer.dump_json(
+                                (version, value)
+                            )
+                        },
+                        self.ttl_seconds,
+                    )
+                except CacheBackendError:
+                    METRICS.increment(f"{self.name}_errors", label="total")
+            return value
+        finally:
+            if self._loading.get(key) is in_flight:
+                del self._loading[key]
+            in_flight.set_result(None)
+
+    async def invalidate(self, *keys: K) -> None:
+        """
+        Invalida as chaves: incrementa as suas versões, descartando os valores e os
+        carregamentos em andamento em todos os processos, e remove os valores. Se o
+        armazenamento falhar, os valores deixam de ser servidos apenas ao expirar.
+        """
+        if not keys:
+            return
+        for key in keys:
+            self._loading.pop(key, None)
+        try:
+            # As versões vivem mais que os valores, para que um valor gravado com uma
+            # versão anterior expire antes de a versão expirar e voltar a 0
+            await self.backend.increment_many(
+                [self.__version_key(key) for key in keys],
+                self.ttl_seconds * 2 if self.ttl_seconds else None,
+            )
+            await self.backend.delete_many([self.__value_key(key) for key in keys])
+        except CacheBackendError:
+            METRICS.increment(f"{self.name}_errors", label="total")
+
+    async def clear(self) -> None:
+        """Remove todos os valores e versões do cache."""
+        self._loading.clear()
+        await self.backend.clear(self.prefix)
+
+    async def __read(self, key: K) -> tuple[V | None, int]:
+        """Lê, em uma única ida ao armazenamento, o valor atual e a versão da chave."""
+        data, version = await self.backend.get_many(
+            [self.__value_key(key), self.__version_key(key)]
+        )
+        current_version = int(version or 0)
+        if data is None:
+            return None, current_version
+
+        try:
+            value_version, value = self._serializer.validate_json(data)
+        except ValidationError:
+            return None, current_version
+        return (value if value_version == current_version else None), current_version
+
+    def __value_key(self, key: K) -> str:
+        """Chave do valor no armazenamento."""
+        return f"{self.prefix}{key}"
+
+    def __version_key(self, key: K) -> str:
+        """Chave da versão no armazenamento."""
+        return f"{self.prefix}{key}:version"
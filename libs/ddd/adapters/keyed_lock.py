@@ -0,0 +1,54 @@
+import asyncio
+from collections.abc import AsyncIterator, Hashable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+
+@dataclass
+class _KeyLock:
+    """Bloqueio de uma chave e a quantidade de tarefas que o detêm ou aguardam."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+
+
+class KeyedLock[K: Hashable]:
+    """
+    Bloqueios asyncio por chave, criados sob demanda e descartados assim que ficam
+    ociosos, de modo que a memória ocupada é proporcional às chaves em uso.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa o conjunto de bloqueios vazio."""
+        self._locks: dict[K, _KeyLock] = {}
+
+    @asynccontextmanager
+    async def hold(self, *keys: K) -> AsyncIterator[None]:
+        """
+        Detém os bloqueios das chaves informadas até o fim do contexto. As chaves são
+        bloqueadas em ordem, de modo que tarefas com as mesmas chaves em ordens
+        diferentes (como transferências opostas) não entrem em deadlock.
+        """
+        key_locks = []
+        for key in sorted(set(keys)):
+            key_lock = self._locks.setdefault(key, _KeyLock())
+            key_lock.users += 1
+            key_locks.append((key, key_lock))
+
+        acquired: list[_KeyLock] = []
+        try:
+            for _, key_lock in key_locks:
+                await key_lock.lock.acquire()
+                acquired.append(key_lock)
+            yield
+        finally:
+            for key_lock in reversed(acquired):
+                key_lock.lock.release()
+            for key, key_lock in key_locks:
+                key_lock.users -= 1
+                if not key_lock.users:
+                    del self._locks[key]
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de chaves com bloqueios em uso."""
+        return len(self._locks)
@@ -0,0 +1,203 @@
+import asyncio
+from collections.abc import Mapping, Sequence
+from typing import Any
+from urllib.parse import unquote, urlparse
+
+from libs.ddd.adapters.cache import CacheBackend, CacheBackendError
+
+Command = Sequence[str | bytes | int | float]
+
+
+class RedisReplyError(Exception):
+    """Resposta de erro do servidor Redis a um comando."""
+
+
+class RedisConnection:
+    """
+    Conexão com um servidor compatível com o protocolo do Redis (RESP2). Os comandos
+    de um lote são enviados de uma vez (pipelining) e as respostas lidas em ordem.
+    """
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Inicializa a conexão com os fluxos de leitura e escrita do socket."""
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def open(
+        cls, host: str, port: int, password: str | None = None, db: int = 0
+    ) -> "RedisConnection":
+        """Abre a conexão, autenticando e selecionando o banco, se informados."""
+        reader, writer = await asyncio.open_connection(host, port)
+        connection = cls(reader, writer)
+        commands: list[Command] = []
+        if password:
+            commands.append(("AUTH", password))
+        if db:
+            commands.append(("SELECT", db))
+        if commands:
+            try:
+                await connection.execute_many(*commands)
+            except BaseException:
+                await connection.close()
+                raise
+        return connection
+
+    async def execute_many(self, *commands: Command) -> list[Any]:
+        """
+        Executa os comandos em uma única ida ao servidor, retornando as respostas na
+        ordem dos comandos. Todas as respostas são lidas antes de um erro ser lançado,
+        mantendo a conexão sincronizada.
+        """
+        self.writer.write(b"".join(encode_command(command) for command in commands))
+        await self.writer.drain()
+        replies = [await self._read_reply() for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RedisReplyError):
+                raise reply
+        return replies
+
+    async def close(self) -> None:
+        """Fecha a conexão."""
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except OSError:
+            pass
+
+    async def _read_reply(self) -> Any:
+        """Lê uma resposta do servidor, convertida para o tipo Python correspondente."""
+        line = await self.reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Conexão com o Redis encerrada")
+
+        prefix, body = line[:1], line[1:-2]
+        match prefix:
+            case b"+":
+                return body.decode()
+            case b"-":
+                return RedisReplyError(body.decode())
+            case b":":
+                return int(body)
+            case b"$":
+                length = int(body)
+                if length < 0:
+                    return None
+                return (await self.reader.readexactly(length + 2))[:-2]
+            case b"*":
+                length = int(body)
+                if length < 0:
+                    return None
+                return [await self._read_reply() for _ in range(length)]
+        raise ConnectionError(f"Resposta inválida do Redis: {line!r}")
+
+
+def encode_command(command: Command) -> bytes:
+    """Codifica um comando no formato do protocolo do Redis (array de bulk strings)."""
+    parts = [
+        argument if isinstance(argument, bytes) else str(argument).encode()
+        for argument in command
+    ]
+    return b"*%d\r\n" % len(parts) + b"".join(
+        b"$%d\r\n%s\r\n" % (len(part), part) for part in parts
+    )
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Armazenamento do cache em um servidor compatível com o protocolo do Redis,
+    compartilhado entre os processos e instâncias da aplicação. Cada operação em lote
+    é enviada em uma única ida ao servidor, por uma conexão de um pool limitado.
+    Falhas de conexão, tempo esgotado e erros do servidor são lançados como
+    CacheBackendError, e a conexão envolvida é descartada.
+    """
+
+    def __init__(self, url: str, pool_size: int = 10, timeout_ms: int = 100) -> None:
+        """Inicializa o armazenamento com a URL do servidor (redis://[:senha@]host[:porta][/banco])."""
+        parsed_url = urlparse(url)
+        self.host = parsed_url.hostname or "localhost"
+        self.port = parsed_url.port or 6379
+        self.password = unquote(parsed_url.password) if parsed_url.password else None
+        self.db = int(parsed_url.path.lstrip("/") or 0)
+        self.timeout = timeout_ms / 1000
+        self._slots = asyncio.Semaphore(pool_size)
+        self._idle: list[RedisConnection] = []
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Retorna os valores das chaves, na ordem informada (None se ausente)."""
+        return await self._execute(*(("GET", key) for key in keys))
+
+    async def set_many(
+        self, items: Mapping[str, bytes], ttl_seconds: float | None = None
+    ) -> None:
+        """Armazena os valores das chaves, com o tempo de vida informado."""
+        expiration = ("PX", int(ttl_seconds * 1000)) if ttl_seconds else ()
+        await self._execute(
+            *(("SET", key, value, *expiration) for key, value in items.items())
+        )
+
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        """Remove as chaves, se existirem."""
+        if keys:
+            await self._execute(("DEL", *keys))
+
+    async def increment_many(
+        self, keys: Sequence[str], ttl_seconds: float | None = None
+    ) -> None:
+        """Incrementa os contadores das chaves (0 se ausentes), renovando o tempo de vida."""
+        commands: list[Command] = []
+        for key in keys:
+            commands.append(("INCR", key))
+            if ttl_seconds:
+                commands.append(("PEXPIRE", key, int(ttl_seconds * 1000)))
+        await self._execute(*commands)
+
+    async def clear(self, prefix: str) -> None:
+        """Remove todas as chaves iniciadas pelo prefixo, percorrendo-as com SCAN."""
+        cursor = b"0"
+        while True:
+            [(cursor, keys)] = await self._execute(
+                ("SCAN", cursor, "MATCH", f"{prefix}*", "COUNT", 1000)
+            )
+            await self.delete_many(keys)
+            if cursor == b"0":
+                return
+
+    async def close(self) -> None:
+        """Fecha as conexões ociosas do pool."""
+        while self._idle:
+            await self._idle.pop().close()
+
+    async def _execute(self, *commands: Command) -> list[Any]:
+        """Executa os comandos em uma única ida ao servidor, com uma conexão do pool."""
+        if not commands:
+            return []
+
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else None
+            try:
+                async with asyncio.timeout(self.timeout):
+                    if connection is None:
+                        connection = await RedisConnection.open(
+                            self.host, self.port, self.password, self.db
+                        )
+                    replies = await connection.execute_many(*commands)
+            except (
+                OSError,
+                EOFError,
+                TimeoutError,
+                RedisReplyError,
+                ValueError,
+            ) as error:
+                if connection is not None:
+                    await connection.close()
+                raise CacheBackendError(str(error)) from error
+            except BaseException:
+                if connection is not None:
+                    await connection.close()
+                raise
+
+            self._idle.append(connection)
+            return replies
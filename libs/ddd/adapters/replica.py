@@ -0,0 +1,72 @@
+import time
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ReadConsistency:
+    """
+    Requisitos de consistência das leituras da requisição atual: se devem ser feitas
+    no primário e a posição do WAL (LSN) que a réplica deve ter reproduzido para
+    atendê-las (token de consistência de sessão).
+    """
+
+    primary_only: bool = False
+    min_lsn: int | None = None
+
+
+# ReadConsistency é imutável (frozen), de modo que o padrão pode ser compartilhado
+READ_CONSISTENCY: ContextVar[ReadConsistency] = ContextVar(
+    "read_consistency",
+    default=ReadConsistency(),  # noqa: B039
+)
+
+
+def parse_lsn(token: str) -> int:
+    """Converte um LSN do PostgreSQL no formato textual (ex.: "16/B374D848") em inteiro."""
+    high, separator, low = token.partition("/")
+    if not separator or not high or not low:
+        raise ValueError(f"LSN inválido: {token!r}")
+    return (int(high, 16) << 32) | int(low, 16)
+
+
+def format_lsn(lsn: int) -> str:
+    """Converte um LSN inteiro no formato textual do PostgreSQL."""
+    return f"{lsn >> 32:X}/{lsn & 0xFFFFFFFF:X}"
+
+
+class ReplicaLsnTracker:
+    """
+    Acompanha a posição do WAL já reproduzida pela réplica. A posição só avança, e é
+    consultada na réplica no máximo uma vez por intervalo de atualização, apenas
+    quando uma leitura exige uma posição ainda não reproduzida.
+    """
+
+    def __init__(
+        self,
+        fetch_replay_lsn: Callable[[], Awaitable[int]],
+        refresh_interval_ms: int,
+    ) -> None:
+        """Inicializa com a função que consulta a posição reproduzida e o intervalo de atualização."""
+        self.fetch_replay_lsn = fetch_replay_lsn
+        self.refresh_interval = refresh_interval_ms / 1000
+        self.replayed_lsn = 0
+        self._refreshed_at = float("-inf")
+
+    async def has_replayed(self, lsn: int) -> bool:
+        """
+        Indica se a réplica já reproduziu o WAL até a posição informada, consultando-a
+        se a posição conhecida não for suficiente e o intervalo de atualização tiver
+        se esgotado.
+        """
+        if lsn <= self.replayed_lsn:
+            return True
+
+        now = time.monotonic()
+        if now - self._refreshed_at < self.refresh_interval:
+            return False
+
+        self._refreshed_at = now
+        self.replayed_lsn = max(self.replayed_lsn, await self.fetch_replay_lsn())
+        return lsn <= self.replayed_lsn
@@ -1,17 +1,51 @@
 from __future__ import annotations
 
+import asyncio
+import random
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import Any, Self
 
+from sqlalchemy import insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from infra.database import DEFAULT_SQL_SESSION_FACTORY
+from business_contexts.utils.base_types import IsolationLevel
+from business_contexts.utils.constants import (
+    LOCKING_ISOLATION_LEVEL,
+    OUTBOX_ENABLED,
+    QUERY_DEFERRABLE,
+    QUERY_ISOLATION_LEVEL,
+    QUERY_READ_ONLY,
+    SERIALIZATION_FAILURE_BACKOFF_BASE_MS,
+    SERIALIZATION_FAILURE_BACKOFF_MAX_MS,
+    SERIALIZATION_FAILURE_MAX_RETRIES,
+)
+from infra.database import (
+    DEFAULT_SQL_SESSION_FACTORY,
+    REPLICA_LSN_TRACKER,
+    REPLICA_SQL_SESSION_FACTORY,
+)
+from libs.ddd.adapters.replica import READ_CONSISTENCY
+from libs.ddd.domain.aggregate import Aggregate
+from libs.ddd.domain.event import OutboxMessage
+from libs.metrics import METRICS
+
+# SQLSTATE de falha de serialização (40001) e de deadlock detectado (40P01)
+RETRYABLE_SQLSTATES: frozenset[str] = frozenset({"40001", "40P01"})
+
+# Falhas transitórias do banco de dados: erros do driver (encapsulados pelo SQLAlchemy),
+# de conexão e de espera por uma conexão do pool. As tarefas em segundo plano as
+# registram e tentam novamente na próxima execução; demais erros são propagados
+DATABASE_ERRORS: tuple[type[Exception], ...] = (OSError, DBAPIError, PoolTimeoutError)
 
 
 class AbstractRepo(ABC):
     """Classe abstrata base para repositórios, definindo a interface padrão."""
 
-    async def __aenter__(self) -> AbstractRepo:
+    async def __aenter__(self) -> Self:
         """Entra no contexto assíncrono do repositório."""
         return self
 
@@ -41,7 +75,7 @@ class BaseDefaultRepo(AbstractRepo):
         """Inicializa o repositório com a factory de sessão."""
         self.session_factory = session_factory
 
-    async def __aenter__(self) -> BaseDefaultRepo:
+    async def __aenter__(self) -> Self:
         """Abre uma nova sessão assíncrona."""
         self.session: AsyncSession = self.session_factory()()
         return await super().__aenter__()
@@ -61,12 +95,181 @@ class BaseDefaultRepo(AbstractRepo):
 
 
 class DomainRepository(BaseDefaultRepo):
-    """Repositório para operações de escrita no domínio."""
+    """
+    Repositório para operações de escrita no domínio. As operações usam o nível de
+    isolamento padrão da engine, exceto as que o definem com _set_isolation_level;
+    as protegidas por bloqueios explícitos de linha usam locking_isolation_level.
+    Os eventos dos agregados só são gravados na outbox com record_events habilitado.
+    """
+
+    locking_isolation_level: IsolationLevel = IsolationLevel(LOCKING_ISOLATION_LEVEL)
+    record_events: bool = OUTBOX_ENABLED
+
+    async def __aenter__(self) -> Self:
+        """Abre uma nova sessão assíncrona, sem agregados publicados."""
+        self._published_aggregates: list[Aggregate] = []
+        return await super().__aenter__()
+
+    async def _set_isolation_level(self, isolation_level: IsolationLevel) -> None:
+        """
+        Define o nível de isolamento da transação da operação atual. Deve ser chamado
+        antes do primeiro comando da sessão, pois a transação começa com ele.
+        """
+        await self.session.connection(
+            execution_options={"isolation_level": isolation_level.value}
+        )
+
+    async def _commit(self) -> None:
+        """Realiza o commit da sessão e descarta os eventos publicados nela."""
+        await super()._commit()
+        for aggregate in self._published_aggregates:
+            aggregate.clear_events()
+        self._published_aggregates = []
+
+    async def _publish_events(self, *aggregates: Aggregate) -> None:
+        """
+        Grava na tabela de outbox, na transação atual, os eventos registrados pelos
+        agregados. Os eventos só são descartados dos agregados após o commit, de modo
+        que uma reexecução da transação os grave novamente. Com a outbox desabilitada,
+        nada é gravado e os eventos são apenas descartados no commit.
+        """
+        messages = [
+            OutboxMessage.from_event(aggregate, event)
+            for aggregate in aggregates
+            for event in aggregate.events
+        ]
+        if messages and self.record_events:
+            await self.session.execute(
+                insert(OutboxMessage),
+                [
+                    {
+                        "id": message.id,
+                        "event_type": message.event_type,
+                        "aggregate_type": message.aggregate_type,
+                        "aggregate_id": message.aggregate_id,
+                        "payload": message.payload,
+                        "created_at": message.created_at,
+                    }
+                    for message in messages
+                ],
+            )
+        self._published_aggregates.extend(aggregates)
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Verifica se o erro é uma falha de serialização ou deadlock do PostgreSQL."""
+    if not isinstance(error, DBAPIError):
+        return False
+    sqlstate = getattr(error.orig, "sqlstate", None) or getattr(
+        error.orig, "pgcode", None
+    )
+    return sqlstate in RETRYABLE_SQLSTATES
 
-    ...
+
+def retry_on_serialization_failure[**P, R](
+    method: Callable[P, Awaitable[R]],
+) -> Callable[P, Awaitable[R]]:
+    """
+    Reexecuta a operação de escrita quando o banco aborta a transação por falha de
+    serialização ou deadlock, com backoff exponencial limitado e jitter.
+    Cada tentativa é contabilizada por endpoint na métrica "serialization_retries".
+    """
+
+    @wraps(method)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        attempt = 0
+        while True:
+            try:
+                return await method(*args, **kwargs)
+            except DBAPIError as error:
+                if (
+                    not is_retryable_error(error)
+                    or attempt >= SERIALIZATION_FAILURE_MAX_RETRIES
+                ):
+                    raise
+                METRICS.increment("serialization_retries")
+                backoff_ms = min(
+                    SERIALIZATION_FAILURE_BACKOFF_MAX_MS,
+                    SERIALIZATION_FAILURE_BACKOFF_BASE_MS * 2**attempt,
+                )
+                await asyncio.sleep(random.uniform(0, backoff_ms) / 1000)
+                attempt += 1
+
+    return wrapper
 
 
 class QueryRepository(BaseDefaultRepo):
-    """Repositório para operações de leitura/consulta."""
+    """
+    Repositório para operações de leitura/consulta. As sessões usam um nível de
+    isolamento próprio (por padrão, READ COMMITTED) e transações somente leitura;
+    DEFERRABLE só tem efeito em transações SERIALIZABLE somente leitura, que passam
+    a aguardar um snapshot seguro em vez de arriscar falhas de serialização.
+
+    Com a réplica de leitura configurada, as sessões são abertas nela, exceto quando
+    a consistência de leitura da requisição atual exige o primário: requisições de
+    escrita e tokens de consistência (LSN) ainda não reproduzidos pela réplica. Se a
+    réplica estiver indisponível, a sessão é aberta no primário.
+    """
+
+    isolation_level: IsolationLevel = IsolationLevel(QUERY_ISOLATION_LEVEL)
+    read_only: bool = QUERY_READ_ONLY
+    deferrable: bool = QUERY_DEFERRABLE
+    use_replica: bool = True
+
+    def __init__(
+        self,
+        session_factory: Any = DEFAULT_SQL_SESSION_FACTORY,
+        replica_session_factory: Any = REPLICA_SQL_SESSION_FACTORY,
+        use_replica: bool | None = None,
+    ) -> None:
+        """
+        Inicializa o repositório com as factories de sessão do primário e da réplica.
+        use_replica=False mantém as leituras no primário.
+        """
+        super().__init__(session_factory)
+        self.replica_session_factory = replica_session_factory
+        if use_replica is not None:
+            self.use_replica = use_replica
+
+    async def __aenter__(self) -> Self:
+        """Abre uma nova sessão assíncrona com as características de transação de consulta."""
+        replica_session_maker = (
+            self.replica_session_factory() if self.use_replica else None
+        )
+        if replica_session_maker and await self.__reads_from_replica():
+            try:
+                await self.__open_session(replica_session_maker)
+                METRICS.increment("replica_reads")
+                return self
+            except (OSError, DBAPIError):
+                await self.session.close()
+                METRICS.increment("replica_fallbacks", label="total")
+
+        await self.__open_session(self.session_factory())
+        return self
+
+    async def __open_session(self, session_maker: Any) -> None:
+        """Abre a sessão e inicia a transação de consulta."""
+        self.session = session_maker()
+        execution_options: dict[str, Any] = {
+            "isolation_level": self.isolation_level.value
+        }
+        if self.read_only:
+            execution_options["postgresql_readonly"] = True
+            if self.isolation_level == IsolationLevel.SERIALIZABLE:
+                execution_options["postgresql_deferrable"] = self.deferrable
+        await self.session.connection(execution_options=execution_options)
 
-    ...
+    @staticmethod
+    async def __reads_from_replica() -> bool:
+        """Indica se a consistência de leitura da requisição atual admite a réplica."""
+        consistency = READ_CONSISTENCY.get()
+        if consistency.primary_only:
+            return False
+        if consistency.min_lsn is None:
+            return True
+        try:
+            return await REPLICA_LSN_TRACKER.has_replayed(consistency.min_lsn)
+        except (OSError, DBAPIError):
+            METRICS.increment("replica_fallbacks", label="total")
+            return False
@@ -1,3 +1,8 @@
+import base64
+import hashlib
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any
 
 
@@ -24,3 +29,64 @@ class Filters(dict):
     def __str__(self) -> str:
         """Retorna a representação em string dos filtros."""
         return str(dict(self))
+
+
+@dataclass(frozen=True)
+class Pagination:
+    """
+    Parâmetros da paginação por cursor (keyset): a quantidade máxima de itens da
+    página e o cursor opaco do último item da página anterior, se houver.
+    """
+
+    limit: int
+    after: str | None = None
+
+
+@dataclass(frozen=True)
+class Page[T]:
+    """Página de resultados e o cursor opaco da próxima página, se houver."""
+
+    items: Sequence[T]
+    next_cursor: str | None = None
+
+
+def encode_cursor(*keys: Any) -> str:
+    """Codifica as chaves de ordenação de um item em um cursor opaco (base64 de JSON)."""
+    payload = json.dumps([str(key) for key in keys], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, ...]:
+    """
+    Decodifica um cursor opaco nas chaves de ordenação do item, como texto.
+    Lança ValueError se o cursor não tiver sido gerado por encode_cursor.
+    """
+    try:
+        keys = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as error:
+        raise ValueError(f"Cursor inválido: {cursor}") from error
+    if not isinstance(keys, list) or not all(isinstance(key, str) for key in keys):
+        raise ValueError(f"Cursor inválido: {cursor}")
+    return tuple(keys)
+
+
+def compute_etag(*parts: Any) -> str:
+    """
+    Calcula uma ETag forte (entre aspas) a partir das partes do estado da representação,
+    convertidas em texto: partes iguais produzem sempre a mesma ETag.
+    """
+    payload = json.dumps([str(part) for part in parts], separators=(",", ":"))
+    return f'"{hashlib.sha256(payload.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Indica se o cabeçalho If-None-Match corresponde à ETag: "*" ou uma das ETags da
+    lista, com a comparação fraca exigida para If-None-Match (ignorando o prefixo W/).
+    """
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in (
+        candidate.removeprefix("W/") for candidate in candidates
+    )
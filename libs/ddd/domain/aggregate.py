@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Any
 
+from libs.ddd.domain.event import DomainEvent
+
 
 @dataclass
 class Aggregate:
@@ -19,3 +21,16 @@ class Aggregate:
             for key, value in data.items()
         }
         return converted_data
+
+    def record_event(self, event: DomainEvent) -> None:
+        """Registra um evento de domínio ocorrido no agregado, a ser publicado na outbox."""
+        self.__dict__.setdefault("_events", []).append(event)
+
+    @property
+    def events(self) -> list[DomainEvent]:
+        """Eventos de domínio registrados e ainda não publicados."""
+        return list(self.__dict__.get("_events", []))
+
+    def clear_events(self) -> None:
+        """Descarta os eventos registrados, após a publicação."""
+        self.__dict__.pop("_events", None)
@@ -0,0 +1,63 @@
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID, uuid4
+
+
+@dataclass(frozen=True)
+class DomainEvent:
+    """Classe base para eventos de domínio registrados pelos agregados."""
+
+    @property
+    def event_type(self) -> str:
+        """Nome do evento, usado para encaminhá-lo aos handlers."""
+        return type(self).__name__
+
+    def to_payload(self) -> dict[str, Any]:
+        """Converte o evento em um dicionário serializável em JSON."""
+        types_to_keep = (str, int, float, bool, dict, list, type(None))
+        return {
+            key: value.value
+            if isinstance(value, Enum)
+            else value
+            if type(value) in types_to_keep
+            else str(value)
+            for key, value in self.__dict__.items()
+        }
+
+
+class OutboxDeliveryError(Exception):
+    """
+    Exceção lançada por um handler quando a entrega de uma mensagem da outbox falha
+    de forma transitória e deve ser tentada novamente.
+    """
+
+
+@dataclass
+class OutboxMessage:
+    """
+    Mensagem da tabela de outbox: um evento de domínio gravado na mesma transação
+    de banco de dados que a alteração do agregado, aguardando entrega aos handlers.
+    """
+
+    event_type: str
+    aggregate_type: str
+    aggregate_id: str | None
+    payload: dict[str, Any]
+    id: UUID = field(default_factory=uuid4)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    attempts: int = 0
+    last_error: str | None = None
+    claimed_until: datetime | None = None
+
+    @classmethod
+    def from_event(cls, aggregate: Any, event: DomainEvent) -> "OutboxMessage":
+        """Cria a mensagem de outbox de um evento registrado pelo agregado."""
+        aggregate_id = getattr(aggregate, "id", None)
+        return OutboxMessage(
+            event_type=event.event_type,
+            aggregate_type=type(aggregate).__name__,
+            aggregate_id=str(aggregate_id) if aggregate_id else None,
+            payload=event.to_payload(),
+        )
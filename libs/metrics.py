@@ -0,0 +1,86 @@
+from collections import defaultdict
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any
+
+CURRENT_ENDPOINT: ContextVar[str] = ContextVar("current_endpoint", default="internal")
+
+
+class MetricsRegistry:
+    """
+    Registro em memória de contadores, medidores (gauges) e resumos de durações da
+    aplicação, agrupados por rótulo.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa o registro vazio."""
+        self._counters: dict[str, dict[str, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+        self._gauges: dict[str, dict[str, float]] = defaultdict(dict)
+        self._summaries: dict[str, dict[str, dict[str, float]]] = defaultdict(
+            lambda: defaultdict(lambda: {"count": 0, "sum": 0.0, "max": 0.0})
+        )
+        self._lock = Lock()
+
+    def increment(self, name: str, label: str | None = None, value: int = 1) -> None:
+        """Incrementa um contador. Sem rótulo, utiliza o endpoint da requisição atual."""
+        with self._lock:
+            self._counters[name][label or CURRENT_ENDPOINT.get()] += value
+
+    def set_gauge(self, name: str, value: float, label: str = "total") -> None:
+        """Define o valor atual de um medidor."""
+        with self._lock:
+            self._gauges[name][label] = value
+
+    def observe(self, name: str, value: float, label: str | None = None) -> None:
+        """
+        Registra uma observação (por exemplo, uma duração em ms) no resumo, que acumula
+        a quantidade, a soma e o maior valor. Sem rótulo, utiliza o endpoint atual.
+        """
+        with self._lock:
+            summary = self._summaries[name][label or CURRENT_ENDPOINT.get()]
+            summary["count"] += 1
+            summary["sum"] += value
+            summary["max"] = max(summary["max"], value)
+
+    def get_summary(self, name: str, label: str) -> dict[str, float]:
+        """Retorna o resumo (quantidade, soma e maior valor) de um rótulo."""
+        with self._lock:
+            return dict(
+                self._summaries.get(name, {}).get(
+                    label, {"count": 0, "sum": 0.0, "max": 0.0}
+                )
+            )
+
+    def get_counter(self, name: str, label: str | None = None) -> int:
+        """Retorna o valor de um contador para um rótulo, ou a soma de todos os rótulos."""
+        with self._lock:
+            counter = self._counters.get(name, {})
+            if label is None:
+                return sum(counter.values())
+            return counter.get(label, 0)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Retorna uma cópia de todos os contadores e medidores."""
+        with self._lock:
+            return {
+                "counters": {
+                    name: dict(values) for name, values in self._counters.items()
+                },
+                "gauges": {name: dict(values) for name, values in self._gauges.items()},
+                "summaries": {
+                    name: {label: dict(summary) for label, summary in values.items()}
+                    for name, values in self._summaries.items()
+                },
+            }
+
+    def reset(self) -> None:
+        """Zera todas as métricas. Usado em testes."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._summaries.clear()
+
+
+METRICS: MetricsRegistry = MetricsRegistry()
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from typing import Generator
 
@@ -13,6 +14,10 @@ os.environ["DB_PORT"] = TEST_DB_PORT
 os.environ["DB_USER"] = TEST_DB_USER
 os.environ["DB_PASSWORD"] = TEST_DB_PASSWORD
 os.environ["DB_NAME"] = TEST_DB_NAME
+# Réplica de leitura: por padrão, o próprio banco de testes faz o papel da réplica
+# (sempre em dia), exercitando o roteamento das consultas e os tokens de consistência
+os.environ["DB_REPLICA_HOST"] = os.getenv("TEST_DB_REPLICA_HOST", TEST_DB_HOST)
+os.environ["DB_REPLICA_PORT"] = os.getenv("TEST_DB_REPLICA_PORT", TEST_DB_PORT)
 os.environ["EMAIL_PRIMEIRO_USUARIO"] = "admin@email.com"
 os.environ["SENHA_PRIMEIRO_USUARIO"] = "1234"
 os.environ["SECRET_KEY"] = "test-secret-key-for-jwt-signing"
@@ -66,10 +71,23 @@ def clean_tables() -> Generator[None, None, None]:
     """Limpa tabelas antes de cada teste, preservando o usuário admin criado pelo lifespan."""
     sync_engine = create_engine(TEST_DATABASE_URL_SYNC)
     with sync_engine.connect() as conn:
+        conn.execute(text("DELETE FROM idempotency_record"))
+        conn.execute(text("DELETE FROM outbox_message"))
         conn.execute(text("DELETE FROM bank_transaction"))
         conn.execute(text("DELETE FROM bank_account"))
         conn.execute(text("DELETE FROM client"))
         conn.execute(text("""DELETE FROM "user" WHERE email != 'admin@email.com'"""))
         conn.commit()
     sync_engine.dispose()
+
+    # As linhas removidas diretamente no banco não passam pela invalidação do cache.
+    # As conexões abertas neste event loop são fechadas para não serem reutilizadas
+    # no da aplicação
+    from business_contexts.repository.cache import CACHE_STORE, clear_caches
+
+    async def reset_caches() -> None:
+        await clear_caches()
+        await CACHE_STORE.close()
+
+    asyncio.run(reset_caches())
     yield
@@ -1,5 +1,14 @@
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
+from business_contexts.domain.business_rules.bank_transaction import (
+    get_local_time,
+)
+from business_contexts.services.tasks.transaction_rollup import (
+    TRANSACTION_ROLLUP_PROJECTOR,
+)
+from libs.ddd.adapters.replica import parse_lsn
+
 
 class TestBankAccountAPI:
     """Testes de integração para a API de contas bancárias."""
@@ -42,6 +51,54 @@ class TestBankAccountAPI:
 
         assert response.status_code == 409
 
+    def test_register_batch(self, client_api, mock_user_api, mock_client) -> None:
+        """Cadastro em lote retorna o resultado de cada item, na ordem do lote."""
+        data = [
+            {
+                "account_number": "810001",
+                "balance": "10.00",
+                "client_cpf": mock_client.cpf,
+            },
+            {
+                "account_number": "810002",
+                "balance": "0.00",
+                "client_cpf": mock_client.cpf,
+                "balance_slots": 4,
+            },
+            {
+                "account_number": "810001",
+                "balance": "0.00",
+                "client_cpf": mock_client.cpf,
+            },
+            {
+                "account_number": "810003",
+                "balance": "0.00",
+                "client_cpf": "99999999999",
+            },
+            {
+                "account_number": "810004",
+                "balance": "-1.00",
+                "client_cpf": mock_client.cpf,
+            },
+        ]
+
+        response = client_api.post(
+            "api/conta_bancarias/lote",
+            json=data,
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["status_code"] for item in body] == [200, 200, 409, 404, 400]
+        assert body[1]["account"]["balance_slots"] == 4
+
+        account = client_api.get(
+            "api/conta_bancarias?account_number=810001",
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert account.json()[0]["balance"] == "10.00"
+
     def test_register_account_nonexistent_client_returns_404(
         self, client_api, mock_user_api
     ) -> None:
@@ -95,6 +152,119 @@ class TestBankAccountAPI:
         assert response.status_code == 200
         assert response.json()[0]["id"] == account.id
 
+    def test_cached_account_reflects_writes(
+        self, client_api, mock_user_api, mock_bank_account
+    ) -> None:
+        """Consultas repetidas por número e por ID refletem os lançamentos e a renumeração."""
+        account = mock_bank_account(account_number="200004", balance=Decimal("100.00"))
+
+        for query in ["account_number=200004", f"id={account.id}"] * 2:
+            response = client_api.get(
+                f"api/conta_bancarias?{query}",
+                headers=self._auth_headers(mock_user_api),
+            )
+            assert response.json()[0]["balance"] == "100.00"
+
+        response = client_api.post(
+            "api/transacao_bancaria",
+            json={"type": "deposit", "amount": 50.00, "account_number": "200004"},
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert response.status_code == 200
+
+        for query in ["account_number=200004", f"id={account.id}"]:
+            response = client_api.get(
+                f"api/conta_bancarias?{query}",
+                headers=self._auth_headers(mock_user_api),
+            )
+            assert response.json()[0]["balance"] == "150.00"
+
+        response = client_api.put(
+            "api/conta_bancaria?account_number=200004",
+            json={"account_number": "200005", "client_cpf": account.client_cpf},
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert response.status_code == 200
+
+        response = client_api.get(
+            "api/conta_bancarias?account_number=200004",
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert response.status_code == 404
+        response = client_api.get(
+            f"api/conta_bancarias?id={account.id}",
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert response.json()[0]["account_number"] == "200005"
+
+    def test_consistency_token_reads_own_writes(
+        self, client_api, mock_user_api, mock_bank_account
+    ) -> None:
+        """
+        Escritas bem-sucedidas retornam o token de consistência, e leituras com ele
+        as refletem; escritas que falharam não o retornam.
+        """
+        mock_bank_account(account_number="200006", balance=Decimal("100.00"))
+
+        response = client_api.post(
+            "api/transacao_bancaria",
+            json={"type": "deposit", "amount": 50.00, "account_number": "200006"},
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert response.status_code == 200
+        consistency_token = response.headers["X-Consistency-Token"]
+        assert parse_lsn(consistency_token) > 0
+
+        response = client_api.post(
+            "api/transacao_bancaria",
+            json={"type": "withdrawal", "amount": 500.00, "account_number": "200006"},
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert response.status_code == 400
+        assert "X-Consistency-Token" not in response.headers
+
+        for token in [consistency_token, "invalido"]:
+            response = client_api.get(
+                "api/conta_bancarias?account_number=200006&list_transactions=true",
+                headers=self._auth_headers(mock_user_api)
+                | {"X-Consistency-Token": token},
+            )
+            assert response.status_code == 200
+            assert response.json()[0]["balance"] == "150.00"
+            assert "X-Consistency-Token" not in response.headers
+
+    def test_conditional_get_returns_304_until_account_changes(
+        self, client_api, mock_user_api, mock_bank_account
+    ) -> None:
+        """Com a ETag atual em If-None-Match, retorna 304; após um lançamento, 200 com nova ETag."""
+        mock_bank_account(account_number="200007", balance=Decimal("100.00"))
+        url = "api/conta_bancarias?account_number=200007&list_transactions=true"
+
+        response = client_api.get(url, headers=self._auth_headers(mock_user_api))
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = client_api.get(
+            url, headers=self._auth_headers(mock_user_api) | {"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+        response = client_api.post(
+            "api/transacao_bancaria",
+            json={"type": "deposit", "amount": 50.00, "account_number": "200007"},
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert response.status_code == 200
+
+        response = client_api.get(
+            url, headers=self._auth_headers(mock_user_api) | {"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()[0]["balance"] == "150.00"
+
     def test_list_with_transactions(
         self, client_api, mock_user_api, mock_bank_account, mock_bank_transaction
     ) -> None:
@@ -110,6 +280,256 @@ class TestBankAccountAPI:
         assert response.status_code == 200
         assert len(response.json()[0].get("transactions", [])) >= 1
 
+    def test_list_with_sent_and_received_transactions(
+        self, client_api, mock_user_api, mock_bank_account
+    ) -> None:
+        """A listagem traz as transações enviadas e recebidas de cada conta, da mais recente à mais antiga."""
+        mock_bank_account(account_number="200011", balance=Decimal("100.00"))
+        mock_bank_account(account_number="200012", balance=Decimal("0.00"))
+        mock_bank_account(account_number="200013", balance=Decimal("0.00"))
+
+        for payload in [
+            {
+                "type": "transfer",
+                "amount": 30.00,
+                "account_number": "200011",
+                "destination_account_number": "200012",
+            },
+            {"type": "deposit", "amount": 10.00, "account_number": "200012"},
+            {
+                "type": "transfer",
+                "amount": 5.00,
+                "account_number": "200012",
+                "destination_account_number": "200013",
+            },
+        ]:
+            response = client_api.post(
+                "api/transacao_bancaria",
+                json=payload,
+                headers=self._auth_headers(mock_user_api),
+            )
+            assert response.status_code == 200
+
+        response = client_api.get(
+            "api/conta_bancarias?list_transactions=true",
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        assert response.status_code == 200
+        transactions = {
+            account["account_number"]: [
+                (transaction["type"], transaction["amount"])
+                for transaction in account["transactions"]
+            ]
+            for account in response.json()
+        }
+        assert transactions["200011"] == [("transfer", "30.00")]
+        assert transactions["200012"] == [
+            ("transfer", "5.00"),
+            ("deposit", "10.00"),
+            ("transfer", "30.00"),
+        ]
+        assert transactions["200013"] == [("transfer", "5.00")]
+
+    def test_statement(self, client_api, mock_user_api, mock_bank_account) -> None:
+        """Extrato traz os lançamentos da conta, com o saldo após cada um e os saldos do período."""
+        mock_bank_account(account_number="200021", balance=Decimal("100.00"))
+        mock_bank_account(account_number="200022", balance=Decimal("0.00"))
+
+        for payload in [
+            {"type": "deposit", "amount": 50.00, "account_number": "200021"},
+            {"type": "withdrawal", "amount": 20.00, "account_number": "200021"},
+            {
+                "type": "transfer",
+                "amount": 30.00,
+                "account_number": "200021",
+                "destination_account_number": "200022",
+            },
+            {
+                "type": "transfer",
+                "amount": 10.00,
+                "account_number": "200022",
+                "destination_account_number": "200021",
+            },
+        ]:
+            response = client_api.post(
+                "api/transacao_bancaria",
+                json=payload,
+                headers=self._auth_headers(mock_user_api),
+            )
+            assert response.status_code == 200
+
+        response = client_api.get(
+            "api/conta_bancaria/extrato",
+            params={"account_number": "200021"},
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["opening_balance"] == "100.00"
+        assert body["closing_balance"] == "110.00"
+        assert [(entry["amount"], entry["balance"]) for entry in body["entries"]] == [
+            ("50.00", "150.00"),
+            ("-20.00", "130.00"),
+            ("-30.00", "100.00"),
+            ("10.00", "110.00"),
+        ]
+
+        response = client_api.get(
+            "api/conta_bancaria/extrato",
+            params={
+                "account_number": "200021",
+                "from": (datetime.now(UTC) + timedelta(days=1)).isoformat(),
+            },
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["entries"] == []
+        assert body["opening_balance"] == body["closing_balance"] == "110.00"
+
+    def test_statement_invalid_period_returns_400(
+        self, client_api, mock_user_api, mock_bank_account
+    ) -> None:
+        """Extrato com o fim do período anterior ao início retorna 400."""
+        mock_bank_account(account_number="200023", balance=Decimal("0.00"))
+
+        response = client_api.get(
+            "api/conta_bancaria/extrato",
+            params={
+                "account_number": "200023",
+                "from": "2026-02-01T00:00:00+00:00",
+                "to": "2026-01-01T00:00:00+00:00",
+            },
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        assert response.status_code == 400
+
+    def test_statement_nonexistent_account_returns_404(
+        self, client_api, mock_user_api
+    ) -> None:
+        """Extrato de conta inexistente retorna 404."""
+        response = client_api.get(
+            "api/conta_bancaria/extrato",
+            params={"account_number": "999999"},
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        assert response.status_code == 404
+
+    def test_daily_and_monthly_summary(
+        self, client_api, mock_user_api, mock_bank_account
+    ) -> None:
+        """Resumos trazem, por período e tipo, a quantidade, os créditos, os débitos e o líquido."""
+        mock_bank_account(account_number="200031", balance=Decimal("100.00"))
+        mock_bank_account(account_number="200032", balance=Decimal("0.00"))
+
+        for payload in [
+            {"type": "deposit", "amount": 50.00, "account_number": "200031"},
+            {"type": "deposit", "amount": 25.00, "account_number": "200031"},
+            {"type": "withdrawal", "amount": 20.00, "account_number": "200031"},
+            {
+                "type": "transfer",
+                "amount": 30.00,
+                "account_number": "200031",
+                "destination_account_number": "200032",
+            },
+        ]:
+            response = client_api.post(
+                "api/transacao_bancaria",
+                json=payload,
+                headers=self._auth_headers(mock_user_api),
+            )
+            assert response.status_code == 200
+
+        # Projeta as transações sem concorrer com a execução em segundo plano
+        client_api.portal.call(TRANSACTION_ROLLUP_PROJECTOR.stop)
+        try:
+            client_api.portal.call(TRANSACTION_ROLLUP_PROJECTOR.project)
+        finally:
+            client_api.portal.call(TRANSACTION_ROLLUP_PROJECTOR.start)
+
+        today = get_local_time().date()
+        response = client_api.get(
+            "api/conta_bancaria/resumo_diario",
+            params={"account_number": "200031"},
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        assert response.status_code == 200
+        assert [
+            (
+                entry["period_start"],
+                entry["type"],
+                entry["count"],
+                entry["credits"],
+                entry["debits"],
+                entry["net"],
+            )
+            for entry in response.json()["entries"]
+        ] == [
+            (today.isoformat(), "deposit", 2, "75.00", "0.00", "75.00"),
+            (today.isoformat(), "transfer", 1, "0.00", "30.00", "-30.00"),
+            (today.isoformat(), "withdrawal", 1, "0.00", "20.00", "-20.00"),
+        ]
+
+        response = client_api.get(
+            "api/conta_bancaria/resumo_mensal",
+            params={"account_number": "200032"},
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        assert response.status_code == 200
+        entries = response.json()["entries"]
+        assert len(entries) == 1
+        assert entries[0]["period_start"] == today.replace(day=1).isoformat()
+        assert entries[0]["credits"] == entries[0]["net"] == "30.00"
+
+        response = client_api.get(
+            "api/conta_bancaria/resumo_mensal",
+            params={
+                "account_number": "200031",
+                "from": (today + timedelta(days=1)).isoformat(),
+            },
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        assert response.status_code == 200
+        assert response.json()["entries"] == []
+
+    def test_summary_invalid_period_returns_400(
+        self, client_api, mock_user_api, mock_bank_account
+    ) -> None:
+        """Resumo com o fim do período anterior ao início retorna 400."""
+        mock_bank_account(account_number="200033", balance=Decimal("0.00"))
+
+        response = client_api.get(
+            "api/conta_bancaria/resumo_diario",
+            params={
+                "account_number": "200033",
+                "from": "2026-02-01",
+                "to": "2026-01-01",
+            },
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        assert response.status_code == 400
+
+    def test_summary_nonexistent_account_returns_404(
+        self, client_api, mock_user_api
+    ) -> None:
+        """Resumo de conta inexistente retorna 404."""
+        response = client_api.get(
+            "api/conta_bancaria/resumo_mensal",
+            params={"account_number": "999999"},
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        assert response.status_code == 404
+
     def test_update_by_account_number(
         self, client_api, mock_user_api, mock_bank_account
     ) -> None:
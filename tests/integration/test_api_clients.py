@@ -34,6 +34,26 @@ class TestClientAPI:
 
         assert response.status_code == 409
 
+    def test_register_batch(self, client_api, mock_user_api, mock_client) -> None:
+        """Cadastro em lote retorna o resultado de cada item, na ordem do lote."""
+        cpf = CPF.generate()
+        data = [
+            {"name": "Ana", "cpf": cpf},
+            {"name": "Ana de novo", "cpf": cpf},
+            {"name": "Existente", "cpf": str(mock_client.cpf)},
+            {"name": "Inválido", "cpf": "123"},
+        ]
+
+        response = client_api.post(
+            "api/clientes/lote", json=data, headers=self._auth_headers(mock_user_api)
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["status_code"] for item in body] == [200, 409, 409, 400]
+        assert body[0]["client"]["cpf"] == cpf
+        assert body[3]["error_code"] == "InvalidClientCPF"
+
     def test_list_clients(self, client_api, mock_user_api, mock_client) -> None:
         """Listagem de clientes retorna ao menos um resultado."""
         response = client_api.get(
@@ -1,4 +1,13 @@
+import json
 from decimal import Decimal
+from functools import partial
+
+from sqlalchemy import create_engine, text
+
+from business_contexts.repository.domain_repo.bank_transaction import (
+    BankTransactionDomainRepo,
+)
+from tests.conftest import TEST_DATABASE_URL_SYNC
 
 
 class TestBankTransactionAPI:
@@ -109,6 +118,31 @@ class TestBankTransactionAPI:
 
         assert response.status_code == 400
 
+    def test_transfer_to_same_account_keeps_balance(
+        self, client_api, mock_user_api, mock_bank_account
+    ) -> None:
+        """Transferência para a própria conta não altera o saldo."""
+        mock_bank_account(account_number="600006", balance=Decimal("100.00"))
+
+        response = client_api.post(
+            "api/transacao_bancaria",
+            json={
+                "type": "transfer",
+                "amount": 30.00,
+                "account_number": "600006",
+                "destination_account_number": "600006",
+            },
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        assert response.status_code == 200
+
+        account = client_api.get(
+            "api/conta_bancarias?account_number=600006",
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert account.json()[0]["balance"] == "100.00"
+
     def test_transfer_to_nonexistent_account(
         self, client_api, mock_user_api, mock_bank_account
     ) -> None:
@@ -147,6 +181,379 @@ class TestBankTransactionAPI:
         assert response.status_code == 200
         assert len(response.json()) >= 1
 
+    def test_list_transactions_by_cursor(
+        self, client_api, mock_user_api, mock_bank_account
+    ) -> None:
+        """Listagem paginada percorre todas as transações, em ordem de data, sem repetições."""
+        mock_bank_account(account_number="700011", balance=Decimal("0.00"))
+        for amount in (1.00, 2.00, 3.00):
+            client_api.post(
+                "api/transacao_bancaria",
+                json={"type": "deposit", "amount": amount, "account_number": "700011"},
+                headers=self._auth_headers(mock_user_api),
+            )
+
+        first_page = client_api.get(
+            "api/transacao_bancarias?limit=2",
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert first_page.status_code == 200
+        assert len(first_page.json()) == 2
+        cursor = first_page.headers["X-Next-Cursor"]
+
+        second_page = client_api.get(
+            f"api/transacao_bancarias?limit=2&after={cursor}",
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert second_page.status_code == 200
+        assert "X-Next-Cursor" not in second_page.headers
+
+        amounts = [
+            transaction["amount"]
+            for transaction in first_page.json() + second_page.json()
+        ]
+        assert amounts == ["1.00", "2.00", "3.00"]
+
+    def test_conditional_get_returns_304(
+        self, client_api, mock_user_api, mock_bank_account
+    ) -> None:
+        """Com a ETag atual em If-None-Match, a consulta da transação retorna 304."""
+        mock_bank_account(account_number="700021", balance=Decimal("0.00"))
+        transaction = client_api.post(
+            "api/transacao_bancaria",
+            json={"type": "deposit", "amount": 10.00, "account_number": "700021"},
+            headers=self._auth_headers(mock_user_api),
+        ).json()
+        url = f"api/transacao_bancarias?id={transaction['id']}"
+
+        response = client_api.get(url, headers=self._auth_headers(mock_user_api))
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        for if_none_match in [etag, f'"outra", W/{etag}']:
+            response = client_api.get(
+                url,
+                headers=self._auth_headers(mock_user_api)
+                | {"If-None-Match": if_none_match},
+            )
+            assert response.status_code == 304
+            assert response.headers["ETag"] == etag
+
+        response = client_api.get(
+            url,
+            headers=self._auth_headers(mock_user_api) | {"If-None-Match": '"outra"'},
+        )
+        assert response.status_code == 200
+
+    def test_list_transactions_with_invalid_cursor_returns_400(
+        self, client_api, mock_user_api
+    ) -> None:
+        """Listagem com cursor inválido retorna 400."""
+        response = client_api.get(
+            "api/transacao_bancarias?after=invalido",
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        assert response.status_code == 400
+
+    def test_export_transactions(
+        self, client_api, mock_user_api, mock_bank_account
+    ) -> None:
+        """Exportação traz as transações da conta, em ordem de data, em NDJSON e CSV."""
+        mock_bank_account(account_number="700021", balance=Decimal("100.00"))
+        mock_bank_account(account_number="700022", balance=Decimal("0.00"))
+        mock_bank_account(account_number="700023", balance=Decimal("0.00"))
+        for payload in [
+            {
+                "type": "transfer",
+                "amount": 30.00,
+                "account_number": "700021",
+                "destination_account_number": "700022",
+            },
+            {"type": "deposit", "amount": 10.00, "account_number": "700022"},
+            {"type": "deposit", "amount": 5.00, "account_number": "700023"},
+        ]:
+            client_api.post(
+                "api/transacao_bancaria",
+                json=payload,
+                headers=self._auth_headers(mock_user_api),
+            )
+
+        response = client_api.get(
+            "api/transacao_bancarias/exportacao?account_number=700022",
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [
+            (json.loads(line)["type"], json.loads(line)["amount"])
+            for line in response.text.splitlines()
+        ] == [("transfer", "30.00"), ("deposit", "10.00")]
+
+        response = client_api.get(
+            "api/transacao_bancarias/exportacao?format=csv&account_number=700022",
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        assert response.status_code == 200
+        lines = response.text.splitlines()
+        assert lines[0].startswith("id,type,amount,date")
+        assert len(lines) == 3
+
+    def test_batch(self, client_api, mock_user_api, mock_bank_account) -> None:
+        """Lote aplica as operações válidas e retorna o erro de cada item inválido."""
+        mock_bank_account(account_number="710001", balance=Decimal("100.00"))
+        mock_bank_account(account_number="710002", balance=Decimal("0.00"))
+
+        response = client_api.post(
+            "api/transacao_bancarias/lote",
+            json=[
+                {
+                    "type": "transfer",
+                    "amount": 30.00,
+                    "account_number": "710001",
+                    "destination_account_number": "710002",
+                },
+                {"type": "withdrawal", "amount": 80.00, "account_number": "710001"},
+                {"type": "deposit", "amount": 10.00, "account_number": "999999"},
+                {"type": "withdrawal", "amount": 20.00, "account_number": "710002"},
+            ],
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        assert response.status_code == 200
+        items = response.json()
+        assert [item["status_code"] for item in items] == [200, 400, 404, 200]
+        assert items[1]["error_code"] == "InsufficientBalanceForTransaction"
+        assert items[2]["error_code"] == "BankAccountNotFound"
+        assert items[0]["transaction"]["id"]
+
+        origin = client_api.get(
+            "api/conta_bancarias?account_number=710001",
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert origin.json()[0]["balance"] == "70.00"
+
+        destination = client_api.get(
+            "api/conta_bancarias?account_number=710002",
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert destination.json()[0]["balance"] == "10.00"
+
+    def test_idempotency_key(
+        self, client_api, mock_user_api, mock_bank_account
+    ) -> None:
+        """Repetições com a mesma chave de idempotência não geram novos lançamentos."""
+        mock_bank_account(account_number="730001", balance=Decimal("100.00"))
+        headers = {
+            **self._auth_headers(mock_user_api),
+            "Idempotency-Key": "730001-withdrawal",
+        }
+        payload = {"type": "withdrawal", "amount": 40.00, "account_number": "730001"}
+
+        first = client_api.post("api/transacao_bancaria", json=payload, headers=headers)
+        second = client_api.post(
+            "api/transacao_bancaria", json=payload, headers=headers
+        )
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert second.json() == first.json()
+
+        account = client_api.get(
+            "api/conta_bancarias?account_number=730001",
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert account.json()[0]["balance"] == "60.00"
+
+        reused = client_api.post(
+            "api/transacao_bancaria",
+            json={**payload, "amount": 10.00},
+            headers=headers,
+        )
+        assert reused.status_code == 409
+
+    def test_ledger_posting(
+        self, client_api, mock_user_api, mock_bank_account, monkeypatch
+    ) -> None:
+        """No modo razão, o saldo é calculado a partir das transações lançadas."""
+        monkeypatch.setattr(
+            "business_contexts.services.executors.bank_transaction.BankTransactionDomainRepo",
+            partial(BankTransactionDomainRepo, posting_strategy="ledger"),
+        )
+        mock_bank_account(account_number="740001", balance=Decimal("100.00"))
+        mock_bank_account(account_number="740002", balance=Decimal("0.00"))
+
+        for payload in [
+            {"type": "deposit", "amount": 20.00, "account_number": "740001"},
+            {
+                "type": "transfer",
+                "amount": 50.00,
+                "account_number": "740001",
+                "destination_account_number": "740002",
+            },
+            {"type": "withdrawal", "amount": 10.00, "account_number": "740002"},
+        ]:
+            response = client_api.post(
+                "api/transacao_bancaria",
+                json=payload,
+                headers=self._auth_headers(mock_user_api),
+            )
+            assert response.status_code == 200
+
+        overdraft = client_api.post(
+            "api/transacao_bancaria",
+            json={"type": "withdrawal", "amount": 80.00, "account_number": "740001"},
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert overdraft.status_code == 400
+
+        origin = client_api.get(
+            "api/conta_bancarias?account_number=740001",
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert origin.json()[0]["balance"] == "70.00"
+
+        destination = client_api.get(
+            "api/conta_bancarias?account_number=740002",
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert destination.json()[0]["balance"] == "40.00"
+
+    def test_optimistic_posting(
+        self, client_api, mock_user_api, mock_bank_account, monkeypatch
+    ) -> None:
+        """No modo otimista, cada lançamento grava o saldo e incrementa a versão da conta."""
+        monkeypatch.setattr(
+            "business_contexts.services.executors.bank_transaction.BankTransactionDomainRepo",
+            partial(BankTransactionDomainRepo, posting_strategy="optimistic"),
+        )
+        mock_bank_account(account_number="760001", balance=Decimal("100.00"))
+        mock_bank_account(account_number="760002", balance=Decimal("0.00"))
+
+        for payload in [
+            {"type": "deposit", "amount": 20.00, "account_number": "760001"},
+            {
+                "type": "transfer",
+                "amount": 50.00,
+                "account_number": "760001",
+                "destination_account_number": "760002",
+            },
+            {"type": "withdrawal", "amount": 10.00, "account_number": "760002"},
+        ]:
+            response = client_api.post(
+                "api/transacao_bancaria",
+                json=payload,
+                headers=self._auth_headers(mock_user_api),
+            )
+            assert response.status_code == 200
+
+        overdraft = client_api.post(
+            "api/transacao_bancaria",
+            json={"type": "withdrawal", "amount": 80.00, "account_number": "760001"},
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert overdraft.status_code == 400
+
+        sync_engine = create_engine(TEST_DATABASE_URL_SYNC)
+        with sync_engine.connect() as conn:
+            rows = conn.execute(
+                text(
+                    "SELECT account_number, balance, version FROM bank_account "
+                    "WHERE account_number IN ('760001', '760002') "
+                    "ORDER BY account_number"
+                )
+            ).all()
+        sync_engine.dispose()
+
+        assert [tuple(row) for row in rows] == [
+            ("760001", Decimal("70.00"), 2),
+            ("760002", Decimal("40.00"), 2),
+        ]
+
+    def test_striped_account(
+        self, client_api, mock_user_api, mock_client, mock_bank_account
+    ) -> None:
+        """Conta particionada recebe créditos nas parcelas e mantém o saldo total."""
+        mock_bank_account(account_number="720001", balance=Decimal("100.00"))
+        client_api.post(
+            "api/conta_bancaria",
+            json={
+                "account_number": "720002",
+                "balance": "10.00",
+                "client_cpf": mock_client.cpf,
+                "balance_slots": 4,
+            },
+            headers=self._auth_headers(mock_user_api),
+        )
+
+        for _ in range(3):
+            response = client_api.post(
+                "api/transacao_bancaria",
+                json={
+                    "type": "transfer",
+                    "amount": 20.00,
+                    "account_number": "720001",
+                    "destination_account_number": "720002",
+                },
+                headers=self._auth_headers(mock_user_api),
+            )
+            assert response.status_code == 200
+
+        response = client_api.post(
+            "api/transacao_bancaria",
+            json={"type": "withdrawal", "amount": 65.00, "account_number": "720002"},
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert response.status_code == 200
+
+        account = client_api.get(
+            "api/conta_bancarias?account_number=720002",
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert account.json()[0]["balance"] == "5.00"
+        assert account.json()[0]["balance_slots"] == 4
+
+    def test_balance_after_is_stored(
+        self, client_api, mock_user_api, mock_bank_account
+    ) -> None:
+        """Cada transação armazena o saldo das contas logo após o lançamento."""
+        mock_bank_account(account_number="750001", balance=Decimal("100.00"))
+        mock_bank_account(account_number="750002", balance=Decimal("0.00"))
+
+        for payload in [
+            {"type": "deposit", "amount": 20.00, "account_number": "750001"},
+            {
+                "type": "transfer",
+                "amount": 50.00,
+                "account_number": "750001",
+                "destination_account_number": "750002",
+            },
+        ]:
+            response = client_api.post(
+                "api/transacao_bancaria",
+                json=payload,
+                headers=self._auth_headers(mock_user_api),
+            )
+            assert response.status_code == 200
+
+        sync_engine = create_engine(TEST_DATABASE_URL_SYNC)
+        with sync_engine.connect() as conn:
+            rows = conn.execute(
+                text(
+                    "SELECT type, balance_after, destination_balance_after "
+                    "FROM bank_transaction WHERE account_number = '750001' "
+                    "ORDER BY sequence"
+                )
+            ).all()
+        sync_engine.dispose()
+
+        assert [tuple(row) for row in rows] == [
+            ("deposit", Decimal("120.00"), None),
+            ("transfer", Decimal("70.00"), Decimal("50.00")),
+        ]
+
     def test_unauthenticated_returns_401(self, client_api) -> None:
         """Requisição sem token retorna 401."""
         response = client_api.post(
@@ -121,6 +121,49 @@ class TestUserAPI:
         assert response.status_code == 200
         assert response.json()["name"] == "Atualizado Por ID"
 
+    def test_cached_user_reflects_writes(self, client_api, mock_user_api) -> None:
+        """Consultas repetidas por email e por ID refletem a troca de email e a exclusão."""
+        user = self._create_test_user(client_api, mock_user_api)
+
+        for query in [f"email={user['email']}", f"id={user['id']}"] * 2:
+            response = client_api.get(
+                f"api/usuarios?{query}", headers=self._auth_headers(mock_user_api)
+            )
+            assert response.json()[0]["email"] == user["email"]
+
+        response = client_api.put(
+            f"api/usuario?id={user['id']}",
+            json={
+                "name": user["name"],
+                "email": "novo@email.com",
+                "password": user["password"],
+                "is_admin": False,
+                "is_active": True,
+            },
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert response.status_code == 200
+
+        response = client_api.get(
+            f"api/usuarios?email={user['email']}",
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert response.status_code == 404
+        response = client_api.get(
+            f"api/usuarios?id={user['id']}", headers=self._auth_headers(mock_user_api)
+        )
+        assert response.json()[0]["email"] == "novo@email.com"
+
+        response = client_api.delete(
+            f"api/usuario?id={user['id']}", headers=self._auth_headers(mock_user_api)
+        )
+        assert response.status_code == 200
+        response = client_api.get(
+            "api/usuarios?email=novo@email.com",
+            headers=self._auth_headers(mock_user_api),
+        )
+        assert response.status_code == 404
+
     def test_delete_by_email(self, client_api, mock_user_api) -> None:
         """Exclusão de usuário auxiliar por email retorna 200."""
         user = self._create_test_user(client_api, mock_user_api)
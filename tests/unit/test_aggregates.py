@@ -213,6 +213,26 @@ class TestBankAccountAggregate:
         with pytest.raises(InsufficientBalanceForTransaction):
             account.new_transaction(transaction)
 
+    def test_striped_account(self) -> None:
+        """Verifica que a conta é particionada quando possui parcelas de saldo."""
+        account = self._make_account()
+        assert account.is_striped is False
+
+        account.update(
+            account_number="123456", client_cpf="12345678901", balance_slots=8
+        )
+
+        assert account.is_striped is True
+        assert account.balance_slots == 8
+
+    def test_receive_transfer(self) -> None:
+        """Verifica que a transferência recebida aumenta o saldo da conta de destino."""
+        account = self._make_account(Decimal("10.00"))
+
+        account.receive_transfer(Decimal("40.00"))
+
+        assert account.balance == Decimal("50.00")
+
     def test_negative_amount_raises(self) -> None:
         """Verifica que valor negativo lança exceção."""
         account = self._make_account()
@@ -1,6 +1,11 @@
 import pytest
 
-from business_contexts.utils.base_types import CPF, AccountNumber, OperationType
+from business_contexts.utils.base_types import (
+    CPF,
+    AccountNumber,
+    OperationType,
+    PostingStrategy,
+)
 
 
 class TestCPF:
@@ -65,3 +70,17 @@ class TestOperationType:
         assert OperationType.INSERT.value == "insert"
         assert OperationType.UPDATE.value == "update"
         assert OperationType.DELETE.value == "delete"
+
+
+class TestPostingStrategy:
+    """Testes unitários para o enum PostingStrategy."""
+
+    def test_values(self) -> None:
+        """Verifica os valores do enum PostingStrategy."""
+        assert PostingStrategy.ATOMIC.value == "atomic"
+        assert PostingStrategy.PESSIMISTIC.value == "pessimistic"
+        assert PostingStrategy.LEDGER.value == "ledger"
+
+    def test_from_config_value(self) -> None:
+        """Verifica a conversão do valor de configuração para a estratégia."""
+        assert PostingStrategy("atomic") is PostingStrategy.ATOMIC
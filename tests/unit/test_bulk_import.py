@@ -0,0 +1,148 @@
+import json
+from decimal import Decimal
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+from business_contexts.domain.value_objects.bulk_import import (
+    ImportCheckpoint,
+    ImportKind,
+)
+from business_contexts.services.executors import bulk_import
+from business_contexts.services.executors.bulk_import import (
+    import_file,
+    read_batches,
+)
+from business_contexts.utils.base_types import CPF
+
+
+class FakeBulkImportDomainRepo:
+    """Repositório de importação em memória, no lugar do banco de dados."""
+
+    checkpoints: ClassVar[dict[str, ImportCheckpoint]] = {}
+    imported: ClassVar[list[tuple]] = []
+
+    async def query_checkpoint(self, source: str) -> ImportCheckpoint | None:
+        return self.checkpoints.get(source)
+
+    async def import_batch(
+        self,
+        kind: ImportKind,
+        source: str,
+        records: list[tuple],
+        last_line: int,
+        invalid: int = 0,
+    ) -> list[int]:
+        known = {record[-1] for record in self.imported}
+        rejected = [record[0] for record in records if record[-1] in known]
+        self.imported.extend(record for record in records if record[-1] not in known)
+        self.checkpoints[source] = ImportCheckpoint(
+            source=source, kind=kind.value, line=last_line
+        )
+        return rejected
+
+
+class TestBulkImport:
+    """Testes unitários para a importação em massa."""
+
+    @pytest.fixture(autouse=True)
+    def fake_repo(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Substitui o repositório de importação por um em memória."""
+        FakeBulkImportDomainRepo.checkpoints = {}
+        FakeBulkImportDomainRepo.imported = []
+        monkeypatch.setattr(
+            bulk_import, "BulkImportDomainRepo", FakeBulkImportDomainRepo
+        )
+
+    def test_validates_transactions(self, tmp_path: Path) -> None:
+        """Linhas inválidas são separadas das válidas, com o motivo da rejeição."""
+        path = tmp_path / "transactions.jsonl"
+        rows = [
+            {
+                "type": "deposit",
+                "amount": "10",
+                "account_number": "123456",
+                "date": "2024-01-02T10:00:00",
+            },
+            {
+                "type": "transfer",
+                "amount": "5",
+                "account_number": "123456",
+                "date": "2024-01-02T11:00:00",
+            },
+            {
+                "type": "withdrawal",
+                "amount": "-1",
+                "account_number": "123456",
+                "date": "2024-01-02T12:00:00",
+            },
+            {
+                "type": "deposit",
+                "amount": "1",
+                "account_number": "12",
+                "date": "2024-01-02T13:00:00",
+            },
+        ]
+        path.write_text(
+            "\n".join(json.dumps(row) for row in rows) + "\n{malformed\n",
+            encoding="utf-8",
+        )
+
+        [batch] = read_batches(
+            ImportKind.TRANSACTIONS, path, "source", first_line=1, batch_size=10
+        )
+
+        assert [record[0] for record in batch.records] == [1]
+        assert batch.records[0][2:4] == ("deposit", Decimal("10.00"))
+        assert batch.records[0][4].tzinfo is not None
+        assert [line for line, _ in batch.invalid] == [2, 3, 4, 5]
+        assert batch.last_line == 5
+
+    def test_transaction_id_is_stable_across_runs(self, tmp_path: Path) -> None:
+        """Sem identificador no arquivo, a mesma linha recebe sempre o mesmo identificador."""
+        path = tmp_path / "transactions.csv"
+        path.write_text(
+            "type,amount,account_number,destination_account_number,date\n"
+            "transfer,5,123456,654321,2024-01-02T10:00:00-03:00\n",
+            encoding="utf-8",
+        )
+
+        [first] = read_batches(ImportKind.TRANSACTIONS, path, "source", 1, 10)
+        [second] = read_batches(ImportKind.TRANSACTIONS, path, "source", 1, 10)
+
+        assert first.records[0][1] == second.records[0][1]
+        assert first.records[0][6] == "654321"
+
+    async def test_imports_in_batches_and_resumes(self, tmp_path: Path) -> None:
+        """A importação grava os lotes, registra os rejeitados e retoma do checkpoint."""
+        path = tmp_path / "clients.csv"
+        cpfs = [CPF.generate() for _ in range(4)]
+        path.write_text(
+            "name,cpf\n"
+            + "".join(f"Cliente {index},{cpf}\n" for index, cpf in enumerate(cpfs))
+            + f"Repetido,{cpfs[0]}\n"
+            + "Inválido,123\n",
+            encoding="utf-8",
+        )
+
+        report = await import_file(ImportKind.CLIENTS, path, batch_size=2)
+
+        assert (report.imported, report.rejected, report.skipped) == (4, 2, 0)
+        assert [record[0] for record in FakeBulkImportDomainRepo.imported] == [
+            1,
+            2,
+            3,
+            4,
+        ]
+        rejects = [
+            json.loads(line)
+            for line in (tmp_path / "clients.csv.rejected.jsonl")
+            .read_text()
+            .splitlines()
+        ]
+        assert [reject["line"] for reject in rejects] == [5, 6]
+
+        resumed = await import_file(ImportKind.CLIENTS, path, batch_size=2)
+
+        assert (resumed.imported, resumed.rejected, resumed.skipped) == (0, 0, 6)
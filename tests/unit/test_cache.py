@@ -0,0 +1,351 @@
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from libs.ddd.adapters.cache import (
+    CacheBackend,
+    CacheBackendError,
+    InMemoryCacheBackend,
+    ReadThroughCache,
+)
+from libs.ddd.adapters.redis_cache import RedisCacheBackend, encode_command
+from libs.metrics import METRICS
+
+
+class FakeRedisServer:
+    """
+    Servidor local com o subconjunto do protocolo do Redis usado pelo cache (GET, SET
+    com PX, DEL, INCR, PEXPIRE, SCAN, AUTH e SELECT). Registra os lotes de comandos
+    recebidos em cada leitura do socket, para verificar o pipelining.
+    """
+
+    def __init__(self) -> None:
+        self.items: dict[bytes, bytes] = {}
+        self.expirations: dict[bytes, float] = {}
+        self.batches: list[list[list[bytes]]] = []
+        self.server: asyncio.Server | None = None
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"redis://127.0.0.1:{port}/0"
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        buffer = b""
+        try:
+            while data := await reader.read(65536):
+                buffer += data
+                commands, buffer = self.parse(buffer)
+                if commands:
+                    self.batches.append(commands)
+                    writer.write(
+                        b"".join(self.execute(command) for command in commands)
+                    )
+                    await writer.drain()
+        finally:
+            writer.close()
+
+    @staticmethod
+    def parse(buffer: bytes) -> tuple[list[list[bytes]], bytes]:
+        commands: list[list[bytes]] = []
+        while b"\r\n" in buffer:
+            header, position = buffer.split(b"\r\n", 1)[0], buffer.index(b"\r\n") + 2
+            arguments: list[bytes] = []
+            for _ in range(int(header[1:])):
+                end = buffer.find(b"\r\n", position)
+                if end < 0:
+                    return commands, buffer
+                length = int(buffer[position + 1 : end])
+                if len(buffer) < end + 2 + length + 2:
+                    return commands, buffer
+                arguments.append(buffer[end + 2 : end + 2 + length])
+                position = end + 2 + length + 2
+            commands.append(arguments)
+            buffer = buffer[position:]
+        return commands, buffer
+
+    def execute(self, command: list[bytes]) -> bytes:
+        name, *arguments = command
+        self.expire()
+        match name.upper():
+            case b"GET":
+                value = self.items.get(arguments[0])
+                if value is None:
+                    return b"$-1\r\n"
+                return b"$%d\r\n%s\r\n" % (len(value), value)
+            case b"SET":
+                self.items[arguments[0]] = arguments[1]
+                self.expirations.pop(arguments[0], None)
+                if len(arguments) == 4:
+                    self.expirations[arguments[0]] = (
+                        time.monotonic() + int(arguments[3]) / 1000
+                    )
+                return b"+OK\r\n"
+            case b"DEL":
+                deleted = [self.items.pop(key, None) for key in arguments]
+                return b":%d\r\n" % sum(value is not None for value in deleted)
+            case b"INCR":
+                value = int(self.items.get(arguments[0], b"0")) + 1
+                self.items[arguments[0]] = str(value).encode()
+                return b":%d\r\n" % value
+            case b"PEXPIRE":
+                self.expirations[arguments[0]] = (
+                    time.monotonic() + int(arguments[1]) / 1000
+                )
+                return b":1\r\n"
+            case b"SCAN":
+                prefix = arguments[2].rstrip(b"*")
+                keys = [key for key in self.items if key.startswith(prefix)]
+                return b"*2\r\n$1\r\n0\r\n" + encode_command(keys)
+            case b"AUTH" | b"SELECT":
+                return b"+OK\r\n"
+        return b"-ERR unknown command\r\n"
+
+    def expire(self) -> None:
+        now = time.monotonic()
+        for key, expiration in list(self.expirations.items()):
+            if expiration <= now:
+                self.items.pop(key, None)
+                del self.expirations[key]
+
+
+@pytest.fixture
+async def redis_server() -> AsyncGenerator[FakeRedisServer]:
+    server = FakeRedisServer()
+    yield server
+    await server.stop()
+
+
+def cache(name: str, backend: CacheBackend, **kwargs) -> ReadThroughCache[str, int]:
+    return ReadThroughCache(name, backend=backend, value_type=int, **kwargs)
+
+
+class TestReadThroughCache:
+    """Testes unitários para o cache de leitura (read-through)."""
+
+    async def test_loads_once_and_hits(self) -> None:
+        """Verifica que o valor é carregado na primeira leitura e reaproveitado nas seguintes."""
+        accounts = cache("test_hits", InMemoryCacheBackend(max_size=10))
+        loads: list[str] = []
+
+        async def load() -> int:
+            loads.append("123456")
+            return 1
+
+        assert await accounts.get("123456", load) == 1
+        assert await accounts.get("123456", load) == 1
+        assert loads == ["123456"]
+        assert METRICS.get_counter("test_hits_misses") == 1
+        assert METRICS.get_counter("test_hits_hits") == 1
+
+    async def test_concurrent_reads_load_once(self) -> None:
+        """Verifica que leituras concorrentes da mesma chave aguardam um único carregamento."""
+        accounts = cache("test_once", InMemoryCacheBackend(max_size=10))
+        loads: list[str] = []
+
+        async def load() -> int:
+            loads.append("123456")
+            await asyncio.sleep(0.01)
+            return 1
+
+        values = await asyncio.gather(*(accounts.get("123456", load) for _ in range(5)))
+
+        assert values == [1] * 5
+        assert loads == ["123456"]
+
+    async def test_missing_values_are_not_cached(self) -> None:
+        """Verifica que valores ausentes (None) são carregados novamente."""
+        accounts = cache("test_none", InMemoryCacheBackend(max_size=10))
+        loads: list[str] = []
+
+        async def load() -> None:
+            loads.append("123456")
+
+        assert await accounts.get("123456", load) is None
+        assert await accounts.get("123456", load) is None
+        assert len(loads) == 2
+
+    async def test_values_are_stored_as_json(self) -> None:
+        """
+        Verifica que os valores são armazenados em JSON e que um valor que não
+        corresponda ao tipo (como um objeto serializado com pickle) é carregado novamente.
+        """
+        backend = InMemoryCacheBackend(max_size=10)
+        accounts = cache("test_json", backend)
+
+        async def load() -> int:
+            return 1
+
+        assert await accounts.get("123456", load) == 1
+        assert await backend.get_many(["test_json:123456"]) == [b"[0,1]"]
+
+        await backend.set_many({"test_json:123456": b"\x80\x04K\x01."}, None)
+        loads: list[str] = []
+
+        async def reload() -> int:
+            loads.append("123456")
+            return 2
+
+        assert await accounts.get("123456", reload) == 2
+        assert loads == ["123456"]
+
+    async def test_invalidation_discards_in_flight_load(self) -> None:
+        """Verifica que o valor carregado antes de uma invalidação não é armazenado."""
+        accounts = cache("test_inv", InMemoryCacheBackend(max_size=10))
+        loading = asyncio.Event()
+        release = asyncio.Event()
+        balances = iter([1, 2])
+
+        async def load() -> int:
+            loading.set()
+            await release.wait()
+            return next(balances)
+
+        stale = asyncio.create_task(accounts.get("123456", load))
+        await loading.wait()
+        await accounts.invalidate("123456")
+        release.set()
+
+        assert await stale == 1
+        assert await accounts.get("123456", load) == 2
+        assert await accounts.get("123456", load) == 2
+
+    async def test_invalidation_is_shared_between_instances(self) -> None:
+        """
+        Verifica que a invalidação feita por uma instância (outro processo) descarta o
+        valor, inclusive o gravado por um carregamento iniciado antes dela.
+        """
+        backend = InMemoryCacheBackend(max_size=10)
+        reader = cache("test_shared", backend)
+        writer = cache("test_shared", backend)
+        loading = asyncio.Event()
+        release = asyncio.Event()
+        balances = iter([1, 2])
+
+        async def load() -> int:
+            loading.set()
+            await release.wait()
+            return next(balances)
+
+        stale = asyncio.create_task(reader.get("123456", load))
+        await loading.wait()
+        await writer.invalidate("123456")
+        release.set()
+
+        assert await stale == 1
+        assert await reader.get("123456", load) == 2
+        assert await writer.get("123456", load) == 2
+
+    async def test_evictions_are_counted(self) -> None:
+        """Verifica que os itens descartados por tamanho são registrados nas métricas."""
+        evictions = METRICS.get_counter("cache_evictions", label="total")
+        accounts = cache("test_evict", InMemoryCacheBackend(max_size=2))
+
+        async def load() -> int:
+            return 1
+
+        await accounts.get("111111", load)
+        await accounts.get("222222", load)
+        await accounts.get("333333", load)
+
+        assert METRICS.get_counter("cache_evictions", label="total") == evictions + 1
+
+    async def test_disabled_always_loads(self) -> None:
+        """Verifica que o cache desabilitado carrega o valor em todas as leituras."""
+        accounts = cache("test_off", InMemoryCacheBackend(max_size=10), enabled=False)
+        loads: list[str] = []
+
+        async def load() -> int:
+            loads.append("123456")
+            return 1
+
+        await accounts.get("123456", load)
+        await accounts.get("123456", load)
+
+        assert len(loads) == 2
+
+    async def test_backend_failure_falls_back_to_load(self) -> None:
+        """Verifica que, com o armazenamento indisponível, o valor é carregado."""
+        accounts = cache(
+            "test_down", RedisCacheBackend("redis://127.0.0.1:1/0", timeout_ms=500)
+        )
+
+        async def load() -> int:
+            return 1
+
+        assert await accounts.get("123456", load) == 1
+        await accounts.invalidate("123456")
+        assert METRICS.get_counter("test_down_errors", label="total") == 2
+
+
+class TestRedisCacheBackend:
+    """Testes unitários para o armazenamento do cache no protocolo do Redis."""
+
+    async def test_batch_operations(self, redis_server: FakeRedisServer) -> None:
+        """Verifica as operações em lote e que cada uma é enviada de uma vez."""
+        backend = RedisCacheBackend(await redis_server.start())
+
+        await backend.set_many({"a": b"1", "b": b"\r\n2"}, ttl_seconds=60)
+        await backend.increment_many(["c", "c"], ttl_seconds=60)
+        assert await backend.get_many(["a", "b", "c", "d"]) == [
+            b"1",
+            b"\r\n2",
+            b"2",
+            None,
+        ]
+        await backend.delete_many(["a", "c"])
+        assert await backend.get_many(["a", "b", "c"]) == [None, b"\r\n2", None]
+
+        assert [len(batch) for batch in redis_server.batches] == [2, 4, 4, 1, 3]
+        await backend.close()
+
+    async def test_expiration(self, redis_server: FakeRedisServer) -> None:
+        """Verifica que os valores expiram com o tempo de vida informado."""
+        backend = RedisCacheBackend(await redis_server.start())
+
+        await backend.set_many({"a": b"1"}, ttl_seconds=0.01)
+        await asyncio.sleep(0.02)
+
+        assert await backend.get_many(["a"]) == [None]
+        await backend.close()
+
+    async def test_clear_by_prefix(self, redis_server: FakeRedisServer) -> None:
+        """Verifica que apenas as chaves com o prefixo são removidas."""
+        backend = RedisCacheBackend(await redis_server.start())
+
+        await backend.set_many({"accounts:1": b"1", "users:1": b"1"})
+        await backend.clear("accounts:")
+
+        assert await backend.get_many(["accounts:1", "users:1"]) == [None, b"1"]
+        await backend.close()
+
+    async def test_shared_read_through_cache(
+        self, redis_server: FakeRedisServer
+    ) -> None:
+        """Verifica o cache de leitura sobre o armazenamento, com uma leitura por ida."""
+        backend = RedisCacheBackend(await redis_server.start())
+        accounts = cache("test_redis", backend, ttl_seconds=60)
+
+        async def load() -> int:
+            return 1
+
+        assert await accounts.get("123456", load) == 1
+        redis_server.batches.clear()
+        assert await accounts.get("123456", load) == 1
+        assert [len(batch) for batch in redis_server.batches] == [2]
+        await backend.close()
+
+    async def test_unreachable_server(self) -> None:
+        """Verifica que a falha de conexão é lançada como CacheBackendError."""
+        backend = RedisCacheBackend("redis://127.0.0.1:1/0", timeout_ms=500)
+
+        with pytest.raises(CacheBackendError):
+            await backend.get_many(["a"])
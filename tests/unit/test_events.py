@@ -0,0 +1,263 @@
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import ClassVar
+
+import pytest
+
+from business_contexts.domain.aggregates.bank_account import Account
+from business_contexts.domain.aggregates.bank_transaction import Transaction
+from business_contexts.domain.aggregates.client import Client
+from business_contexts.domain.events import (
+    AccountCreated,
+    ClientUpdated,
+    TransactionPosted,
+)
+from business_contexts.domain.value_objects.bank_transaction import TransactionType
+from business_contexts.services.tasks import outbox_dispatcher
+from business_contexts.services.tasks.outbox_dispatcher import OutboxDispatcher
+from business_contexts.utils.base_types import CPF
+from libs.ddd.adapters.repository import DomainRepository
+from libs.ddd.domain.event import OutboxDeliveryError, OutboxMessage
+
+
+def _message(event_type: str, aggregate_id: str) -> OutboxMessage:
+    """Cria uma mensagem de outbox para os testes."""
+    return OutboxMessage(
+        event_type=event_type,
+        aggregate_type="Transaction",
+        aggregate_id=aggregate_id,
+        payload={},
+    )
+
+
+class FakeOutboxDomainRepo:
+    """Repositório de outbox em memória, que registra as reivindicações e os resultados."""
+
+    pending: ClassVar[list[OutboxMessage]] = []
+    claimed_types: ClassVar[list[list[str]]] = []
+    delivered: ClassVar[list[str]] = []
+    failed: ClassVar[list[tuple[str, str]]] = []
+
+    async def claim_batch(
+        self,
+        event_types: Sequence[str],
+        batch_size: int,
+        max_attempts: int,
+        claim_timeout_ms: int,
+    ) -> Sequence[OutboxMessage]:
+        """Reivindica as mensagens pendentes dos tipos de evento informados."""
+        self.claimed_types.append(list(event_types))
+        return [
+            message for message in self.pending if message.event_type in event_types
+        ][:batch_size]
+
+    async def finish_batch(
+        self,
+        delivered: Sequence[OutboxMessage],
+        failed: Sequence[tuple[OutboxMessage, Exception]],
+    ) -> None:
+        """Registra as mensagens entregues e as que falharam."""
+        self.delivered.extend(message.aggregate_id for message in delivered)
+        self.failed.extend(
+            (message.aggregate_id, type(error).__name__) for message, error in failed
+        )
+
+
+class TestDomainEvents:
+    """Testes unitários para o registro de eventos de domínio nos agregados."""
+
+    def test_transaction_posted(self) -> None:
+        """Verifica que a criação de uma transação registra o evento TransactionPosted."""
+        tx = Transaction.return_aggregate_for_creation(
+            type=TransactionType.DEPOSIT,
+            amount=Decimal("10.00"),
+            date=datetime(2024, 1, 1, tzinfo=UTC),
+            account_number="123456",
+        )
+
+        assert len(tx.events) == 1
+        assert isinstance(tx.events[0], TransactionPosted)
+        assert tx.events[0].event_type == "TransactionPosted"
+        assert tx.events[0].to_payload() == {
+            "type": "deposit",
+            "amount": "10.00",
+            "date": "2024-01-01 00:00:00+00:00",
+            "account_number": "123456",
+            "destination_account_number": None,
+        }
+
+    def test_account_created(self) -> None:
+        """Verifica que a criação de uma conta registra o evento AccountCreated."""
+        account = Account.return_aggregate_for_creation(
+            account_number="123456", balance=Decimal("0.00"), client_cpf=CPF.generate()
+        )
+
+        assert [type(event) for event in account.events] == [AccountCreated]
+        assert "_events" not in account.to_dict()
+
+    def test_client_updated_and_cleared(self) -> None:
+        """Verifica que a atualização do cliente registra ClientUpdated e que os eventos podem ser descartados."""
+        client = Client.return_aggregate_for_creation(
+            name="João", cpf=CPF(CPF.generate())
+        )
+        assert client.events == []
+
+        cpf = CPF(CPF.generate())
+        client.update(name="Maria", cpf=cpf)
+        assert client.events == [ClientUpdated(name="Maria", cpf=cpf)]
+
+        client.clear_events()
+        assert client.events == []
+
+    def test_outbox_message_from_event(self) -> None:
+        """Verifica a criação da mensagem de outbox a partir do evento e do agregado."""
+        client = Client(name="João", cpf=CPF(CPF.generate()), id=None)
+        client.update(name="Maria", cpf=client.cpf)
+
+        message = OutboxMessage.from_event(client, client.events[0])
+
+        assert message.event_type == "ClientUpdated"
+        assert message.aggregate_type == "Client"
+        assert message.aggregate_id is None
+        assert message.payload["name"] == "Maria"
+
+
+class TestOutboxDispatcher:
+    """Testes unitários para o dispatcher da outbox."""
+
+    @pytest.fixture(autouse=True)
+    def fake_repo(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Substitui o repositório da outbox por um em memória."""
+        FakeOutboxDomainRepo.pending = []
+        FakeOutboxDomainRepo.claimed_types = []
+        FakeOutboxDomainRepo.delivered = []
+        FakeOutboxDomainRepo.failed = []
+        monkeypatch.setattr(outbox_dispatcher, "OutboxDomainRepo", FakeOutboxDomainRepo)
+
+    async def test_messages_without_handler_are_kept(self) -> None:
+        """Verifica que apenas mensagens de tipos com handler registrado são reivindicadas."""
+        FakeOutboxDomainRepo.pending = [
+            _message("TransactionPosted", "1"),
+            _message("AccountCreated", "2"),
+        ]
+        dispatcher = OutboxDispatcher()
+
+        assert await dispatcher.dispatch() == 0
+        assert FakeOutboxDomainRepo.claimed_types == []
+
+        async def on_posted(message: OutboxMessage) -> None:
+            pass
+
+        dispatcher.register("TransactionPosted", on_posted)
+
+        assert await dispatcher.dispatch() == 1
+        assert FakeOutboxDomainRepo.claimed_types == [["TransactionPosted"]]
+        assert FakeOutboxDomainRepo.delivered == ["1"]
+
+    async def test_delivery_failures_are_recorded(self) -> None:
+        """Verifica que falhas transitórias dos handlers são registradas para nova tentativa."""
+        FakeOutboxDomainRepo.pending = [
+            _message("TransactionPosted", "1"),
+            _message("TransactionPosted", "2"),
+        ]
+
+        async def on_posted(message: OutboxMessage) -> None:
+            if message.aggregate_id == "1":
+                raise OutboxDeliveryError("serviço indisponível")
+
+        dispatcher = OutboxDispatcher()
+        dispatcher.register("TransactionPosted", on_posted)
+
+        assert await dispatcher.dispatch() == 2
+        assert FakeOutboxDomainRepo.delivered == ["2"]
+        assert FakeOutboxDomainRepo.failed == [("1", "OutboxDeliveryError")]
+
+    async def test_programming_error_is_raised(self) -> None:
+        """
+        Verifica que um erro de programação de um handler é propagado, após o registro
+        das mensagens já entregues.
+        """
+        FakeOutboxDomainRepo.pending = [
+            _message("TransactionPosted", "1"),
+            _message("TransactionPosted", "2"),
+        ]
+
+        async def on_posted(message: OutboxMessage) -> None:
+            if message.aggregate_id == "2":
+                raise TypeError("erro de programação")
+
+        dispatcher = OutboxDispatcher()
+        dispatcher.register("TransactionPosted", on_posted)
+
+        with pytest.raises(TypeError):
+            await dispatcher.dispatch()
+        assert FakeOutboxDomainRepo.delivered == ["1"]
+        assert FakeOutboxDomainRepo.failed == []
+
+    async def test_deliver_to_registered_handlers(self) -> None:
+        """Verifica que a mensagem é entregue apenas aos handlers do seu tipo de evento."""
+        delivered: list[str] = []
+
+        async def on_posted(message: OutboxMessage) -> None:
+            delivered.append(f"posted:{message.aggregate_id}")
+
+        async def on_created(message: OutboxMessage) -> None:
+            delivered.append(f"created:{message.aggregate_id}")
+
+        dispatcher = OutboxDispatcher()
+        dispatcher.register("TransactionPosted", on_posted)
+        dispatcher.register("AccountCreated", on_created)
+
+        await dispatcher.deliver(
+            OutboxMessage(
+                event_type="TransactionPosted",
+                aggregate_type="Transaction",
+                aggregate_id="1",
+                payload={},
+            )
+        )
+        await dispatcher.deliver(
+            OutboxMessage(
+                event_type="ClientUpdated",
+                aggregate_type="Client",
+                aggregate_id="2",
+                payload={},
+            )
+        )
+
+        assert delivered == ["posted:1"]
+
+
+class RecordingSession:
+    """Sessão assíncrona que registra os comandos executados."""
+
+    def __init__(self) -> None:
+        self.statements: list = []
+
+    async def execute(self, statement, parameters=None) -> None:
+        self.statements.append(statement)
+
+    async def commit(self) -> None: ...
+
+    async def rollback(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class TestOutboxRecording:
+    """Testes unitários para a gravação opcional dos eventos na outbox."""
+
+    async def test_disabled_outbox_records_nothing(self) -> None:
+        """Verifica que, com a outbox desabilitada, nada é gravado e os eventos são descartados."""
+        session = RecordingSession()
+        repo = DomainRepository(session_factory=lambda: lambda: session)
+        repo.record_events = False
+        client = Client(name="João", cpf=CPF(CPF.generate()), id=None)
+        client.update(name="Maria", cpf=client.cpf)
+        async with repo:
+            await repo._publish_events(client)
+            await repo.commit()
+
+        assert session.statements == []
+        assert client.events == []
@@ -0,0 +1,114 @@
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+from business_contexts.domain.entities.bank_transaction import TransactionEntity
+from business_contexts.domain.value_objects.bank_transaction import TransactionType
+from business_contexts.services.viewers.bank_transaction import (
+    encode_transactions,
+    stream_until_disconnected,
+)
+from business_contexts.utils.base_types import ExportFormat
+from libs.metrics import METRICS
+
+
+def _transaction(amount: str, destination: str | None = None) -> TransactionEntity:
+    """Cria uma transação consultada para os testes."""
+    return TransactionEntity(
+        id=uuid4(),
+        type=TransactionType.TRANSFER if destination else TransactionType.DEPOSIT,
+        amount=Decimal(amount),
+        date=datetime(2026, 1, 1, 10, tzinfo=UTC),
+        account_number="123456",
+        destination_account_number=destination,
+        balance_after=Decimal(amount),
+    )
+
+
+async def _partitions(
+    *partitions: Sequence[TransactionEntity],
+) -> AsyncIterator[Sequence[TransactionEntity]]:
+    """Entrega os lotes de transações informados."""
+    for partition in partitions:
+        yield partition
+
+
+class FakeRequest:
+    """Requisição cujo cliente desconecta após a quantidade informada de verificações."""
+
+    def __init__(self, connected_checks: int) -> None:
+        self.connected_checks = connected_checks
+
+    async def is_disconnected(self) -> bool:
+        self.connected_checks -= 1
+        return self.connected_checks < 0
+
+
+class TestExportEncoding:
+    """Testes unitários para a codificação da exportação de transações."""
+
+    async def test_ndjson_has_one_object_per_line(self) -> None:
+        """Verifica que cada transação é exportada como um objeto JSON por linha."""
+        chunks = [
+            chunk
+            async for chunk in encode_transactions(
+                _partitions([_transaction("10.00")], [_transaction("5.00", "654321")]),
+                ExportFormat.NDJSON,
+            )
+        ]
+
+        assert len(chunks) == 2
+        lines = b"".join(chunks).decode().splitlines()
+        assert [json.loads(line)["amount"] for line in lines] == ["10.00", "5.00"]
+        assert json.loads(lines[0])["destination_account_number"] is None
+        assert json.loads(lines[1])["type"] == "transfer"
+
+    async def test_csv_sends_header_before_the_rows(self) -> None:
+        """Verifica que o CSV começa pelo cabeçalho, entregue antes do primeiro lote."""
+        chunks = encode_transactions(
+            _partitions([_transaction("10.00")]), ExportFormat.CSV
+        )
+
+        header = await anext(chunks)
+        rows = [chunk async for chunk in chunks]
+
+        assert header.decode().startswith("id,type,amount,date,account_number")
+        assert b"".join(rows).decode().split(",")[1:3] == ["deposit", "10.00"]
+
+
+class TestStreamUntilDisconnected:
+    """Testes unitários para a interrupção da exportação quando o cliente desconecta."""
+
+    def setup_method(self) -> None:
+        """Zera as métricas antes de cada teste."""
+        METRICS.reset()
+
+    async def test_stops_and_closes_source_on_disconnect(self) -> None:
+        """Verifica que a exportação para e fecha a origem quando o cliente desconecta."""
+        source = _partitions([_transaction("1.00")], [_transaction("2.00")])
+
+        partitions = [
+            partition
+            async for partition in stream_until_disconnected(
+                FakeRequest(connected_checks=1), source
+            )
+        ]
+
+        assert len(partitions) == 1
+        assert source.ag_frame is None
+        assert METRICS.get_counter("transaction_exports_interrupted") == 1
+
+    async def test_complete_export_is_not_interrupted(self) -> None:
+        """Verifica que a exportação completa não é contabilizada como interrompida."""
+        partitions = [
+            partition
+            async for partition in stream_until_disconnected(
+                FakeRequest(connected_checks=2),
+                _partitions([_transaction("1.00")], [_transaction("2.00")]),
+            )
+        ]
+
+        assert len(partitions) == 2
+        assert METRICS.get_counter("transaction_exports_interrupted") == 0
@@ -0,0 +1,147 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+
+from business_contexts.domain.aggregates.bank_transaction import Transaction
+from business_contexts.domain.business_rules.bank_transaction import get_local_time
+from business_contexts.domain.entities.bank_transaction import CreateBankTransaction
+from business_contexts.domain.exceptions import InsufficientBalanceForTransaction
+from business_contexts.domain.value_objects.bank_transaction import TransactionType
+from business_contexts.services.tasks.group_commit import GroupCommitWriter
+from libs.metrics import METRICS
+
+
+def _deposit(amount: str) -> CreateBankTransaction:
+    """Cria uma requisição de depósito para os testes."""
+    return CreateBankTransaction(
+        type=TransactionType.DEPOSIT, amount=Decimal(amount), account_number="123456"
+    )
+
+
+class TestGroupCommitWriter:
+    """Testes unitários para o escritor de group commit."""
+
+    def setup_method(self) -> None:
+        """Zera as métricas antes de cada teste."""
+        METRICS.reset()
+
+    async def test_concurrent_requests_share_a_batch(self) -> None:
+        """Verifica que requisições concorrentes são lançadas no mesmo lote."""
+        batches: list[int] = []
+
+        async def post_batch(
+            bank_transactions: list[CreateBankTransaction],
+        ) -> list[Transaction | HTTPException]:
+            batches.append(len(bank_transactions))
+            return [
+                InsufficientBalanceForTransaction()
+                if bank_transaction.amount > Decimal("100.00")
+                else Transaction.return_aggregate_for_creation(
+                    type=bank_transaction.type,
+                    amount=bank_transaction.amount,
+                    date=get_local_time(),
+                    account_number=bank_transaction.account_number,
+                )
+                for bank_transaction in bank_transactions
+            ]
+
+        writer = GroupCommitWriter(
+            post_batch=post_batch, flush_interval_ms=20, max_batch_size=10
+        )
+        results = await asyncio.gather(
+            writer.submit(_deposit("10.00")),
+            writer.submit(_deposit("500.00")),
+            writer.submit(_deposit("20.00")),
+            return_exceptions=True,
+        )
+        await writer.stop()
+
+        assert batches == [3]
+        assert results[0].amount == Decimal("10.00")
+        assert isinstance(results[1], InsufficientBalanceForTransaction)
+        assert results[2].amount == Decimal("20.00")
+        assert METRICS.snapshot()["gauges"]["group_commit_batch_size"]["total"] == 3
+
+    async def test_batch_is_flushed_when_full(self) -> None:
+        """Verifica que o lote é enviado ao atingir o tamanho máximo."""
+        batches: list[int] = []
+
+        async def post_batch(
+            bank_transactions: list[CreateBankTransaction],
+        ) -> list[Transaction | HTTPException]:
+            batches.append(len(bank_transactions))
+            return [InsufficientBalanceForTransaction() for _ in bank_transactions]
+
+        writer = GroupCommitWriter(
+            post_batch=post_batch, flush_interval_ms=1000, max_batch_size=2
+        )
+        await asyncio.gather(
+            *(writer.submit(_deposit("10.00")) for _ in range(4)),
+            return_exceptions=True,
+        )
+        await writer.stop()
+
+        assert batches == [2, 2]
+
+    async def test_batch_failure_is_propagated(self) -> None:
+        """Verifica que uma falha no lançamento do lote é entregue a todas as requisições."""
+        batches: list[int] = []
+
+        async def post_batch(
+            bank_transactions: list[CreateBankTransaction],
+        ) -> list[Transaction | HTTPException]:
+            batches.append(len(bank_transactions))
+            raise ConnectionRefusedError("banco indisponível")
+
+        writer = GroupCommitWriter(post_batch=post_batch, flush_interval_ms=1)
+
+        for _ in range(2):
+            with pytest.raises(ConnectionRefusedError):
+                await writer.submit(_deposit("10.00"))
+        await writer.stop()
+
+        assert batches == [1, 1]
+
+    async def test_programming_error_fails_only_its_batch(self) -> None:
+        """
+        Verifica que um erro de programação é entregue apenas às requisições do lote,
+        e que as enfileiradas atrás dele são lançadas sem encerrar a tarefa.
+        """
+        errors = iter([TypeError("erro de programação")])
+
+        async def post_batch(
+            bank_transactions: list[CreateBankTransaction],
+        ) -> list[Transaction | HTTPException]:
+            error = next(errors, None)
+            if error:
+                raise error
+            return [
+                Transaction.return_aggregate_for_creation(
+                    type=bank_transaction.type,
+                    amount=bank_transaction.amount,
+                    date=get_local_time(),
+                    account_number=bank_transaction.account_number,
+                )
+                for bank_transaction in bank_transactions
+            ]
+
+        writer = GroupCommitWriter(
+            post_batch=post_batch, flush_interval_ms=1, max_batch_size=1
+        )
+
+        results = await asyncio.gather(
+            writer.submit(_deposit("10.00")),
+            writer.submit(_deposit("20.00")),
+            writer.submit(_deposit("30.00")),
+            return_exceptions=True,
+        )
+        assert not writer._worker.done()
+        await asyncio.wait_for(writer.stop(), timeout=1)
+
+        assert isinstance(results[0], TypeError)
+        assert [result.amount for result in results[1:]] == [
+            Decimal("20.00"),
+            Decimal("30.00"),
+        ]
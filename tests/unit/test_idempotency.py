@@ -0,0 +1,183 @@
+import asyncio
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import ClassVar
+from uuid import UUID, uuid4
+
+import pytest
+
+from business_contexts.domain.entities.bank_transaction import CreateBankTransaction
+from business_contexts.domain.exceptions import (
+    IdempotencyKeyReused,
+    IdempotentRequestAlreadyProcessed,
+)
+from business_contexts.domain.value_objects.bank_transaction import TransactionType
+from business_contexts.domain.value_objects.idempotency import IdempotencyRecord
+from business_contexts.services.executors import idempotency
+from business_contexts.services.executors.idempotency import (
+    IDEMPOTENCY_CACHE,
+    run_idempotently,
+)
+from libs.ddd.adapters.cache import LRUCache
+
+USER_ID: UUID = uuid4()
+
+
+def _deposit(amount: str) -> CreateBankTransaction:
+    """Cria uma requisição de depósito para os testes."""
+    return CreateBankTransaction(
+        type=TransactionType.DEPOSIT, amount=Decimal(amount), account_number="123456"
+    )
+
+
+class FakeIdempotencyRecordQueryRepo:
+    """Repositório de consulta em memória, no lugar do banco de dados."""
+
+    records: ClassVar[dict[tuple[UUID, str], IdempotencyRecord]] = {}
+
+    async def query_one_by_filters(self, filters: dict) -> IdempotencyRecord | None:
+        return self.records.get((filters["user_id"], filters["key"]))
+
+
+class TestLRUCache:
+    """Testes unitários para o cache LRU em memória."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Verifica que o item menos usado é descartado ao exceder o tamanho máximo."""
+        cache: LRUCache[str, int] = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_expires_items(self) -> None:
+        """Verifica que itens com o tempo de vida esgotado não são retornados."""
+        cache: LRUCache[str, int] = LRUCache(max_size=2, ttl_seconds=-1)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestRunIdempotently:
+    """Testes unitários para a execução idempotente de operações."""
+
+    @pytest.fixture(autouse=True)
+    def fake_repo(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Substitui o repositório de consulta e limpa o cache antes de cada teste."""
+        FakeIdempotencyRecordQueryRepo.records = {}
+        IDEMPOTENCY_CACHE.clear()
+        monkeypatch.setattr(
+            idempotency, "IdempotencyRecordQueryRepo", FakeIdempotencyRecordQueryRepo
+        )
+
+    async def test_concurrent_duplicates_wait_for_in_flight_request(self) -> None:
+        """Verifica que requisições duplicadas concorrentes executam a operação uma única vez."""
+        executions: list[str] = []
+
+        async def execute(request_hash: str) -> IdempotencyRecord:
+            executions.append(request_hash)
+            await asyncio.sleep(0.01)
+            return IdempotencyRecord(
+                user_id=USER_ID,
+                key="key-1",
+                request_hash=request_hash,
+                response='{"ok": true}',
+                created_at=datetime.now(UTC),
+            )
+
+        responses = await asyncio.gather(
+            *(
+                run_idempotently(
+                    user_id=USER_ID,
+                    key="key-1",
+                    request=_deposit("10"),
+                    execute=execute,
+                )
+                for _ in range(5)
+            )
+        )
+
+        assert len(executions) == 1
+        assert responses == ['{"ok": true}'] * 5
+        assert not idempotency.IN_FLIGHT_REQUESTS
+
+    async def test_reused_key_with_different_request(self) -> None:
+        """Verifica que a chave não pode ser reutilizada com outro corpo de requisição."""
+
+        async def execute(request_hash: str) -> IdempotencyRecord:
+            return IdempotencyRecord(
+                user_id=USER_ID,
+                key="key-2",
+                request_hash=request_hash,
+                response="{}",
+                created_at=datetime.now(UTC),
+            )
+
+        await run_idempotently(
+            user_id=USER_ID, key="key-2", request=_deposit("10"), execute=execute
+        )
+
+        with pytest.raises(IdempotencyKeyReused):
+            await run_idempotently(
+                user_id=USER_ID, key="key-2", request=_deposit("20"), execute=execute
+            )
+
+    async def test_replays_record_committed_by_another_process(self) -> None:
+        """Verifica que a resposta gravada por outro processo é reaproveitada no conflito."""
+        request = _deposit("10")
+
+        async def execute(request_hash: str) -> IdempotencyRecord:
+            FakeIdempotencyRecordQueryRepo.records[(USER_ID, "key-3")] = (
+                IdempotencyRecord(
+                    user_id=USER_ID,
+                    key="key-3",
+                    request_hash=request_hash,
+                    response='{"id": "original"}',
+                    created_at=datetime.now(UTC),
+                )
+            )
+            raise IdempotentRequestAlreadyProcessed
+
+        response = await run_idempotently(
+            user_id=USER_ID, key="key-3", request=request, execute=execute
+        )
+
+        assert response == '{"id": "original"}'
+
+    async def test_same_key_is_independent_per_user(self) -> None:
+        """Verifica que a mesma chave de outro usuário não reaproveita a resposta armazenada."""
+
+        def execute_for(user_id: UUID):
+            async def execute(request_hash: str) -> IdempotencyRecord:
+                return IdempotencyRecord(
+                    user_id=user_id,
+                    key="key-4",
+                    request_hash=request_hash,
+                    response=f'{{"user": "{user_id}"}}',
+                    created_at=datetime.now(UTC),
+                )
+
+            return execute
+
+        other_user_id = uuid4()
+        first = await run_idempotently(
+            user_id=USER_ID,
+            key="key-4",
+            request=_deposit("10"),
+            execute=execute_for(USER_ID),
+        )
+        second = await run_idempotently(
+            user_id=other_user_id,
+            key="key-4",
+            request=_deposit("10"),
+            execute=execute_for(other_user_id),
+        )
+
+        assert first == f'{{"user": "{USER_ID}"}}'
+        assert second == f'{{"user": "{other_user_id}"}}'
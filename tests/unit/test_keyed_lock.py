@@ -0,0 +1,109 @@
+import asyncio
+
+from libs.ddd.adapters.keyed_lock import KeyedLock
+from libs.metrics import METRICS
+
+
+class TestKeyedLock:
+    """Testes unitários para os bloqueios em memória por chave."""
+
+    async def test_same_key_is_serialized(self) -> None:
+        """Verifica que tarefas com a mesma chave executam uma de cada vez, em ordem."""
+        locks: KeyedLock[str] = KeyedLock()
+        events: list[str] = []
+
+        async def write(name: str) -> None:
+            async with locks.hold("123456"):
+                events.append(f"{name}:start")
+                await asyncio.sleep(0.01)
+                events.append(f"{name}:end")
+
+        await asyncio.gather(write("a"), write("b"))
+
+        assert events == ["a:start", "a:end", "b:start", "b:end"]
+
+    async def test_different_keys_run_concurrently(self) -> None:
+        """Verifica que chaves diferentes não aguardam umas às outras."""
+        locks: KeyedLock[str] = KeyedLock()
+        both_holding = asyncio.Event()
+        holding: list[str] = []
+
+        async def write(key: str) -> None:
+            async with locks.hold(key):
+                holding.append(key)
+                if len(holding) == 2:
+                    both_holding.set()
+                await asyncio.wait_for(both_holding.wait(), timeout=1)
+
+        await asyncio.gather(write("111111"), write("222222"))
+
+        assert sorted(holding) == ["111111", "222222"]
+
+    async def test_opposite_transfers_do_not_deadlock(self) -> None:
+        """Verifica que chaves adquiridas em ordens opostas não entram em deadlock."""
+        locks: KeyedLock[str] = KeyedLock()
+
+        async def transfer(origin: str, destination: str) -> None:
+            async with locks.hold(origin, destination):
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(
+            asyncio.gather(transfer("111111", "222222"), transfer("222222", "111111")),
+            timeout=1,
+        )
+
+    async def test_idle_keys_are_evicted(self) -> None:
+        """Verifica que as chaves são descartadas quando ninguém as detém ou aguarda."""
+        locks: KeyedLock[str] = KeyedLock()
+        release = asyncio.Event()
+
+        async def write() -> None:
+            async with locks.hold("111111", "222222"):
+                await release.wait()
+
+        tasks = [asyncio.create_task(write()) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert len(locks) == 2
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert len(locks) == 0
+
+    async def test_cancelled_waiter_releases_its_key(self) -> None:
+        """Verifica que uma tarefa cancelada na fila não deixa a chave retida."""
+        locks: KeyedLock[str] = KeyedLock()
+        release = asyncio.Event()
+
+        async def write() -> None:
+            async with locks.hold("123456"):
+                await release.wait()
+
+        holder = asyncio.create_task(write())
+        waiter = asyncio.create_task(write())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        await holder
+        await asyncio.gather(waiter, return_exceptions=True)
+
+        assert len(locks) == 0
+
+
+class TestMetricsSummaries:
+    """Testes unitários para os resumos de durações das métricas."""
+
+    def setup_method(self) -> None:
+        """Zera as métricas antes de cada teste."""
+        METRICS.reset()
+
+    def test_observe_accumulates_count_sum_and_max(self) -> None:
+        """Verifica que as observações acumulam quantidade, soma e maior valor."""
+        METRICS.observe("account_write_queue_wait_ms", 2.0, label="total")
+        METRICS.observe("account_write_queue_wait_ms", 5.0, label="total")
+
+        assert METRICS.get_summary("account_write_queue_wait_ms", label="total") == {
+            "count": 2,
+            "sum": 7.0,
+            "max": 5.0,
+        }
+        assert "account_write_queue_wait_ms" in METRICS.snapshot()["summaries"]
@@ -0,0 +1,120 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Column, DateTime, MetaData, Table, Uuid, select
+
+from business_contexts.domain.exceptions import InvalidPaginationCursor
+from business_contexts.repository.query_repo.pagination import paginate, to_page
+from libs.ddd.adapters.viewers import (
+    Pagination,
+    compute_etag,
+    decode_cursor,
+    encode_cursor,
+    etag_matches,
+)
+
+# Tabela com chaves de ordenação nos formatos da paginação das transações
+transaction_table: Table = Table(
+    "transaction",
+    MetaData(),
+    Column("id", Uuid, primary_key=True),
+    Column("date", DateTime(timezone=True)),
+)
+
+
+class TestCursor:
+    """Testes unitários para a codificação dos cursores de paginação."""
+
+    def test_encode_and_decode(self) -> None:
+        """Verifica que o cursor decodificado traz as chaves codificadas, como texto."""
+        id = uuid4()
+
+        cursor = encode_cursor("2026-01-01 10:00:00+00:00", id)
+
+        assert decode_cursor(cursor) == ("2026-01-01 10:00:00+00:00", str(id))
+
+    @pytest.mark.parametrize("cursor", ["invalido", "e30", "WzFd"])
+    def test_decode_invalid_cursor(self, cursor: str) -> None:
+        """Verifica que cursores que não são listas de textos em base64 são rejeitados."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+class TestEtag:
+    """Testes unitários para as ETags das requisições condicionais."""
+
+    def test_same_state_same_etag(self) -> None:
+        """Verifica que a ETag é forte, determinística e muda com o estado."""
+        etag = compute_etag("accounts", 1, 10)
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert compute_etag("accounts", 1, 10) == etag
+        assert compute_etag("accounts", 1, 11) != etag
+
+    @pytest.mark.parametrize(
+        "if_none_match, matches",
+        [
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ('"x", "abc"', True),
+            ("*", True),
+            ('"x"', False),
+            ("", False),
+            (None, False),
+        ],
+    )
+    def test_if_none_match(self, if_none_match: str | None, matches: bool) -> None:
+        """Verifica a comparação do If-None-Match, com listas, "*" e ETags fracas."""
+        assert etag_matches(if_none_match, '"abc"') is matches
+
+
+class TestToPage:
+    """Testes unitários para a montagem das páginas das consultas paginadas."""
+
+    def test_last_page_has_no_next_cursor(self) -> None:
+        """Verifica que a página sem itens além do limite não tem próxima página."""
+        page = to_page([1, 2], Pagination(limit=2), lambda item: (item,))
+
+        assert page.items == [1, 2]
+        assert page.next_cursor is None
+
+    def test_extra_item_is_dropped_and_gives_next_cursor(self) -> None:
+        """Verifica que o item além do limite é descartado e o cursor aponta o último item."""
+        page = to_page([1, 2, 3], Pagination(limit=2), lambda item: (item,))
+
+        assert page.items == [1, 2]
+        assert decode_cursor(page.next_cursor) == ("2",)
+
+
+class TestPaginate:
+    """Testes unitários para a aplicação da paginação por cursor às consultas."""
+
+    def test_cursor_keys_are_parsed_to_column_types(self) -> None:
+        """Verifica que as chaves do cursor são comparadas com os tipos das colunas."""
+        date, id = datetime(2026, 1, 1, 10, tzinfo=UTC), uuid4()
+        table = transaction_table
+
+        query = paginate(
+            select(table),
+            Pagination(limit=10, after=encode_cursor(date, id)),
+            table.c.date,
+            table.c.id,
+        )
+
+        assert query.compile().params == {"param_1": date, "param_2": id, "param_3": 11}
+
+    @pytest.mark.parametrize(
+        "after", ["invalido", encode_cursor(uuid4()), encode_cursor("ontem", uuid4())]
+    )
+    def test_invalid_cursor_is_rejected(self, after: str) -> None:
+        """Verifica que cursores inválidos para as chaves da consulta são rejeitados com 400."""
+        table = transaction_table
+
+        with pytest.raises(InvalidPaginationCursor):
+            paginate(
+                select(table),
+                Pagination(limit=10, after=after),
+                table.c.date,
+                table.c.id,
+            )
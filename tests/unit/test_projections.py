@@ -0,0 +1,102 @@
+from datetime import UTC, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+from business_contexts.domain.entities.bank_transaction import TransactionEntity
+from business_contexts.domain.value_objects.bank_transaction import TransactionType
+from business_contexts.repository.query_repo.projections import (
+    to_account_entity,
+    to_client_entity,
+    to_transaction_entity,
+    to_user_entity,
+)
+
+
+def _row(**values: Any) -> SimpleNamespace:
+    """Cria uma linha projetada, com os valores acessíveis pelo nome das colunas."""
+    return SimpleNamespace(_mapping=values)
+
+
+class TestProjections:
+    """Testes unitários para a montagem das entidades a partir das linhas projetadas."""
+
+    def test_transaction_entity(self) -> None:
+        """
+        Verifica que a transação é montada pelos nomes das colunas, com o tipo
+        convertido e desconsiderando colunas adicionais da consulta.
+        """
+        id = uuid4()
+        date = datetime(2026, 1, 1, tzinfo=UTC)
+
+        transaction = to_transaction_entity(
+            _row(
+                sequence=3,
+                id=id,
+                type="transfer",
+                amount=Decimal(10),
+                date=date,
+                account_number="123456",
+                destination_account_number="654321",
+                balance_after=Decimal(90),
+                destination_balance_after=None,
+                listed_account_number="654321",
+            )
+        )
+
+        assert transaction == TransactionEntity(
+            type=TransactionType.TRANSFER,
+            amount=Decimal(10),
+            date=date,
+            account_number="123456",
+            id=id,
+            destination_account_number="654321",
+            balance_after=Decimal(90),
+            destination_balance_after=None,
+        )
+
+    def test_account_entity_sums_balances(self) -> None:
+        """Verifica que o saldo da conta é a soma das parcelas projetadas."""
+        id = uuid4()
+
+        account = to_account_entity(
+            _row(
+                id=id,
+                account_number="123456",
+                client_cpf="12345678909",
+                balance_slots=4,
+                version=2,
+                last_sequence=7,
+                balance=Decimal(1),
+                slots_balance=Decimal(2),
+                ledger_balance=0,
+            )
+        )
+
+        assert account.id == id
+        assert account.balance == Decimal(3)
+        assert account.balance_slots == 4
+        assert (account.version, account.last_sequence) == (2, 7)
+        assert account.transactions is None
+
+    def test_client_entity(self) -> None:
+        """Verifica que o cliente é montado pelos nomes das colunas."""
+        id = uuid4()
+
+        client = to_client_entity(_row(id=id, name="Cliente", cpf="12345678909"))
+
+        assert (client.id, client.name, client.cpf) == (id, "Cliente", "12345678909")
+
+    def test_user_entity_with_and_without_password(self) -> None:
+        """Verifica que o usuário projetado sem a senha tem o hash vazio."""
+        values = {
+            "id": uuid4(),
+            "name": "Usuário",
+            "email": "usuario@email.com",
+            "is_admin": False,
+            "is_active": True,
+        }
+
+        assert to_user_entity(_row(**values, password="hash"))._password == "hash"
+        assert to_user_entity(_row(**values))._password == ""
@@ -0,0 +1,261 @@
+from collections.abc import Callable
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.exc import DBAPIError
+
+from business_contexts.utils.base_types import IsolationLevel
+from libs.ddd.adapters.replica import (
+    READ_CONSISTENCY,
+    ReadConsistency,
+    ReplicaLsnTracker,
+    format_lsn,
+    parse_lsn,
+)
+from libs.ddd.adapters.repository import (
+    DomainRepository,
+    QueryRepository,
+    is_retryable_error,
+    retry_on_serialization_failure,
+)
+from libs.metrics import CURRENT_ENDPOINT, METRICS
+
+
+class FakeDriverError(Exception):
+    """Erro de driver com SQLSTATE, no formato exposto pelo asyncpg."""
+
+    def __init__(self, sqlstate: str) -> None:
+        super().__init__(sqlstate)
+        self.sqlstate = sqlstate
+
+
+def _db_error(sqlstate: str) -> DBAPIError:
+    """Cria um DBAPIError do SQLAlchemy com o SQLSTATE informado."""
+    return DBAPIError("UPDATE bank_account", {}, FakeDriverError(sqlstate))
+
+
+class TestRetryOnSerializationFailure:
+    """Testes unitários para a reexecução de operações em falhas de serialização."""
+
+    def setup_method(self) -> None:
+        """Zera as métricas antes de cada teste."""
+        METRICS.reset()
+
+    def test_is_retryable_error(self) -> None:
+        """Verifica que apenas 40001 e 40P01 são considerados reexecutáveis."""
+        assert is_retryable_error(_db_error("40001"))
+        assert is_retryable_error(_db_error("40P01"))
+        assert not is_retryable_error(_db_error("23505"))
+        assert not is_retryable_error(ValueError())
+
+    async def test_retries_until_success(self) -> None:
+        """Verifica que a operação é reexecutada e as tentativas são contabilizadas."""
+        calls: list[int] = []
+
+        @retry_on_serialization_failure
+        async def operation() -> str:
+            calls.append(1)
+            if len(calls) < 3:
+                raise _db_error("40P01")
+            return "ok"
+
+        token = CURRENT_ENDPOINT.set("POST /api/transacao_bancaria")
+        try:
+            with patch("libs.ddd.adapters.repository.asyncio.sleep"):
+                assert await operation() == "ok"
+        finally:
+            CURRENT_ENDPOINT.reset(token)
+
+        assert len(calls) == 3
+        assert (
+            METRICS.get_counter(
+                "serialization_retries", label="POST /api/transacao_bancaria"
+            )
+            == 2
+        )
+
+    async def test_gives_up_after_max_retries(self) -> None:
+        """Verifica que o erro é propagado após o limite de tentativas."""
+
+        @retry_on_serialization_failure
+        async def operation() -> None:
+            raise _db_error("40001")
+
+        with (
+            patch("libs.ddd.adapters.repository.asyncio.sleep"),
+            pytest.raises(DBAPIError),
+        ):
+            await operation()
+
+        assert METRICS.get_counter("serialization_retries") == 3
+
+    async def test_does_not_retry_other_errors(self) -> None:
+        """Verifica que erros não relacionados a concorrência não são reexecutados."""
+        calls: list[int] = []
+
+        @retry_on_serialization_failure
+        async def operation() -> None:
+            calls.append(1)
+            raise _db_error("23505")
+
+        with pytest.raises(DBAPIError):
+            await operation()
+
+        assert len(calls) == 1
+        assert METRICS.get_counter("serialization_retries") == 0
+
+
+class FakeSession:
+    """Sessão assíncrona que registra as opções de execução da conexão."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.execution_options: list[dict] = []
+        self.error = error
+
+    async def connection(self, execution_options: dict | None = None) -> None:
+        if self.error:
+            raise self.error
+        self.execution_options.append(execution_options or {})
+
+    async def rollback(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class TestIsolationLevels:
+    """Testes unitários para a escolha do nível de isolamento das sessões."""
+
+    def setup_method(self) -> None:
+        """Cria a sessão registrada pelos repositórios."""
+        self.session = FakeSession()
+
+    def _session_factory(self) -> Callable[[], FakeSession]:
+        return lambda: self.session
+
+    async def test_query_sessions_are_read_committed_and_read_only(self) -> None:
+        """Verifica que as consultas usam READ COMMITTED somente leitura por padrão."""
+        async with QueryRepository(session_factory=self._session_factory):
+            pass
+
+        assert self.session.execution_options == [
+            {"isolation_level": "READ COMMITTED", "postgresql_readonly": True}
+        ]
+
+    async def test_serializable_query_sessions_are_deferrable(self) -> None:
+        """Verifica que consultas SERIALIZABLE somente leitura podem ser DEFERRABLE."""
+        repo = QueryRepository(session_factory=self._session_factory)
+        repo.isolation_level = IsolationLevel.SERIALIZABLE
+        repo.deferrable = True
+        async with repo:
+            pass
+
+        assert self.session.execution_options == [
+            {
+                "isolation_level": "SERIALIZABLE",
+                "postgresql_readonly": True,
+                "postgresql_deferrable": True,
+            }
+        ]
+
+    async def test_domain_operation_sets_its_isolation_level(self) -> None:
+        """Verifica que a operação de escrita define o nível da própria transação."""
+        repo = DomainRepository(session_factory=self._session_factory)
+        async with repo:
+            await repo._set_isolation_level(repo.locking_isolation_level)
+
+        assert self.session.execution_options == [{"isolation_level": "READ COMMITTED"}]
+
+
+class TestReplicaRouting:
+    """Testes unitários para o roteamento das consultas entre primário e réplica."""
+
+    def setup_method(self) -> None:
+        """Cria as sessões do primário e da réplica e zera as métricas."""
+        self.primary = FakeSession()
+        self.replica = FakeSession()
+        METRICS.reset()
+
+    def _repo(self, **kwargs) -> QueryRepository:
+        return QueryRepository(
+            session_factory=lambda: lambda: self.primary,
+            replica_session_factory=lambda: lambda: self.replica,
+            **kwargs,
+        )
+
+    async def _session_for(self, consistency: ReadConsistency, **kwargs) -> FakeSession:
+        token = READ_CONSISTENCY.set(consistency)
+        try:
+            async with self._repo(**kwargs) as repo:
+                return repo.session
+        finally:
+            READ_CONSISTENCY.reset(token)
+
+    async def test_reads_go_to_replica(self) -> None:
+        """Verifica que, sem requisitos de consistência, as consultas usam a réplica."""
+        assert await self._session_for(ReadConsistency()) is self.replica
+        assert METRICS.get_counter("replica_reads") == 1
+
+    async def test_writes_and_primary_repositories_read_from_primary(self) -> None:
+        """Verifica que requisições de escrita e use_replica=False usam o primário."""
+        assert (
+            await self._session_for(ReadConsistency(primary_only=True)) is self.primary
+        )
+        assert (
+            await self._session_for(ReadConsistency(), use_replica=False)
+            is self.primary
+        )
+
+    async def test_without_replica_reads_go_to_primary(self) -> None:
+        """Verifica que, sem réplica configurada, as consultas usam o primário."""
+        repo = QueryRepository(
+            session_factory=lambda: lambda: self.primary,
+            replica_session_factory=lambda: None,
+        )
+        async with repo:
+            assert repo.session is self.primary
+
+    async def test_consistency_token_waits_for_replay(self) -> None:
+        """Verifica que o token não reproduzido pela réplica leva ao primário."""
+        replay_lsns = iter([10, 20])
+
+        async def fetch_replay_lsn() -> int:
+            return next(replay_lsns)
+
+        tracker = ReplicaLsnTracker(fetch_replay_lsn, refresh_interval_ms=0)
+        with patch("libs.ddd.adapters.repository.REPLICA_LSN_TRACKER", tracker):
+            consistency = ReadConsistency(min_lsn=15)
+            assert await self._session_for(consistency) is self.primary
+            assert await self._session_for(consistency) is self.replica
+
+    async def test_unavailable_replica_falls_back_to_primary(self) -> None:
+        """Verifica que, com a réplica indisponível, a consulta usa o primário."""
+        self.replica = FakeSession(error=ConnectionRefusedError())
+
+        assert await self._session_for(ReadConsistency()) is self.primary
+        assert METRICS.get_counter("replica_fallbacks", label="total") == 1
+
+
+class TestReplicaLsnTracker:
+    """Testes unitários para o acompanhamento da posição reproduzida pela réplica."""
+
+    def test_lsn_text_format(self) -> None:
+        """Verifica a conversão entre o formato textual do LSN e o inteiro."""
+        assert parse_lsn("16/B374D848") == (0x16 << 32) | 0xB374D848
+        assert format_lsn(parse_lsn("16/B374D848")) == "16/B374D848"
+        with pytest.raises(ValueError):
+            parse_lsn("B374D848")
+
+    async def test_refreshes_at_most_once_per_interval(self) -> None:
+        """Verifica que a réplica é consultada apenas quando a posição não basta."""
+        fetches: list[int] = []
+
+        async def fetch_replay_lsn() -> int:
+            fetches.append(1)
+            return 10
+
+        tracker = ReplicaLsnTracker(fetch_replay_lsn, refresh_interval_ms=60_000)
+
+        assert await tracker.has_replayed(5)
+        assert await tracker.has_replayed(10)
+        assert not await tracker.has_replayed(11)
+        assert len(fetches) == 1
@@ -1,3 +1,11 @@
+from datetime import date
+from decimal import Decimal
+
+from business_contexts.domain.business_rules.bank_transaction import (
+    build_daily_rollups,
+    take_contiguous_transactions,
+)
+from business_contexts.domain.value_objects.bank_account import DailyRollup
 from business_contexts.domain.value_objects.bank_transaction import TransactionType
 from libs.ddd.adapters.viewers import Filters
 
@@ -38,3 +46,52 @@ class TestFilters:
         """Verifica a representação em string dos filtros."""
         filters = Filters({"name": "Test"})
         assert str(filters) == "{'name': 'Test'}"
+
+
+class TestDailyRollups:
+    """Testes unitários para a agregação dos totais diários das contas."""
+
+    def test_build_daily_rollups(self) -> None:
+        """Depósitos creditam a origem; saques e transferências a debitam, e transferências creditam o destino."""
+        day = date(2026, 1, 1)
+        rollups = build_daily_rollups(
+            [
+                ("200", None, "deposit", Decimal("50.00"), day),
+                ("200", None, "deposit", Decimal("10.00"), day),
+                ("200", None, "withdrawal", Decimal("20.00"), day),
+                ("200", "100", "transfer", Decimal("30.00"), day),
+                ("100", None, "deposit", Decimal("5.00"), date(2026, 1, 2)),
+            ]
+        )
+
+        assert rollups == [
+            DailyRollup("100", day, "transfer", 1, Decimal("30.00"), Decimal(0)),
+            DailyRollup(
+                "100", date(2026, 1, 2), "deposit", 1, Decimal("5.00"), Decimal(0)
+            ),
+            DailyRollup("200", day, "deposit", 2, Decimal("60.00"), Decimal(0)),
+            DailyRollup("200", day, "transfer", 1, Decimal(0), Decimal("30.00")),
+            DailyRollup("200", day, "withdrawal", 1, Decimal(0), Decimal("20.00")),
+        ]
+        assert rollups[2].net == Decimal("60.00")
+        assert rollups[3].net == Decimal("-30.00")
+
+    def test_build_daily_rollups_empty(self) -> None:
+        """Sem transações, não há totais."""
+        assert build_daily_rollups([]) == []
+
+    def test_take_contiguous_transactions_stops_at_gap(self) -> None:
+        """A projeção avança apenas até a primeira lacuna na ordem de lançamento."""
+        transactions = [(11,), (12,), (14,), (15,)]
+
+        assert take_contiguous_transactions(transactions, 10) == [(11,), (12,)]
+        assert take_contiguous_transactions(transactions[2:], 12) == []
+        assert take_contiguous_transactions([], 12) == []
+
+    def test_take_contiguous_transactions_skips_leading_gap(self) -> None:
+        """Uma lacuna expirada logo após a marca d'água é ignorada, mas não as seguintes."""
+        transactions = [(14,), (15,), (17,)]
+
+        assert take_contiguous_transactions(
+            transactions, 12, skip_leading_gap=True
+        ) == [(14,), (15,)]